@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import os
+from datetime import datetime
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.orm import Session
+from . import coordination
+from .database import SITES, site_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "alert_engine"
+# Seconds between evaluations; 0 turns the in-process engine off
+INTERVAL_SECONDS = float(os.getenv("WMS_ALERT_INTERVAL_SECONDS", "60"))
+
+_STOCK = """
+    SELECT p.id AS product_id, p.reorder_point, COUNT(i.id) AS quantity
+    FROM products p
+    LEFT JOIN inventory_items i ON i.product_id = p.id AND i.status = 'in_stock'
+    GROUP BY p.id
+"""
+
+def evaluate(db: Session) -> dict:
+    # Set-based pass: open alerts for products at or below their reorder point,
+    # refresh quantities on open alerts, cancel those that recovered
+    now = datetime.utcnow()
+    db.execute(text(f"CREATE TEMP TABLE IF NOT EXISTS alert_stock AS {_STOCK} LIMIT 0"))
+    db.execute(text("DELETE FROM alert_stock"))
+    db.execute(text(f"INSERT INTO alert_stock {_STOCK}"))
+    created = db.execute(text("""
+        INSERT INTO reorder_alerts (product_id, current_quantity, reorder_point, status, created_at)
+        SELECT s.product_id, s.quantity, s.reorder_point, 'pending', :now
+        FROM alert_stock s
+        WHERE s.quantity <= s.reorder_point
+              AND NOT EXISTS (SELECT 1 FROM reorder_alerts a
+                              WHERE a.product_id = s.product_id AND a.status = 'pending')
+    """).bindparams(bindparam("now", type_=DateTime)), {"now": now}).rowcount
+    db.execute(text("""
+        UPDATE reorder_alerts
+        SET current_quantity = (SELECT s.quantity FROM alert_stock s WHERE s.product_id = reorder_alerts.product_id)
+        WHERE status = 'pending'
+    """))
+    cancelled = db.execute(text("""
+        UPDATE reorder_alerts SET status = 'cancelled'
+        WHERE status = 'pending'
+              AND product_id IN (SELECT product_id FROM alert_stock WHERE quantity > reorder_point)
+    """)).rowcount
+    db.commit()
+    return {"created": created, "cancelled": cancelled}
+
+def check_product(db: Session, product_id: int, quantity: int, reorder_point: int):
+    # evaluate() for one product, run inside the transaction of a write that changed its stock
+    now = datetime.utcnow()
+    params = {"product_id": product_id, "quantity": quantity, "reorder_point": reorder_point, "now": now}
+    if quantity > reorder_point:
+        db.execute(text("""
+            UPDATE reorder_alerts SET status = 'cancelled'
+            WHERE status = 'pending' AND product_id = :product_id
+        """), params)
+        return
+    refreshed = db.execute(text("""
+        UPDATE reorder_alerts SET current_quantity = :quantity
+        WHERE status = 'pending' AND product_id = :product_id
+    """), params).rowcount
+    if not refreshed:
+        db.execute(text("""
+            INSERT INTO reorder_alerts (product_id, current_quantity, reorder_point, status, created_at)
+            VALUES (:product_id, :quantity, :reorder_point, 'pending', :now)
+        """).bindparams(bindparam("now", type_=DateTime)), params)
+
+async def run_forever(interval: float = INTERVAL_SECONDS):
+    # Started by every worker; the lease makes exactly one of them do the work
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        # Each site has its own database and lease, so its pass can run on any worker
+        for site in SITES:
+            try:
+                summary = await loop.run_in_executor(None, _run_once, site, interval)
+                if summary and (summary["created"] or summary["cancelled"]):
+                    logger.info(f"Reorder alerts at {site}: {summary['created']} created, "
+                                f"{summary['cancelled']} cancelled")
+            except Exception:
+                logger.exception(f"Alert engine pass failed at {site}")
+
+def _run_once(site: str, interval: float):
+    db = site_sessionmaker(site)()
+    try:
+        # Lease outlives two intervals so a slow pass does not hand over mid-run
+        if not coordination.hold(db, LEASE_NAME, interval * 2):
+            return None
+        return evaluate(db)
+    finally:
+        db.close()
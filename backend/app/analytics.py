@@ -0,0 +1,183 @@
+﻿import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+import duckdb
+import pyarrow as pa
+from .database import DEFAULT_SITE, db_path
+
+# Transactions moved out of SQLite are kept as Parquet files with the same columns
+ARCHIVE_DIR = db_path.parent / "archive" / "transactions"
+
+def archive_dir(site: str) -> Path:
+    # Other sites archive next to the default one, a directory each
+    return ARCHIVE_DIR if site == DEFAULT_SITE else db_path.parent / "archive" / site / "transactions"
+
+_TABLES = ["products", "inventory_items", "transactions"]
+
+# Transaction.location is stored as "<from> -> <to>"
+_SCAN_COLUMNS = """
+    rfid_tag,
+    CAST(created_at AS TIMESTAMP) AS created_at,
+    scanned_by,
+    CASE WHEN contains(location, ' -> ') THEN split_part(location, ' -> ', 1) ELSE location END AS from_zone,
+    CASE WHEN contains(location, ' -> ') THEN split_part(location, ' -> ', 2) ELSE location END AS to_zone
+"""
+
+def _arrow_type(declared: str):
+    # SQLite declared type -> Arrow type; timestamps stay text and are cast in SQL
+    declared = declared.upper()
+    if "INT" in declared:
+        return pa.int64()
+    if any(name in declared for name in ("REAL", "FLOA", "DOUB", "DECIMAL", "NUMERIC")):
+        return pa.float64()
+    return pa.string()
+
+# A failed ATTACH (extension not installable, file briefly unreadable) is tried again
+# after this long; until then queries take the copy path
+SCANNER_RETRY_SECONDS = 300
+# Rows per Arrow batch on the copy path, so Python never holds a whole table
+COPY_BATCH_ROWS = 50_000
+
+_scanner_retry_at = 0.0
+
+def _record_batches(cursor, schema: pa.Schema):
+    while True:
+        rows = cursor.fetchmany(COPY_BATCH_ROWS)
+        if not rows:
+            return
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(zip(*rows), schema)], schema=schema
+        )
+
+def _attach_sqlite(con, database: Path):
+    global _scanner_retry_at
+    if time.monotonic() >= _scanner_retry_at:
+        try:
+            con.execute(f"ATTACH '{database}' AS wms (TYPE SQLITE, READ_ONLY)")
+            _scanner_retry_at = 0.0
+            return
+        except duckdb.Error:
+            _scanner_retry_at = time.monotonic() + SCANNER_RETRY_SECONDS
+
+    # sqlite extension not available (offline host): stream tables in batch by batch
+    con.execute("CREATE SCHEMA wms")
+    # DuckDB pulls the batches on its own threads, one table at a time
+    source = sqlite3.connect(f"file:{database}?mode=ro", uri=True, check_same_thread=False)
+    try:
+        for table in _TABLES:
+            declared = source.execute(f"PRAGMA table_info({table})").fetchall()
+            schema = pa.schema([(col[1], _arrow_type(col[2])) for col in declared])
+            cursor = source.execute(f"SELECT {', '.join(schema.names)} FROM {table}")
+            con.register("_load", pa.RecordBatchReader.from_batches(schema, _record_batches(cursor, schema)))
+            con.execute(f"CREATE TABLE wms.{table} AS SELECT * FROM _load")
+            con.unregister("_load")
+    finally:
+        source.close()
+
+def connect(database: Path = db_path, archive_dir: Path = ARCHIVE_DIR):
+    # One in-memory DuckDB connection per query batch; the SQLite file is only read
+    con = duckdb.connect()
+    _attach_sqlite(con, database)
+
+    sources = [f"SELECT {_SCAN_COLUMNS} FROM wms.transactions WHERE action = 'SCANNED'"]
+    if archive_dir.exists() and any(archive_dir.glob("*.parquet")):
+        sources.append(
+            f"SELECT {_SCAN_COLUMNS} FROM read_parquet('{archive_dir / '*.parquet'}') "
+            "WHERE action = 'SCANNED'"
+        )
+    con.execute("CREATE VIEW scans AS " + " UNION ALL ".join(sources))
+    return con
+
+def stock_health(con, start: datetime, end: datetime):
+    return con.execute("""
+        SELECT p.id AS product_id, p.sku, p.name,
+               COUNT(i.id) AS current_quantity,
+               p.reorder_point,
+               CASE
+                   WHEN COUNT(i.id) = 0 THEN 'out_of_stock'
+                   WHEN COUNT(i.id) <= p.reorder_point THEN 'low'
+                   WHEN COUNT(i.id) <= 2 * p.reorder_point THEN 'watch'
+                   ELSE 'healthy'
+               END AS health
+        FROM wms.products p
+        LEFT JOIN wms.inventory_items i ON i.product_id = p.id AND i.status = 'in_stock'
+        GROUP BY p.id, p.sku, p.name, p.reorder_point
+        ORDER BY current_quantity - p.reorder_point
+    """).fetch_arrow_table()
+
+def movement_heatmap(con, start: datetime, end: datetime):
+    return con.execute("""
+        SELECT to_zone AS zone,
+               dayofweek(created_at) AS day_of_week,
+               hour(created_at) AS hour,
+               COUNT(*) AS scans
+        FROM scans
+        WHERE created_at >= ? AND created_at < ?
+        GROUP BY ALL
+        ORDER BY zone, day_of_week, hour
+    """, [start, end]).fetch_arrow_table()
+
+def turnover(con, start: datetime, end: datetime):
+    return con.execute("""
+        WITH moves AS (
+            SELECT i.product_id, COUNT(*) AS scans,
+                   COUNT(*) FILTER (WHERE s.from_zone != s.to_zone) AS moves
+            FROM scans s
+            JOIN wms.inventory_items i ON i.rfid_tag = s.rfid_tag
+            WHERE s.created_at >= ? AND s.created_at < ?
+            GROUP BY i.product_id
+        ), stock AS (
+            SELECT product_id, COUNT(*) AS items
+            FROM wms.inventory_items
+            WHERE status = 'in_stock'
+            GROUP BY product_id
+        )
+        SELECT p.id AS product_id, p.sku, p.name,
+               COALESCE(stock.items, 0) AS current_quantity,
+               COALESCE(moves.scans, 0) AS scans,
+               COALESCE(moves.moves, 0) AS moves,
+               COALESCE(moves.moves, 0) / GREATEST(COALESCE(stock.items, 0), 1) AS turnover
+        FROM wms.products p
+        LEFT JOIN moves ON moves.product_id = p.id
+        LEFT JOIN stock ON stock.product_id = p.id
+        ORDER BY turnover DESC
+    """, [start, end]).fetch_arrow_table()
+
+def dwell_time(con, start: datetime, end: datetime):
+    # Time a tag stays in a zone = gap until the same tag's next scan
+    return con.execute("""
+        WITH visits AS (
+            SELECT to_zone AS zone, created_at,
+                   LEAD(created_at) OVER (PARTITION BY rfid_tag ORDER BY created_at) AS left_at
+            FROM scans
+            WHERE created_at >= ? AND created_at < ?
+        ), dwell AS (
+            SELECT zone, epoch(left_at - created_at) / 3600.0 AS hours
+            FROM visits
+            WHERE left_at IS NOT NULL
+        )
+        SELECT zone,
+               COUNT(*) AS visits,
+               AVG(hours) AS mean_hours,
+               quantile_cont(hours, 0.5) AS p50_hours,
+               quantile_cont(hours, 0.9) AS p90_hours,
+               MAX(hours) AS max_hours
+        FROM dwell
+        GROUP BY zone
+        ORDER BY zone
+    """, [start, end]).fetch_arrow_table()
+
+REPORTS = {
+    "stock-health": stock_health,
+    "movement-heatmap": movement_heatmap,
+    "turnover": turnover,
+    "dwell-time": dwell_time,
+}
+
+def run_report(name: str, start: datetime, end: datetime, **connect_args):
+    con = connect(**connect_args)
+    try:
+        return REPORTS[name](con, start, end)
+    finally:
+        con.close()
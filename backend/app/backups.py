@@ -0,0 +1,462 @@
+"""
+Online backups of the SQLite store, and restore to a point in time.
+
+A site's backups live in BACKUP_DIR/<site>/. Each file there has a JSON manifest next
+to it (<file>.json) with its SHA-256, and a file without a manifest is never used.
+
+- Snapshots are full copies made with SQLite's online backup API. The copy runs inside
+  one read transaction, so it is the database as of a single moment. In WAL mode that
+  read transaction never blocks a writer, and a commit during the copy does not restart
+  it. Pages are copied STEP_PAGES at a time with a STEP_SLEEP_MS pause between steps, so
+  the copy's reads do not crowd out scan commits.
+- Log segments hold the transactions written since the previous segment, read as a
+  primary-key range into a small SQLite file. They are the incremental part: every pass
+  ships one, while snapshots follow the schedule.
+
+restore() copies the newest snapshot taken at or before the target time and replays the
+logged transactions up to that time on top of it. Each move puts its item in the zone
+it moved to, and SHIPPED marks it shipped. The counters and rollups are then rebuilt.
+What the log does not record stays as of the snapshot: products, items loaded since, and
+reservation, alert and cycle count state.
+
+    python -m app.backups snapshot                                # full snapshot now
+    python -m app.backups ship                                    # ship new log rows
+    python -m app.backups verify                                  # re-check every checksum
+    python -m app.backups list
+    python -m app.backups restore --at 2026-10-19T14:30 --output data/restored.db
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from sqlalchemy import DateTime, bindparam, create_engine, text
+from sqlalchemy.orm import Session
+from . import coordination, migrate, rollups, stats, zones
+from .database import DEFAULT_SITE, SITES, db_path, site_path, site_sessionmaker, site_url
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process dev server, nothing to serialize
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+BACKUP_DIR = Path(os.getenv("WMS_BACKUP_DIR", str(db_path.parent / "backups")))
+LEASE_NAME = "backups"
+# Seconds between passes, each shipping a log segment; 0 turns the in-process job off
+INTERVAL_SECONDS = float(os.getenv("WMS_BACKUP_INTERVAL_SECONDS", "60"))
+# Pages copied per backup step and the pause between steps
+STEP_PAGES = int(os.getenv("WMS_BACKUP_STEP_PAGES", "256"))
+STEP_SLEEP_MS = float(os.getenv("WMS_BACKUP_STEP_SLEEP_MS", "5"))
+# Snapshots kept per site; log segments only an older snapshot needs go with them
+KEEP = int(os.getenv("WMS_BACKUP_KEEP", "7"))
+FREQUENCIES = {"hourly": 3600, "daily": 86400, "weekly": 7 * 86400}
+# Until the settings page saves a schedule for the site
+DEFAULT_SCHEDULE = {
+    "enabled": os.getenv("WMS_BACKUP_ENABLED", "0") == "1",
+    "frequency": os.getenv("WMS_BACKUP_FREQUENCY", "daily"),
+}
+
+class BackupBusy(Exception):
+    # Another process is writing the site's backups
+    pass
+
+SEGMENT_TABLE = """
+    CREATE TABLE segment.transactions (
+        id INTEGER PRIMARY KEY, rfid_tag VARCHAR(50), action VARCHAR(20), location VARCHAR(50),
+        scanned_by VARCHAR(100), created_at DATETIME, product_id INTEGER
+    )
+"""
+
+SHIP = """
+    INSERT INTO segment.transactions
+    SELECT id, rfid_tag, action, location, scanned_by, created_at, product_id
+    FROM main.transactions WHERE id > ? AND id <= ?
+"""
+
+REPLAY = text("""
+    INSERT INTO transactions (id, rfid_tag, action, location, scanned_by, created_at, product_id)
+    SELECT id, rfid_tag, action, location, scanned_by, created_at, product_id
+    FROM segment.transactions
+    WHERE id > :after AND (:at IS NULL OR created_at <= :at)
+    ORDER BY id
+""").bindparams(bindparam("at", type_=DateTime))
+
+# Each replayed item's last move, by transaction id
+LAST_MOVES = text("""
+    CREATE TEMP TABLE replay_moves AS
+    SELECT rfid_tag, MAX(id) AS id FROM transactions
+    WHERE id > :after AND action != 'SHIPPED'
+    GROUP BY rfid_tag
+""")
+
+APPLY_MOVES = text(f"""
+    UPDATE inventory_items AS i SET location_zone = {rollups.TO_ZONE_SQL}, last_scanned_at = t.created_at
+    FROM replay_moves m JOIN transactions t ON t.id = m.id
+    WHERE i.rfid_tag = m.rfid_tag
+""")
+
+APPLY_SHIPPED = text("""
+    UPDATE inventory_items SET status = 'shipped'
+    WHERE rfid_tag IN (SELECT rfid_tag FROM transactions WHERE id > :after AND action = 'SHIPPED')
+""")
+
+def site_dir(site: str) -> Path:
+    return BACKUP_DIR / site
+
+def _source(site: str) -> Path:
+    if not site_url(site).startswith("sqlite:///"):
+        raise ValueError("Online backups need a SQLite database")
+    return site_path(site)
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _write_json(path: Path, data: dict):
+    # Renamed into place, so a reader never sees half a file
+    part = path.with_name(f"{path.name}.{os.getpid()}.part")
+    part.write_text(json.dumps(data, indent=2))
+    os.replace(part, path)
+
+def _manifests(directory: Path, kind: str) -> list:
+    return [json.loads(path.read_text()) for path in directory.glob(f"{kind}-*.db.json")]
+
+def _check(directory: Path, manifest: dict):
+    path = directory / manifest["file"]
+    if not path.exists() or _sha256(path) != manifest["sha256"]:
+        raise ValueError(f"{path} is missing or does not match its checksum")
+
+def _remove(directory: Path, manifest: dict):
+    # Manifest first: a file left without one is ignored
+    (directory / f"{manifest['file']}.json").unlink(missing_ok=True)
+    (directory / manifest["file"]).unlink(missing_ok=True)
+
+def _iso(stored):
+    # SQLite keeps "YYYY-MM-DD HH:MM:SS.ffffff"
+    return datetime.fromisoformat(stored).isoformat() if stored else None
+
+@contextmanager
+def _site_lock(site: str):
+    # One writer of a site's backups at a time, API workers and the command line alike
+    directory = site_dir(site)
+    directory.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        yield directory
+        return
+    with open(directory / ".lock", "w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise BackupBusy(f"A backup of {site} is already running") from None
+        try:
+            yield directory
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def snapshot_file(source: Path, directory: Path) -> dict:
+    # Consistent, checked copy of a live SQLite file into directory; returns its manifest
+    directory.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(source, isolation_level=None)
+    try:
+        # The read transaction pins one WAL snapshot for the whole copy, at its first read.
+        # Rows committed after that are past last_transaction_id, so a restore replays them
+        conn.execute("BEGIN")
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        taken_at = datetime.utcnow()
+        last_id = conn.execute("SELECT MAX(id) FROM transactions").fetchone()[0] if "transactions" in tables else None
+        version = (conn.execute("SELECT MAX(version) FROM schema_migrations").fetchone()[0]
+                   if "schema_migrations" in tables else None)
+        path = directory / f"snapshot-{taken_at:%Y%m%dT%H%M%S%f}.db"
+        part = path.with_name(f"{path.name}.part")
+        part.unlink(missing_ok=True)
+        target = sqlite3.connect(part)
+        try:
+            conn.backup(target, pages=STEP_PAGES, sleep=STEP_SLEEP_MS / 1000)
+            conn.execute("ROLLBACK")
+            # While the snapshot was pinned no checkpoint could pass it. Catch up here, or
+            # the next scan commit would checkpoint the whole backlog itself
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            # A rollback journal keeps the snapshot one self-contained file
+            target.execute("PRAGMA journal_mode=DELETE")
+            check = target.execute("PRAGMA quick_check").fetchone()[0]
+        finally:
+            target.close()
+    finally:
+        conn.close()
+    if check != "ok":
+        part.unlink()
+        raise RuntimeError(f"Snapshot of {source} failed its integrity check: {check}")
+    os.replace(part, path)
+    manifest = {
+        "kind": "snapshot",
+        "file": path.name,
+        "created_at": taken_at.isoformat(),
+        "last_transaction_id": last_id or 0,
+        "schema_version": version,
+        "bytes": path.stat().st_size,
+        "sha256": _sha256(path),
+    }
+    _write_json(path.with_name(f"{path.name}.json"), manifest)
+    return manifest
+
+def _prune(directory: Path):
+    snapshots = sorted(_manifests(directory, "snapshot"), key=lambda m: m["created_at"])
+    if KEEP < 1 or len(snapshots) <= KEEP:
+        return
+    oldest_kept = snapshots[-KEEP]["last_transaction_id"]
+    for manifest in snapshots[:-KEEP]:
+        _remove(directory, manifest)
+    for manifest in _manifests(directory, "log"):
+        if manifest["last_transaction_id"] <= oldest_kept:
+            _remove(directory, manifest)
+
+def snapshot(site: str = DEFAULT_SITE) -> dict:
+    with _site_lock(site) as directory:
+        manifest = snapshot_file(_source(site), directory)
+        _prune(directory)
+    return manifest
+
+def ship_log_file(source: Path, directory: Path):
+    # Transactions since the last segment in directory; None when there is nothing new or no
+    # snapshot yet. The log continues from the last segment, or from the oldest snapshot
+    segments = _manifests(directory, "log")
+    snapshots = _manifests(directory, "snapshot")
+    if segments:
+        after = max(m["last_transaction_id"] for m in segments)
+    elif snapshots:
+        after = min(m["last_transaction_id"] for m in snapshots)
+    else:
+        return None
+    conn = sqlite3.connect(source, isolation_level=None)
+    try:
+        last = conn.execute("SELECT MAX(id) FROM transactions").fetchone()[0] or 0
+        if last <= after:
+            return None
+        path = directory / f"log-{after + 1:012d}-{last:012d}.db"
+        part = path.with_name(f"{path.name}.part")
+        part.unlink(missing_ok=True)
+        # Only the segment is written; the live database is read like any other reader
+        conn.execute("ATTACH DATABASE ? AS segment", (str(part),))
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute(SEGMENT_TABLE)
+            rows = conn.execute(SHIP, (after, last)).rowcount
+            first_at, last_at = conn.execute(
+                "SELECT MIN(created_at), MAX(created_at) FROM segment.transactions"
+            ).fetchone()
+        conn.execute("DETACH DATABASE segment")
+    finally:
+        conn.close()
+    os.replace(part, path)
+    manifest = {
+        "kind": "log",
+        "file": path.name,
+        "created_at": datetime.utcnow().isoformat(),
+        "after_transaction_id": after,
+        "last_transaction_id": last,
+        "rows": rows,
+        "first_at": _iso(first_at),
+        "last_at": _iso(last_at),
+        "bytes": path.stat().st_size,
+        "sha256": _sha256(path),
+    }
+    _write_json(path.with_name(f"{path.name}.json"), manifest)
+    return manifest
+
+def ship_log(site: str = DEFAULT_SITE):
+    with _site_lock(site) as directory:
+        return ship_log_file(_source(site), directory)
+
+def verify(site: str = DEFAULT_SITE) -> dict:
+    # Re-reads every file and compares it with the checksum in its manifest
+    directory = site_dir(site)
+    manifests = _manifests(directory, "snapshot") + _manifests(directory, "log")
+    failed = []
+    for manifest in manifests:
+        try:
+            _check(directory, manifest)
+        except ValueError:
+            failed.append(manifest["file"])
+    return {"checked": len(manifests), "failed": sorted(failed)}
+
+def catalog(site: str = DEFAULT_SITE) -> dict:
+    directory = site_dir(site)
+    segments = _manifests(directory, "log")
+    return {
+        "schedule": get_schedule(site),
+        "snapshots": sorted(_manifests(directory, "snapshot"), key=lambda m: m["created_at"], reverse=True),
+        # Segments are many and small: totals only
+        "log": {
+            "segments": len(segments),
+            "bytes": sum(m["bytes"] for m in segments),
+            "last_transaction_id": max((m["last_transaction_id"] for m in segments), default=None),
+            "last_at": max((m["last_at"] for m in segments if m["last_at"]), default=None),
+        },
+    }
+
+def get_schedule(site: str = DEFAULT_SITE) -> dict:
+    # Kept with the backups rather than in the database, so a restore does not roll it back
+    path = site_dir(site) / "schedule.json"
+    return {**DEFAULT_SCHEDULE, **json.loads(path.read_text())} if path.exists() else dict(DEFAULT_SCHEDULE)
+
+def set_schedule(site: str, enabled: bool, frequency: str) -> dict:
+    if frequency not in FREQUENCIES:
+        raise ValueError(f"Unknown backup frequency: {frequency}")
+    directory = site_dir(site)
+    directory.mkdir(parents=True, exist_ok=True)
+    schedule = {"enabled": enabled, "frequency": frequency}
+    _write_json(directory / "schedule.json", schedule)
+    return schedule
+
+def run_pass(site: str = DEFAULT_SITE):
+    # A snapshot when the schedule says one is due, then a log segment
+    schedule = get_schedule(site)
+    if not schedule["enabled"]:
+        return None
+    with _site_lock(site) as directory:
+        newest = max((m["created_at"] for m in _manifests(directory, "snapshot")), default=None)
+        due = newest is None or (
+            (datetime.utcnow() - datetime.fromisoformat(newest)).total_seconds()
+            >= FREQUENCIES.get(schedule["frequency"], FREQUENCIES["daily"])
+        )
+        taken = snapshot_file(_source(site), directory) if due else None
+        if taken:
+            _prune(directory)
+        return {"snapshot": taken, "segment": ship_log_file(_source(site), directory)}
+
+async def run_forever(interval: float = INTERVAL_SECONDS):
+    # Started by every worker; the lease makes exactly one of them do the work
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        for site in SITES:
+            try:
+                summary = await loop.run_in_executor(None, _run_once, site, interval)
+                if summary and summary["snapshot"]:
+                    logger.info(f"Backup snapshot at {site}: {summary['snapshot']['file']} "
+                                f"({summary['snapshot']['bytes']:,} bytes)")
+            except Exception:
+                logger.exception(f"Backup pass failed at {site}")
+
+def _run_once(site: str, interval: float):
+    db = site_sessionmaker(site)()
+    try:
+        if not coordination.hold(db, LEASE_NAME, interval * 2):
+            return None
+    finally:
+        db.close()
+    try:
+        return run_pass(site)
+    except BackupBusy:
+        # A snapshot from the command line, or a pass that outlived its lease
+        return None
+
+def _chain(directory: Path, after: int, reached: datetime, at: datetime = None) -> list:
+    # Segments that continue the log from transaction `after`, as far as `at` needs
+    chain = []
+    for manifest in sorted(_manifests(directory, "log"), key=lambda m: m["after_transaction_id"]):
+        if manifest["last_transaction_id"] <= after:
+            continue
+        if at is not None and manifest["first_at"] and datetime.fromisoformat(manifest["first_at"]) > at:
+            break
+        if manifest["after_transaction_id"] > after:
+            if at is not None and reached >= at:
+                break
+            raise ValueError(f"Log segments after transaction {after} are missing")
+        chain.append(manifest)
+        after = manifest["last_transaction_id"]
+        if manifest["last_at"]:
+            reached = max(reached, datetime.fromisoformat(manifest["last_at"]))
+    return chain
+
+def restore(site: str, output: Path, at: datetime = None) -> dict:
+    # Builds the site's database as of `at` (default: the end of the log) in a new file
+    return restore_from(site_dir(site), output, at)
+
+def restore_from(directory: Path, output: Path, at: datetime = None) -> dict:
+    if output.exists():
+        raise ValueError(f"{output} already exists")
+    snapshots = sorted(_manifests(directory, "snapshot"), key=lambda m: m["created_at"])
+    candidates = [m for m in snapshots if at is None or datetime.fromisoformat(m["created_at"]) <= at]
+    if not candidates:
+        raise LookupError(f"No snapshot in {directory} at or before {at}")
+    base = candidates[-1]
+    _check(directory, base)
+    after = base["last_transaction_id"]
+    chain = _chain(directory, after, datetime.fromisoformat(base["created_at"]), at)
+    for manifest in chain:
+        _check(directory, manifest)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(directory / base["file"], output)
+    engine = create_engine(f"sqlite:///{output}")
+    try:
+        # An older snapshot is brought up to the current schema before the replay
+        migrate.upgrade(engine)
+        replayed = 0
+        for manifest in chain:
+            with engine.connect() as conn:
+                conn.exec_driver_sql("ATTACH DATABASE ? AS segment", (str(directory / manifest["file"]),))
+                replayed += conn.execute(REPLAY, {"after": after, "at": at}).rowcount
+                conn.commit()
+                conn.exec_driver_sql("DETACH DATABASE segment")
+        with engine.begin() as conn:
+            conn.execute(LAST_MOVES, {"after": after})
+            moved = conn.execute(APPLY_MOVES).rowcount
+            shipped = conn.execute(APPLY_SHIPPED, {"after": after}).rowcount
+            conn.execute(text("DROP TABLE replay_moves"))
+        with Session(engine) as db:
+            stats.rebuild(db)
+            zones.rebuild(db)
+            rollups.rebuild_rollups(db)
+            db.commit()
+            last_id = db.execute(text("SELECT MAX(id) FROM transactions")).scalar()
+    finally:
+        engine.dispose()
+    return {
+        "output": str(output),
+        "snapshot": base["file"],
+        "segments": len(chain),
+        "replayed": replayed,
+        "items_moved": moved,
+        "items_shipped": shipped,
+        "last_transaction_id": last_id or 0,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshot, verify and restore the SQLite store")
+    parser.add_argument("command", choices=["snapshot", "ship", "verify", "list", "restore"])
+    parser.add_argument("--site", choices=SITES, default=DEFAULT_SITE, help="site (default: %(default)s)")
+    parser.add_argument("--at", type=datetime.fromisoformat, help="restore: point in time, UTC (default: end of the log)")
+    parser.add_argument("--output", type=Path, help="restore: new database file to write")
+    args = parser.parse_args()
+
+    if args.command == "snapshot":
+        result = snapshot(args.site)
+    elif args.command == "ship":
+        result = ship_log(args.site)
+    elif args.command == "verify":
+        result = verify(args.site)
+    elif args.command == "list":
+        result = catalog(args.site)
+    else:
+        if args.output is None:
+            parser.error("restore needs --output")
+        result = restore(args.site, args.output, args.at)
+    print(json.dumps(result, indent=2))
+    if args.command == "verify" and result["failed"]:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import os
+import threading
+from urllib.parse import quote
+import pandas as pd
+import requests
+
+try:
+    import pyarrow as pa
+except ImportError:  # JSON only
+    pa = None
+
+# HTTP client for the Streamlit dashboards; needs the "dashboard" extra (pandas, requests)
+API_URL = (os.getenv("WMS_API_URL") or os.getenv("API_URL") or os.getenv("BACKEND_URL")
+           or "http://localhost:8000").rstrip("/")
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+# Site to read and scan at; unset means the API's default site
+SITE = os.getenv("WMS_SITE") or None
+
+_local = threading.local()
+
+def session() -> requests.Session:
+    # One keep-alive session per thread: Streamlit reruns reuse the TCP connection
+    # instead of opening a new one for every call
+    if getattr(_local, "session", None) is None:
+        _local.session = requests.Session()
+        if SITE:
+            _local.session.headers["X-WMS-Site"] = SITE
+    return _local.session
+
+def api_get(path: str, **kwargs) -> requests.Response:
+    return session().get(f"{API_URL}{path}", **kwargs)
+
+def api_post(path: str, **kwargs) -> requests.Response:
+    return session().post(f"{API_URL}{path}", **kwargs)
+
+def fetch_frame(api_url, path, params=None, timeout=5):
+    # Ask for Arrow when pyarrow is available; older backends just answer with JSON
+    headers = {"Accept": f"{ARROW_STREAM}, application/json;q=0.5"} if pa else {}
+    try:
+        response = session().get(f"{api_url or API_URL}{path}", params=params, headers=headers, timeout=timeout)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    if pa and response.headers.get("content-type", "").startswith(ARROW_STREAM):
+        return pa.ipc.open_stream(response.content).read_pandas()
+    return pd.DataFrame(response.json())
+
+def fetch_inventory_levels(api_url=None, timeout=5):
+    return fetch_frame(api_url, "/api/inventory/levels", timeout=timeout)
+
+def fetch_recent_scans(api_url=None, limit=50, timeout=5):
+    return fetch_frame(api_url, "/api/scans/recent", params={"limit": limit}, timeout=timeout)
+
+def fetch_stats(api_url=None, timeout=5):
+    try:
+        response = session().get(f"{api_url or API_URL}/api/stats", timeout=timeout)
+    except requests.RequestException:
+        return None
+    return response.json() if response.status_code == 200 else None
+
+_VALIDATED_CACHE_SIZE = 512
+
+def get_validated(path: str, params=None, timeout=5):
+    # Conditional GET against the lookup routes: the ETag of the last answer is sent back,
+    # and a 304 reuses that answer without transferring or parsing the body again
+    cache = getattr(_local, "validated", None)
+    if cache is None:
+        cache = _local.validated = {}
+    key = (path, tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in (params or {}).items())))
+    cached = cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    try:
+        response = session().get(f"{API_URL}{path}", params=params, headers=headers, timeout=timeout)
+    except requests.RequestException:
+        return None
+    if response.status_code == 304 and cached:
+        return cached[1]
+    if response.status_code != 200:
+        return None
+    payload = response.json()
+    if "ETag" in response.headers:
+        if len(cache) >= _VALIDATED_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = (response.headers["ETag"], payload)
+    return payload
+
+def fetch_item(rfid_tag, movements=20, timeout=5):
+    return get_validated(f"/api/items/{quote(str(rfid_tag), safe='')}", params={"movements": movements}, timeout=timeout)
+
+def fetch_items(rfid_tags, movements=0, timeout=5):
+    return get_validated("/api/items", params={"tag": list(rfid_tags), "movements": movements}, timeout=timeout)
+
+def fetch_product(sku, timeout=5):
+    return get_validated(f"/api/products/{quote(str(sku), safe='')}", timeout=timeout)
+
+def fetch_products(skus, timeout=5):
+    return get_validated("/api/products", params={"sku": list(skus)}, timeout=timeout)
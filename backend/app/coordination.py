@@ -0,0 +1,53 @@
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from . import models
+
+# Tokens of the leases the periodic jobs in this process hold, by (database, lease)
+_held = {}
+
+def worker_id() -> str:
+    # Evaluated per call: a forked worker gets its own pid
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def new_token() -> str:
+    # One per acquisition: threads of the same worker must not share a lease
+    return f"{worker_id()}:{uuid.uuid4().hex[:16]}"
+
+def try_acquire(db: Session, name: str, ttl_seconds: float, token: str = None) -> Optional[str]:
+    # Take the lease, or renew it with the token that took it; succeeds only if it is
+    # free, expired or held with that token. Returns the token, None if held elsewhere
+    token = token or new_token()
+    now = datetime.utcnow()
+    table = models.Lease.__table__
+    stmt = sqlite_insert(table).values(
+        name=name, owner=token, expires_at=now + timedelta(seconds=ttl_seconds)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"owner": stmt.excluded.owner, "expires_at": stmt.excluded.expires_at},
+        where=(table.c.owner == stmt.excluded.owner) | (table.c.expires_at < now)
+    )
+    result = db.execute(stmt)
+    db.commit()
+    return token if result.rowcount == 1 else None
+
+def hold(db: Session, name: str, ttl_seconds: float) -> bool:
+    # For periodic jobs: keep renewing the lease this process took on an earlier pass
+    key = (str(db.get_bind().url), name)
+    token = try_acquire(db, name, ttl_seconds, _held.get(key))
+    if token is None:
+        _held.pop(key, None)
+        return False
+    _held[key] = token
+    return True
+
+def release(db: Session, name: str, token: str):
+    db.query(models.Lease).filter(
+        models.Lease.name == name, models.Lease.owner == token
+    ).delete(synchronize_session=False)
+    db.commit()
@@ -0,0 +1,249 @@
+"""
+Cycle counts: reconcile a handheld sweep of some zones with what the database expects.
+
+A session is opened for a set of zones. Reads are streamed in batches and upserted
+into cycle_count_reads, so a tag read twice is kept once, with its latest zone. Closing
+the session compares the reads with the counted zones' items as set operations in
+SQL. The expected side is a range of ix_inventory_items_zone per zone:
+
+- found: read in the zone the database has it in.
+- misplaced: a known item read in another zone than the database has.
+- unexpected: a tag the database does not know, or an item that should not be on a
+  shelf (shipped or damaged).
+- missing: expected in a counted zone but not read anywhere in the session.
+
+Misplaced, unexpected and missing tags are written to cycle_count_variances. The
+corrections are then applied in bulk in the same transaction:
+- Found and misplaced items take the zone and time of their read.
+- Each move is logged as a COUNTED transaction.
+- Open missing item alerts of read tags are marked found.
+- Missing in-stock items get a missing item alert.
+- The stat counters and the zone index follow the moves.
+
+A read is ignored for an item scanned after it. An item scanned since the session
+opened is never missing: the scan is newer than anything the sweep could say.
+"""
+from collections import Counter
+from datetime import datetime, timezone
+from sqlalchemy import DateTime, Integer, bindparam, func, insert, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from . import models, stats, zones
+
+# Statuses of items that should be found on a shelf
+EXPECTED_STATUSES = ("in_stock", "reserved")
+OUTCOMES = ("missing", "unexpected", "misplaced")
+
+class CycleCountConflict(Exception):
+    # The session is no longer open
+    pass
+
+_counts = models.CycleCount.__table__
+_count_zones = models.CycleCountZone.__table__
+_reads = models.CycleCountRead.__table__
+_variances = models.CycleCountVariance.__table__
+_zone_stock = models.ZoneStock.__table__
+
+_EXPECTED = "('in_stock', 'reserved')"
+# The read is at least as new as anything the database knows about the item
+_CURRENT = "(i.last_scanned_at IS NULL OR i.last_scanned_at <= r.read_at)"
+
+SAVE_READ = sqlite_insert(_reads)
+SAVE_READ = SAVE_READ.on_conflict_do_update(
+    index_elements=["count_id", "rfid_tag"],
+    set_={"zone": SAVE_READ.excluded.zone, "read_at": SAVE_READ.excluded.read_at},
+)
+
+COUNT_STATUS = select(_counts.c.status).where(_counts.c.id == bindparam("count_id"))
+
+COUNT_ZONES = select(_count_zones.c.zone).where(_count_zones.c.count_id == bindparam("count_id")).order_by(
+    _count_zones.c.zone
+)
+
+READS = select(func.count()).select_from(_reads).where(_reads.c.count_id == bindparam("count_id"))
+
+# Items each zone should hold, from the zone index
+EXPECTED_BY_ZONE = select(_zone_stock.c.zone, func.sum(_zone_stock.c.item_count)).where(
+    _zone_stock.c.zone.in_(bindparam("zones", expanding=True)), _zone_stock.c.status.in_(EXPECTED_STATUSES)
+).group_by(_zone_stock.c.zone)
+
+VARIANCES_PAGE = select(
+    _variances.c.rfid_tag, _variances.c.outcome, _variances.c.product_id,
+    _variances.c.expected_zone, _variances.c.counted_zone
+).where(
+    _variances.c.count_id == bindparam("count_id"), _variances.c.rfid_tag > bindparam("after")
+).order_by(_variances.c.rfid_tag).limit(bindparam("limit", type_=Integer))
+
+FOUND = text(f"""
+    SELECT COUNT(*) FROM cycle_count_reads r JOIN inventory_items i ON i.rfid_tag = r.rfid_tag
+    WHERE r.count_id = :count_id AND i.status IN {_EXPECTED} AND i.location_zone = r.zone AND {_CURRENT}
+""")
+
+ADD_MISPLACED = text(f"""
+    INSERT INTO cycle_count_variances (count_id, rfid_tag, outcome, product_id, expected_zone, counted_zone)
+    SELECT r.count_id, r.rfid_tag, 'misplaced', i.product_id, i.location_zone, r.zone
+    FROM cycle_count_reads r JOIN inventory_items i ON i.rfid_tag = r.rfid_tag
+    WHERE r.count_id = :count_id AND i.status IN {_EXPECTED} AND i.location_zone != r.zone AND {_CURRENT}
+""")
+
+ADD_UNEXPECTED = text(f"""
+    INSERT INTO cycle_count_variances (count_id, rfid_tag, outcome, product_id, expected_zone, counted_zone)
+    SELECT r.count_id, r.rfid_tag, 'unexpected', i.product_id, i.location_zone, r.zone
+    FROM cycle_count_reads r LEFT JOIN inventory_items i ON i.rfid_tag = r.rfid_tag
+    WHERE r.count_id = :count_id AND (i.id IS NULL OR (i.status NOT IN {_EXPECTED} AND {_CURRENT}))
+""")
+
+ADD_MISSING = text(f"""
+    INSERT INTO cycle_count_variances (count_id, rfid_tag, outcome, product_id, expected_zone)
+    SELECT z.count_id, i.rfid_tag, 'missing', i.product_id, i.location_zone
+    FROM cycle_count_zones z JOIN inventory_items i ON i.location_zone = z.zone
+    WHERE z.count_id = :count_id AND i.status IN {_EXPECTED}
+          AND (i.last_scanned_at IS NULL OR i.last_scanned_at < :opened_at)
+          AND NOT EXISTS (SELECT 1 FROM cycle_count_reads r WHERE r.count_id = z.count_id AND r.rfid_tag = i.rfid_tag)
+""").bindparams(bindparam("opened_at", type_=DateTime))
+
+# Misplaced items per move, read before the items are moved
+MOVES = text("""
+    SELECT v.expected_zone, v.counted_zone, i.product_id, i.status, COUNT(*)
+    FROM cycle_count_variances v JOIN inventory_items i ON i.rfid_tag = v.rfid_tag
+    WHERE v.count_id = :count_id AND v.outcome = 'misplaced'
+    GROUP BY 1, 2, 3, 4
+""")
+
+LOG_MOVES = text("""
+    INSERT INTO transactions (rfid_tag, action, location, scanned_by, created_at, product_id)
+    SELECT v.rfid_tag, 'COUNTED', v.expected_zone || ' -> ' || v.counted_zone, :scanned_by, r.read_at, v.product_id
+    FROM cycle_count_variances v
+    JOIN cycle_count_reads r ON r.count_id = v.count_id AND r.rfid_tag = v.rfid_tag
+    WHERE v.count_id = :count_id AND v.outcome = 'misplaced'
+""")
+
+# Found and misplaced items in one pass: zone and time of their read
+APPLY_READS = text(f"""
+    UPDATE inventory_items AS i SET location_zone = r.zone, last_scanned_at = r.read_at
+    FROM cycle_count_reads r
+    WHERE r.count_id = :count_id AND r.rfid_tag = i.rfid_tag AND i.status IN {_EXPECTED} AND {_CURRENT}
+""")
+
+MARK_FOUND = text("""
+    UPDATE missing_item_alerts SET status = 'found', resolved_at = :now
+    WHERE status = 'open'
+          AND rfid_tag IN (SELECT rfid_tag FROM cycle_count_reads WHERE count_id = :count_id)
+""").bindparams(bindparam("now", type_=DateTime))
+
+# threshold_days 0 marks alerts raised by a count rather than by app.stale
+RAISE_MISSING = text("""
+    INSERT INTO missing_item_alerts (rfid_tag, product_id, zone, last_scanned_at, threshold_days, status, created_at)
+    SELECT v.rfid_tag, v.product_id, v.expected_zone, COALESCE(i.last_scanned_at, i.created_at, :now), 0, 'open', :now
+    FROM cycle_count_variances v JOIN inventory_items i ON i.rfid_tag = v.rfid_tag
+    WHERE v.count_id = :count_id AND v.outcome = 'missing' AND i.status = 'in_stock'
+          AND NOT EXISTS (SELECT 1 FROM missing_item_alerts a WHERE a.rfid_tag = v.rfid_tag AND a.status = 'open')
+""").bindparams(bindparam("now", type_=DateTime))
+
+OUTCOME_COUNTS = select(_variances.c.outcome, func.count()).where(
+    _variances.c.count_id == bindparam("count_id")
+).group_by(_variances.c.outcome)
+
+def open_count(db: Session, count_zones: list, counted_by: str = None) -> dict:
+    count_zones = sorted(set(zone for zone in count_zones if zone))
+    if not count_zones:
+        raise ValueError("A cycle count needs at least one zone")
+    count_id = db.execute(insert(_counts).values(
+        status="open", counted_by=counted_by, created_at=datetime.utcnow()
+    ).returning(_counts.c.id)).scalar()
+    db.execute(insert(_count_zones), [{"count_id": count_id, "zone": zone} for zone in count_zones])
+    db.commit()
+    return get(db, count_id)
+
+def _require_open(db: Session, count_id: int):
+    status = db.execute(COUNT_STATUS, {"count_id": count_id}).scalar()
+    if status is None:
+        raise LookupError(f"Unknown cycle count: {count_id}")
+    if status != "open":
+        raise CycleCountConflict(f"Cycle count {count_id} is {status}")
+
+def add_reads(db: Session, count_id: int, zone: str, tags: list, read_at: datetime = None) -> dict:
+    # One batch of a sweep of zone; returns the batch size and the session's distinct tags so far
+    _require_open(db, count_id)
+    if zone not in db.execute(COUNT_ZONES, {"count_id": count_id}).scalars().all():
+        raise ValueError(f"Zone {zone} is not part of cycle count {count_id}")
+    read_at = read_at or datetime.utcnow()
+    if read_at.tzinfo is not None:
+        # Stored times are naive UTC and compared as text with last_scanned_at; SQLite's
+        # DateTime would drop the offset and keep the local wall-clock time
+        read_at = read_at.astimezone(timezone.utc).replace(tzinfo=None)
+    tags = list(dict.fromkeys(tag for tag in tags if tag))
+    if tags:
+        db.execute(SAVE_READ, [{"count_id": count_id, "rfid_tag": tag, "zone": zone, "read_at": read_at}
+                               for tag in tags])
+        # The insert holds the write lock: a close that won the race shows here
+        try:
+            _require_open(db, count_id)
+        except CycleCountConflict:
+            db.rollback()
+            raise
+        db.commit()
+    return {"accepted": len(tags), "reads": db.execute(READS, {"count_id": count_id}).scalar()}
+
+def _finish(db: Session, count_id: int, status: str, now: datetime) -> datetime:
+    # Compare-and-swap from open, so a session is closed or cancelled exactly once
+    opened_at = db.execute(update(_counts).where(
+        _counts.c.id == count_id, _counts.c.status == "open"
+    ).values(status=status, closed_at=now).returning(_counts.c.created_at)).scalar()
+    if opened_at is None:
+        db.rollback()
+        _require_open(db, count_id)
+        raise CycleCountConflict(f"Cycle count {count_id} is no longer open")
+    return opened_at
+
+def close(db: Session, count_id: int, now: datetime = None) -> dict:
+    # Reconciles the reads and applies the corrections in one transaction
+    now = now or datetime.utcnow()
+    opened_at = _finish(db, count_id, "closed", now)
+    params = {"count_id": count_id}
+    found = db.execute(FOUND, params).scalar()
+    for statement in (ADD_MISPLACED, ADD_UNEXPECTED):
+        db.execute(statement, params)
+    db.execute(ADD_MISSING, {**params, "opened_at": opened_at})
+
+    moves = db.execute(MOVES, params).all()
+    db.execute(LOG_MOVES, {**params, "scanned_by": f"cycle_count:{count_id}"})
+    db.execute(APPLY_READS, params)
+    for from_zone, to_zone, product_id, status, count in moves:
+        stats.items_moved(db, from_zone, to_zone, status, count)
+        zones.items_moved(db, product_id, from_zone, to_zone, status, count)
+    db.execute(MARK_FOUND, {**params, "now": now})
+    db.execute(RAISE_MISSING, {**params, "now": now})
+
+    outcomes = Counter(dict(db.execute(OUTCOME_COUNTS, params).all()))
+    db.execute(update(_counts).where(_counts.c.id == count_id).values(
+        found=found, **{outcome: outcomes[outcome] for outcome in OUTCOMES}
+    ))
+    db.commit()
+    return get(db, count_id)
+
+def cancel(db: Session, count_id: int) -> dict:
+    # Drops the session without touching inventory
+    _finish(db, count_id, "cancelled", datetime.utcnow())
+    db.execute(_reads.delete().where(_reads.c.count_id == count_id))
+    db.commit()
+    return get(db, count_id)
+
+def get(db: Session, count_id: int):
+    row = db.execute(select(_counts).where(_counts.c.id == count_id)).first()
+    if row is None:
+        return None
+    count_zones = db.execute(COUNT_ZONES, {"count_id": count_id}).scalars().all()
+    expected = dict(db.execute(EXPECTED_BY_ZONE, {"zones": count_zones}).all())
+    return {
+        **row._asdict(),
+        "zones": [{"zone": zone, "expected": expected.get(zone, 0)} for zone in count_zones],
+        "reads": db.execute(READS, {"count_id": count_id}).scalar(),
+    }
+
+def variances_page(db: Session, count_id: int, outcome: str = None, after: str = "", limit: int = 100):
+    # Keyset pages in tag order; after is the previous page's last tag
+    stmt = VARIANCES_PAGE
+    if outcome is not None:
+        stmt = stmt.where(_variances.c.outcome == outcome)
+    return db.execute(stmt, {"count_id": count_id, "after": after, "limit": limit}).all()
@@ -1,27 +1,118 @@
 ﻿import os
-from sqlalchemy import create_engine
+import re
+import threading
+from fastapi import HTTPException, Request
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
+from . import metrics, querywatch
 
 # Create database directory if it doesn't exist
 db_dir = Path(__file__).parent.parent / "data"
 db_dir.mkdir(exist_ok=True)
 db_path = db_dir / "wms.db"
-DATABASE_URL = f"sqlite:///{db_path}"
+# WMS_DATABASE_URL points the API at another database (benchmarks, capacity tests)
+DATABASE_URL = os.getenv("WMS_DATABASE_URL", f"sqlite:///{db_path}")
+if DATABASE_URL.startswith("sqlite:///"):
+    db_path = Path(DATABASE_URL[len("sqlite:///"):])
 
-# SQLite specific configuration
-engine = create_engine(
-    DATABASE_URL, 
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+# Sync handlers run on the 40-thread default threadpool; with at least that many
+# connections a thread holding a request can always check one out
+POOL_SIZE = int(os.getenv("WMS_DB_POOL_SIZE", "20"))
+MAX_OVERFLOW = int(os.getenv("WMS_DB_MAX_OVERFLOW", "30"))
+# How long a writer waits on another worker's write lock before failing
+BUSY_TIMEOUT_MS = int(os.getenv("WMS_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+# Database per site. WMS_SITES="north,south" partitions the warehouse by site: each
+# site keeps its rows in a SQLite file of its own, so one site's writers never wait on
+# another site's write lock and no query can reach another site's rows. The default
+# site stays on DATABASE_URL and the others follow WMS_SITE_DATABASE_URL. Without
+# WMS_SITES there is a single site on DATABASE_URL.
+SITE_HEADER = "X-WMS-Site"
+SITES = [site.strip() for site in os.getenv("WMS_SITES", "").split(",") if site.strip()]
+DEFAULT_SITE = os.getenv("WMS_DEFAULT_SITE") or (SITES[0] if SITES else "main")
+SITES = SITES or [DEFAULT_SITE]
+SITE_DATABASE_URL = os.getenv("WMS_SITE_DATABASE_URL", f"sqlite:///{db_path.parent}/wms-{{site}}.db")
+for _site in SITES:
+    # Site keys end up in file names and metric labels
+    if not re.fullmatch(r"[A-Za-z0-9_-]+", _site):
+        raise RuntimeError(f"Invalid site key in WMS_SITES: {_site!r}")
+if DEFAULT_SITE not in SITES:
+    raise RuntimeError(f"WMS_DEFAULT_SITE {DEFAULT_SITE!r} is not in WMS_SITES")
+
+def site_url(site: str) -> str:
+    return DATABASE_URL if site == DEFAULT_SITE else SITE_DATABASE_URL.format(site=site)
+
+def site_path(site: str) -> Path:
+    # The site's SQLite file
+    url = site_url(site)
+    return Path(url[len("sqlite:///"):]) if url.startswith("sqlite:///") else db_path
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets every worker read while one writes; NORMAL is durable in WAL mode
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+def _make_engine(url: str, site: str = None):
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if url.startswith("sqlite") else {},  # Needed for SQLite
+        poolclass=metrics.TimedQueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW
+    )
+    metrics.instrument_engine(engine, site)
+    # Every site's engine, so N+1 and slow query detection covers X-WMS-Site requests too
+    if querywatch.ENABLED:
+        querywatch.install(engine)
+    if url.startswith("sqlite"):
+        event.listen(engine, "connect", _sqlite_pragmas)
+    # Pooled connections must not cross a fork (gunicorn --preload, multiprocessing):
+    # the child drops the inherited ones without closing the parent's
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
+    return engine
+
+# The default site; scripts and jobs that know nothing of sites use these
+engine = _make_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+_site_sessions = {DEFAULT_SITE: SessionLocal}
+_site_sessions_lock = threading.Lock()
+
+def site_sessionmaker(site: str) -> sessionmaker:
+    # Engines of the other sites are opened on first use, one pool per site
+    factory = _site_sessions.get(site)
+    if factory is None:
+        if site not in SITES:
+            raise LookupError(f"Unknown site: {site}")
+        with _site_sessions_lock:
+            factory = _site_sessions.get(site)
+            if factory is None:
+                factory = sessionmaker(autocommit=False, autoflush=False,
+                                       bind=_make_engine(site_url(site), site))
+                _site_sessions[site] = factory
+    return factory
+
+def site_engine(site: str):
+    return site_sessionmaker(site).kw["bind"]
+
 Base = declarative_base()
 
+def request_site(request: Request) -> str:
+    # The X-WMS-Site header or ?site= picks the site; requests without either go to DEFAULT_SITE
+    site = request.headers.get(SITE_HEADER) or request.query_params.get("site") or DEFAULT_SITE
+    if site not in SITES:
+        raise HTTPException(status_code=404, detail=f"Unknown site: {site}")
+    return site
+
 # Dependency to get DB session
-def get_db():
-    db = SessionLocal()
+def get_db(request: Request):
+    db = site_sessionmaker(request_site(request))()
     try:
         yield db
     finally:
@@ -0,0 +1,195 @@
+"""
+Zone flow: dwell-time distributions per zone and a zone -> zone transition matrix,
+folded incrementally from the transaction log.
+
+Each pass reads the transactions after the job_state watermark in id order, so
+history is never read twice. It keeps three compact tables:
+
+- flow_tag_positions: where each tag is and since when.
+- dwell_histogram: finished visits per zone in log-spaced buckets. Quantiles read
+  from it are within RELATIVE_ACCURACY of the exact value, and the number of
+  buckets per zone stays in the hundreds however many visits are added.
+- zone_transitions: moves per (from_zone, to_zone).
+
+A visit ends when a tag is next seen in a different zone. Rescans in the same zone
+extend the visit.
+
+Run from the backend directory to catch up after a bulk load:
+    python -m app.flow
+"""
+import math
+import os
+from collections import Counter, defaultdict
+from sqlalchemy import Integer, bindparam, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from . import coordination, jobs, models
+
+JOB_NAME = "zone_flow"
+LEASE_NAME = "zone_flow"
+BATCH_SIZE = int(os.getenv("WMS_FLOW_BATCH_SIZE", "5000"))
+# Transactions one API request folds in before answering; a larger backlog is
+# worked off over the following requests or with "python -m app.flow"
+REQUEST_BUDGET = int(os.getenv("WMS_FLOW_REQUEST_BUDGET", "200000"))
+RELATIVE_ACCURACY = 0.02
+QUANTILES = (0.5, 0.9, 0.99)
+
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+_transactions = models.Transaction.__table__
+_positions = models.FlowTagPosition.__table__
+_histogram = models.DwellHistogram.__table__
+_transitions = models.ZoneTransition.__table__
+
+NEW_TRANSACTIONS = select(
+    _transactions.c.id, _transactions.c.rfid_tag, _transactions.c.location, _transactions.c.created_at
+).where(_transactions.c.id > bindparam("after")).order_by(_transactions.c.id).limit(
+    bindparam("limit", type_=Integer)
+)
+
+POSITIONS = select(_positions.c.rfid_tag, _positions.c.zone, _positions.c.arrived_at).where(
+    _positions.c.rfid_tag.in_(bindparam("tags", expanding=True))
+)
+
+def _upsert(table, keys, set_columns):
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(index_elements=keys, set_=set_columns(stmt))
+
+SAVE_POSITION = _upsert(_positions, ["rfid_tag"], lambda stmt: {
+    "zone": stmt.excluded.zone, "arrived_at": stmt.excluded.arrived_at
+})
+ADD_DWELL = _upsert(_histogram, ["zone", "bucket"], lambda stmt: {
+    "visits": _histogram.c.visits + stmt.excluded.visits,
+    "total_seconds": _histogram.c.total_seconds + stmt.excluded.total_seconds,
+})
+ADD_MOVES = _upsert(_transitions, ["from_zone", "to_zone"], lambda stmt: {
+    "moves": _transitions.c.moves + stmt.excluded.moves
+})
+
+def bucket_of(seconds: float) -> int:
+    # Bucket i holds dwell times in (gamma^(i-1), gamma^i] seconds; 0 holds a second or less
+    if seconds <= 1:
+        return 0
+    return math.ceil(math.log(seconds) / _LOG_GAMMA)
+
+def bucket_value(bucket: int) -> float:
+    # The point of the bucket with the same relative error to both of its edges
+    if bucket <= 0:
+        return 0.5
+    return 2 * _GAMMA ** bucket / (_GAMMA + 1)
+
+def _fold(db: Session, rows):
+    positions = {tag: (zone, at) for tag, zone, at in db.execute(
+        POSITIONS, {"tags": list({row.rfid_tag for row in rows if row.rfid_tag})}
+    )}
+    dwell = defaultdict(lambda: [0, 0.0])
+    moves = Counter()
+    changed = {}
+    for _, tag, location, at in rows:
+        if not tag or not location or at is None:
+            continue
+        from_zone, arrow, to_zone = location.partition(" -> ")
+        if not arrow:
+            to_zone = from_zone
+        current = positions.get(tag)
+        if current is None:
+            # First sighting: the arrival in from_zone was never seen, so no dwell time
+            if arrow and from_zone != to_zone:
+                moves[(from_zone, to_zone)] += 1
+        elif current[0] != to_zone:
+            seconds = max((at - current[1]).total_seconds(), 0.0)
+            visits = dwell[(current[0], bucket_of(seconds))]
+            visits[0] += 1
+            visits[1] += seconds
+            moves[(current[0], to_zone)] += 1
+        else:
+            continue
+        positions[tag] = changed[tag] = (to_zone, at)
+
+    if changed:
+        db.execute(SAVE_POSITION, [{"rfid_tag": tag, "zone": zone, "arrived_at": at}
+                                   for tag, (zone, at) in changed.items()])
+    if dwell:
+        db.execute(ADD_DWELL, [{"zone": zone, "bucket": bucket, "visits": visits, "total_seconds": seconds}
+                               for (zone, bucket), (visits, seconds) in dwell.items()])
+    if moves:
+        db.execute(ADD_MOVES, [{"from_zone": from_zone, "to_zone": to_zone, "moves": count}
+                               for (from_zone, to_zone), count in moves.items()])
+
+def update(db: Session, max_rows: int = None) -> int:
+    # Fold transactions after the watermark, one committed batch at a time; returns rows read
+    done = 0
+    while max_rows is None or done < max_rows:
+        after = jobs.get_watermark(db, JOB_NAME)
+        rows = db.execute(NEW_TRANSACTIONS, {"after": after, "limit": BATCH_SIZE}).all()
+        if not rows:
+            break
+        # Claim the batch first: one that another pass folded meanwhile is not folded again
+        if not jobs.advance_watermark(db, JOB_NAME, after, rows[-1].id):
+            db.rollback()
+            continue
+        _fold(db, rows)
+        db.commit()
+        done += len(rows)
+    return done
+
+def catch_up(db: Session, max_rows: int = REQUEST_BUDGET) -> int:
+    # Only one worker folds at a time; the others answer from the rollups as they are
+    token = coordination.try_acquire(db, LEASE_NAME, 120)
+    if token is None:
+        return 0
+    try:
+        return update(db, max_rows)
+    finally:
+        coordination.release(db, LEASE_NAME, token)
+
+def _quantiles(buckets) -> dict:
+    # buckets: (bucket, visits) in bucket order
+    total = sum(visits for _, visits in buckets)
+    ranks = [(q, q * (total - 1)) for q in QUANTILES]
+    result, seen = {}, 0
+    for bucket, visits in buckets:
+        seen += visits
+        while ranks and ranks[0][1] < seen:
+            result[ranks.pop(0)[0]] = bucket_value(bucket)
+    return result
+
+def summary(db: Session) -> dict:
+    zones = defaultdict(list)
+    totals = Counter()
+    for zone, bucket, visits, seconds in db.execute(select(
+        _histogram.c.zone, _histogram.c.bucket, _histogram.c.visits, _histogram.c.total_seconds
+    ).order_by(_histogram.c.zone, _histogram.c.bucket)):
+        zones[zone].append((bucket, visits))
+        totals[zone] += seconds
+    dwell = []
+    for zone, buckets in zones.items():
+        visits = sum(count for _, count in buckets)
+        quantiles = _quantiles(buckets)
+        dwell.append({
+            "zone": zone,
+            "visits": visits,
+            "mean_hours": totals[zone] / visits / 3600,
+            **{f"p{round(q * 100)}_hours": quantiles[q] / 3600 for q in QUANTILES},
+        })
+    transitions = db.execute(select(
+        _transitions.c.from_zone, _transitions.c.to_zone, _transitions.c.moves
+    ).order_by(_transitions.c.moves.desc())).all()
+    watermark = jobs.get_watermark(db, JOB_NAME)
+    return {
+        "last_transaction_id": watermark,
+        "pending_transactions": max(jobs.latest_transaction_id(db) - watermark, 0),
+        "dwell": dwell,
+        "transitions": [{"from_zone": f, "to_zone": t, "moves": m} for f, t, m in transitions],
+    }
+
+if __name__ == "__main__":
+    import argparse
+    from .database import DEFAULT_SITE, SITES, site_sessionmaker
+    parser = argparse.ArgumentParser(description="Fold new transactions into the zone flow rollups")
+    parser.add_argument("--site", choices=SITES, default=DEFAULT_SITE)
+    args = parser.parse_args()
+    with site_sessionmaker(args.site)() as db:
+        # Under the lease, so a running API never folds the same range at the same time
+        print(f"Folded {catch_up(db, None):,} transactions into the zone flow rollups")
@@ -0,0 +1,187 @@
+﻿import threading
+from datetime import date, datetime, timedelta
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from . import jobs, models, queries
+from .rollups import FROM_ZONE_SQL, TO_ZONE_SQL
+
+JOB_NAME = "demand_daily"
+
+# A unit leaves the warehouse when it is shipped or scanned into an outbound zone
+OUTBOUND_ACTIONS = ("SHIPPED",)
+OUTBOUND_ZONE_KEYWORDS = ("Shipping", "Outbound", "Dispatch")
+
+SES_ALPHAS = np.array([0.05, 0.1, 0.2, 0.3, 0.5])
+CROSTON_ALPHA = 0.1
+# Syntetos-Boylan cut-off: average inter-demand interval above this is intermittent
+INTERMITTENT_ADI = 1.32
+Z_95 = 1.96
+
+def _zone_matches(zone_sql: str) -> str:
+    return "(" + " OR ".join(f"{zone_sql} LIKE '%{k}%'" for k in OUTBOUND_ZONE_KEYWORDS) + ")"
+
+def update_demand(db: Session) -> int:
+    # Fold transactions newer than the watermark into demand_daily; returns the new watermark
+    while True:
+        after = jobs.get_watermark(db, JOB_NAME)
+        upto = jobs.latest_transaction_id(db)
+        if upto <= after:
+            return after
+        # Claimed under the write lock: a range another request folded meanwhile is skipped
+        if jobs.advance_watermark(db, JOB_NAME, after, upto):
+            break
+        db.rollback()
+
+    actions = ", ".join(f"'{a}'" for a in OUTBOUND_ACTIONS)
+    db.execute(text(f"""
+        INSERT INTO demand_daily (day, product_id, quantity)
+        SELECT date(t.created_at), t.product_id, COUNT(*)
+        FROM transactions t
+        WHERE t.id > :after AND t.id <= :upto
+              AND t.product_id IS NOT NULL AND t.created_at IS NOT NULL
+              AND (t.action IN ({actions})
+                   OR (t.action = 'SCANNED'
+                       AND {_zone_matches(TO_ZONE_SQL)}
+                       AND NOT {_zone_matches(FROM_ZONE_SQL)}))
+        GROUP BY 1, 2
+        ON CONFLICT (day, product_id) DO UPDATE SET quantity = quantity + excluded.quantity
+    """), {"after": after, "upto": upto})
+    db.commit()
+    return upto
+
+def load_demand_matrix(db: Session, product_ids: np.ndarray, start: date, days: int) -> np.ndarray:
+    # Products x days matrix of outbound units, zero where nothing shipped
+    matrix = np.zeros((len(product_ids), days))
+    rows = db.query(
+        models.DemandDaily.product_id, models.DemandDaily.day, models.DemandDaily.quantity
+    ).filter(models.DemandDaily.day >= start).all()
+    if not rows or not len(product_ids):
+        return matrix
+    pids, row_days, quantities = (np.array(column) for column in zip(*rows))
+    # product_ids is sorted, so rows map to matrix rows by binary search
+    row_index = np.minimum(np.searchsorted(product_ids, pids), len(product_ids) - 1)
+    col_index = np.array([(d - start).days for d in row_days])
+    keep = (product_ids[row_index] == pids) & (col_index >= 0) & (col_index < days)
+    np.add.at(matrix, (row_index[keep], col_index[keep]), quantities[keep])
+    return matrix
+
+def fit_ses(Y: np.ndarray):
+    # Simple exponential smoothing for every product and every alpha in one pass over days
+    P, D = Y.shape
+    A = len(SES_ALPHAS)
+    alphas = SES_ALPHAS[:, None]
+    level = np.broadcast_to(Y[:, :min(7, D)].mean(axis=1), (A, P)).copy()
+    sse = np.zeros((A, P))
+    for t in range(D):
+        err = Y[:, t] - level
+        sse += err ** 2
+        level += alphas * err
+    best = sse.argmin(axis=0)
+    cols = np.arange(P)
+    sigma = np.sqrt(sse[best, cols] / max(D - 1, 1))
+    return level[best, cols], SES_ALPHAS[best], sigma
+
+def fit_croston(Y: np.ndarray):
+    # Croston with the Syntetos-Boylan bias correction, vectorized over products
+    P, D = Y.shape
+    nonzero = Y > 0
+    counts = nonzero.sum(axis=1)
+    size = np.where(counts > 0, Y.sum(axis=1) / np.maximum(counts, 1), 0.0)
+    interval = np.where(counts > 0, D / np.maximum(counts, 1), 1.0)
+    since = np.ones(P)
+    sse = np.zeros(P)
+    a = CROSTON_ALPHA
+    for t in range(D):
+        forecast = (1 - a / 2) * size / interval
+        sse += (Y[:, t] - forecast) ** 2
+        hit = nonzero[:, t]
+        size = np.where(hit, size + a * (Y[:, t] - size), size)
+        interval = np.where(hit, interval + a * (since - interval), interval)
+        since = np.where(hit, 1.0, since + 1.0)
+    forecast = (1 - a / 2) * size / interval
+    sigma = np.sqrt(sse / max(D - 1, 1))
+    return forecast, sigma
+
+def forecast_matrix(Y: np.ndarray):
+    # Pick SES or Croston per product from its demand pattern since its first demand
+    P, D = Y.shape
+    nonzero = Y > 0
+    demand_days = nonzero.sum(axis=1)
+    active_days = D - np.where(demand_days > 0, nonzero.argmax(axis=1), D)
+    adi = np.where(demand_days > 0, active_days / np.maximum(demand_days, 1), np.inf)
+    intermittent = (adi > INTERMITTENT_ADI) & (demand_days > 0)
+
+    ses_level, ses_alpha, ses_sigma = fit_ses(Y)
+    cro_level, cro_sigma = fit_croston(Y)
+
+    daily = np.where(intermittent, cro_level, ses_level).clip(min=0)
+    sigma = np.where(intermittent, cro_sigma, ses_sigma)
+    alpha = np.where(intermittent, CROSTON_ALPHA, ses_alpha)
+    model = np.where(demand_days == 0, "none", np.where(intermittent, "croston", "ses"))
+    daily[demand_days == 0] = 0.0
+    sigma[demand_days == 0] = 0.0
+    return daily, sigma, alpha, model
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+def get_forecast(db: Session, horizon: int = 30, history_days: int = 180):
+    watermark = update_demand(db)
+    today = datetime.utcnow().date()
+    # Per database: each site's watermark counts its own transactions
+    key = (str(db.get_bind().url), horizon, history_days)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == (watermark, today):
+            return cached[1]
+
+    products = db.query(
+        models.Product.id, models.Product.sku, models.Product.name
+    ).order_by(models.Product.id).all()
+    stock = queries.stock_counts(db)
+
+    product_ids = np.array([p[0] for p in products], dtype=np.int64)
+    start = today - timedelta(days=history_days)
+    Y = load_demand_matrix(db, product_ids, start, history_days)
+    daily, sigma, alpha, model = forecast_matrix(Y)
+
+    # Interval width grows with the horizon: sigma_h = sigma * sqrt(1 + (h - 1) * alpha^2)
+    steps = np.arange(1, horizon + 1)
+    sigma_h = sigma[:, None] * np.sqrt(1 + (steps[None, :] - 1) * alpha[:, None] ** 2)
+    total_sigma = np.sqrt((sigma_h ** 2).sum(axis=1))
+    warehouse = daily.sum()
+    warehouse_sigma = np.sqrt((sigma_h ** 2).sum(axis=0))
+
+    result = {
+        "generated_at": datetime.utcnow(),
+        "horizon": horizon,
+        "history_days": history_days,
+        "products": [
+            {
+                "product_id": int(pid),
+                "sku": sku,
+                "name": name,
+                "model": str(model[i]),
+                "current_quantity": stock.get(pid, 0),
+                "daily_forecast": round(float(daily[i]), 3),
+                "horizon_total": round(float(daily[i] * horizon), 2),
+                "horizon_lower": round(max(0.0, float(daily[i] * horizon - Z_95 * total_sigma[i])), 2),
+                "horizon_upper": round(float(daily[i] * horizon + Z_95 * total_sigma[i]), 2),
+                "days_of_cover": round(stock.get(pid, 0) / daily[i], 1) if daily[i] > 0 else None,
+            }
+            for i, (pid, sku, name) in enumerate(products)
+        ],
+        "daily": [
+            {
+                "date": (today + timedelta(days=int(h))).isoformat(),
+                "forecast": round(float(warehouse), 2),
+                "lower": round(max(0.0, float(warehouse - Z_95 * warehouse_sigma[h - 1])), 2),
+                "upper": round(float(warehouse + Z_95 * warehouse_sigma[h - 1]), 2),
+            }
+            for h in steps
+        ],
+    }
+    with _cache_lock:
+        _cache[key] = ((watermark, today), result)
+    return result
@@ -0,0 +1,110 @@
+﻿import hashlib
+import io
+import json
+import os
+from datetime import date, datetime
+from typing import Optional, Sequence
+import msgpack
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+PARQUET = "application/vnd.apache.parquet"
+MSGPACK = "application/x-msgpack"
+
+# Point lookups may be reused this long before the client revalidates with If-None-Match
+LOOKUP_MAX_AGE_SECONDS = int(os.getenv("WMS_LOOKUP_MAX_AGE_SECONDS", "5"))
+
+# Accept header values that select a columnar body instead of JSON
+_COLUMNAR = {
+    ARROW_STREAM: ARROW_STREAM,
+    MSGPACK: MSGPACK,
+    "application/msgpack": MSGPACK,
+}
+
+# Every body of a negotiated route, JSON included, depends on Accept; shared caches must key on it
+VARY_ACCEPT = {"Vary": "Accept"}
+
+def negotiate(request: Request) -> Optional[str]:
+    # Highest-q supported columnar type, or None to keep the JSON response
+    best, best_q = None, 0.0
+    json_q = 0.0
+    for part in request.headers.get("accept", "").split(","):
+        media_type, _, params = part.strip().partition(";")
+        media_type = media_type.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in _COLUMNAR and q > best_q:
+            best, best_q = _COLUMNAR[media_type], q
+        elif media_type in ("application/json", "*/*", "application/*"):
+            json_q = max(json_q, q)
+    return best if best and best_q >= json_q else None
+
+def to_arrow_stream(table: pa.Table) -> bytes:
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+def to_parquet(table: pa.Table) -> bytes:
+    sink = io.BytesIO()
+    pq.write_table(table, sink)
+    return sink.getvalue()
+
+def _isoformat_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+class FastJSONResponse(JSONResponse):
+    # Opt-in per route: orjson when installed, compact stdlib json otherwise
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(
+            content, default=_isoformat_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match", "")
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return header.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+def validated_json(request: Request, content, max_age: int = LOOKUP_MAX_AGE_SECONDS) -> Response:
+    # JSON with a content-hash ETag; a client sending it back gets 304 and no body
+    body = FastJSONResponse(content).body
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"max-age={max_age}, must-revalidate"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+def json_rows(fields: Sequence[str], rows, headers: dict = None) -> FastJSONResponse:
+    # Rows already match the route's response_model, so FastAPI's per-item validation is skipped
+    return FastJSONResponse([dict(zip(fields, row)) for row in rows], headers=headers)
+
+def columns_from_rows(fields: Sequence[str], rows) -> dict:
+    if not rows:
+        return {field: [] for field in fields}
+    return dict(zip(fields, map(list, zip(*rows))))
+
+def columnar_response(columns: dict, media_type: str) -> Response:
+    # columns maps field name -> list of values, all the same length
+    if media_type == ARROW_STREAM:
+        body = to_arrow_stream(pa.table(columns))
+    else:
+        body = msgpack.packb(columns, default=_isoformat_default)
+    return Response(body, media_type=media_type, headers=VARY_ACCEPT)
@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from sqlalchemy import func, select, text
+from . import metrics, migrate, models
+from .database import DATABASE_URL, DEFAULT_SITE, SITES, site_engine, site_path
+
+# Checks are recomputed at most this often; probes in between read the snapshot
+CHECK_TTL_SECONDS = float(os.getenv("WMS_HEALTH_TTL_SECONDS", "2"))
+STATUS_TTL_SECONDS = float(os.getenv("WMS_STATUS_TTL_SECONDS", "10"))
+# Above these the service still answers but reports itself degraded
+WAL_WARN_BYTES = int(os.getenv("WMS_WAL_WARN_MB", "256")) * 1024 * 1024
+INGEST_QUEUE_WARN = int(os.getenv("WMS_INGEST_QUEUE_WARN", "50"))
+WRITE_LATENCY_WARN_MS = float(os.getenv("WMS_WRITE_LATENCY_WARN_MS", "250"))
+
+STARTED_AT = time.time()
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+def _cached(name: str, ttl: float, compute):
+    # One caller recomputes while the others wait for its result instead of piling onto the DB
+    with _cache_lock:
+        hit = _cache.get(name)
+        if hit is None or time.monotonic() - hit[0] >= ttl:
+            hit = (time.monotonic(), compute())
+            _cache[name] = hit
+        return hit[1]
+
+def _ms(began: float) -> float:
+    return round((time.perf_counter() - began) * 1000, 2)
+
+def _check_database(engine):
+    began = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            # Newest row by primary key: an index seek, not a scan
+            last_scan = conn.execute(
+                select(models.Transaction.created_at).order_by(models.Transaction.id.desc()).limit(1)
+            ).scalar()
+        return {"ok": True, "latency_ms": _ms(began), "last_scan_at": last_scan}
+    except Exception as e:
+        return {"ok": False, "latency_ms": _ms(began), "error": str(e), "last_scan_at": None}
+
+def _check_write(engine):
+    # Time to take the SQLite write lock: what every scan commit waits for
+    if not IS_SQLITE:
+        return {"ok": True, "latency_ms": None}
+    began = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            raw = conn.connection.dbapi_connection
+            raw.execute("BEGIN IMMEDIATE")
+            raw.execute("ROLLBACK")
+        latency = _ms(began)
+        return {"ok": True, "latency_ms": latency, "degraded": latency > WRITE_LATENCY_WARN_MS}
+    except Exception as e:
+        return {"ok": False, "latency_ms": _ms(began), "error": str(e)}
+
+def _wal_size(path: Path):
+    wal = Path(f"{path}-wal")
+    size = wal.stat().st_size if IS_SQLITE and wal.exists() else 0
+    return {"bytes": size, "degraded": size > WAL_WARN_BYTES}
+
+def _site_checks(site: str) -> dict:
+    engine = site_engine(site)
+    database = _check_database(engine)
+    return {
+        "database": database,
+        "write": _check_write(engine),
+        "wal": _wal_size(site_path(site)),
+        "last_scan_at": database.pop("last_scan_at"),
+    }
+
+def _run_checks():
+    # Every site's database; the top-level checks are the default site's
+    sites = {site: _site_checks(site) for site in SITES}
+    return {**sites[DEFAULT_SITE], "sites": sites, "checked_at": time.time()}
+
+def readiness():
+    checks = _cached("checks", CHECK_TTL_SECONDS, _run_checks)
+    queue_depth = metrics.ingest_queue_depth()
+    # Ready follows the default site. Another site's trouble degrades the worker but
+    # does not take it out of rotation, where it could not serve the healthy sites either
+    ready = checks["database"]["ok"] and checks["write"]["ok"]
+    # Recorded once by migrate.check() at startup
+    schema = migrate.status
+    sites = {site: _site_degraded(checks["sites"][site], migrate.site_status.get(site, {})) for site in SITES}
+    degraded = queue_depth > INGEST_QUEUE_WARN or any(sites.values())
+    result = {
+        "status": "down" if not ready else "degraded" if degraded else "ok",
+        "ready": ready,
+        "checks": {
+            "database": checks["database"],
+            "write": checks["write"],
+            "wal": checks["wal"],
+            "ingest_queue": {"depth": queue_depth, "degraded": queue_depth > INGEST_QUEUE_WARN},
+            "schema": schema,
+            "last_scan": _last_scan(checks["last_scan_at"]),
+        },
+        "checked_age_seconds": round(time.time() - checks["checked_at"], 2),
+    }
+    if len(SITES) > 1:
+        result["checks"]["sites"] = {site: {
+            **{name: checks["sites"][site][name] for name in ("database", "write", "wal")},
+            "schema": migrate.site_status.get(site, {}),
+            "degraded": sites[site],
+        } for site in SITES}
+    return result
+
+def _last_scan(at):
+    return {
+        "at": at.isoformat() if at else None,
+        # Timestamps are stored as naive UTC
+        "age_seconds": round((datetime.utcnow() - at).total_seconds()) if at else None,
+    }
+
+def _site_degraded(checks: dict, schema: dict) -> bool:
+    return bool(not checks["database"]["ok"] or not checks["write"]["ok"]
+                or checks["wal"]["degraded"] or checks["write"].get("degraded")
+                or schema.get("pending") or schema.get("drift"))
+
+def _counts(site: str):
+    with site_engine(site).connect() as conn:
+        return {
+            "products": conn.execute(select(func.count()).select_from(models.Product)).scalar(),
+            "in_stock_items": conn.execute(
+                select(func.count()).select_from(models.InventoryItem)
+                .where(models.InventoryItem.status == "in_stock")
+            ).scalar(),
+            "pending_alerts": conn.execute(
+                select(func.count()).select_from(models.ReorderAlert)
+                .where(models.ReorderAlert.status == "pending")
+            ).scalar(),
+        }
+
+def status_summary(site: str = DEFAULT_SITE):
+    # What status widgets need in one call, instead of /health followed by /levels
+    ready = readiness()
+    counts = _cached(f"counts:{site}", STATUS_TTL_SECONDS, lambda: _counts(site)) if ready["ready"] else {}
+    last_scan = _last_scan(_cached("checks", CHECK_TTL_SECONDS, _run_checks)["sites"][site]["last_scan_at"])
+    return {
+        "status": ready["status"],
+        "products": counts.get("products", 0),
+        "in_stock_items": counts.get("in_stock_items", 0),
+        "pending_alerts": counts.get("pending_alerts", 0),
+        "last_scan_at": last_scan["at"],
+        "last_scan_age_seconds": last_scan["age_seconds"],
+        "ingest_queue_depth": ready["checks"]["ingest_queue"]["depth"],
+        "uptime_seconds": round(time.time() - STARTED_AT),
+    }
@@ -0,0 +1,46 @@
+﻿from datetime import datetime
+from sqlalchemy import func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from . import models
+
+def get_watermark(db: Session, name: str) -> int:
+    state = db.get(models.JobState, name)
+    return state.last_transaction_id if state else 0
+
+def set_watermark(db: Session, name: str, last_transaction_id: int):
+    state = db.get(models.JobState, name)
+    if state is None:
+        state = models.JobState(name=name)
+        db.add(state)
+    state.last_transaction_id = last_transaction_id
+    state.updated_at = datetime.utcnow()
+
+def advance_watermark(db: Session, name: str, expected: int, last_transaction_id: int) -> bool:
+    # Compare-and-swap: moves the watermark only if it still reads `expected`. The write
+    # takes the database write lock, so of two passes that read the same watermark only
+    # one claims the batch; the loser rolls back and reads the watermark again
+    table = models.JobState.__table__
+    now = datetime.utcnow()
+    if expected == 0:
+        db.execute(sqlite_insert(table).values(name=name, last_transaction_id=0, updated_at=now)
+                   .on_conflict_do_nothing(index_elements=["name"]))
+    result = db.execute(update(table).where(
+        table.c.name == name, table.c.last_transaction_id == expected
+    ).values(last_transaction_id=last_transaction_id, updated_at=now))
+    return result.rowcount == 1
+
+def get_last_run(db: Session, name: str):
+    # Time-based jobs keep their watermark in updated_at: the "now" of their last completed run
+    state = db.get(models.JobState, name)
+    return state.updated_at if state else None
+
+def set_last_run(db: Session, name: str, at: datetime):
+    state = db.get(models.JobState, name)
+    if state is None:
+        state = models.JobState(name=name, last_transaction_id=0)
+        db.add(state)
+    state.updated_at = at
+
+def latest_transaction_id(db: Session) -> int:
+    return db.query(func.max(models.Transaction.id)).scalar() or 0
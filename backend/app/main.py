@@ -1,21 +1,42 @@
-﻿from fastapi import FastAPI
+﻿import asyncio
+import os
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .database import engine, Base
-from .routers import scans, inventory
+from fastapi.responses import PlainTextResponse
+from . import alerts, metrics, migrate, querywatch, stale
+# app.backups is the job; the name backups below is its router
+from . import backups as backup_job
+from .routers import scans, inventory, reports, analytics, forecast, replenishment, health, stats, items, products, zones, reservations, picking, cycle_counts, backups
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create tables
-try:
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created successfully")
-except Exception as e:
-    logger.error(f"Error creating database tables: {e}")
+# Deployments run "python -m app.migrate" once and set WMS_AUTO_MIGRATE=0;
+# a plain "uvicorn app.main:app" still creates the schema on first start
+AUTO_MIGRATE = os.getenv("WMS_AUTO_MIGRATE", "1") == "1"
 
-app = FastAPI(title="Smart WMS API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if AUTO_MIGRATE:
+        try:
+            migrate.upgrade_sites()
+        except Exception as e:
+            logger.error(f"Error migrating database: {e}")
+    # Warns about pending steps or drift from models.py; fatal with WMS_SCHEMA_STRICT=1
+    migrate.check_sites()
+    alert_task = asyncio.create_task(alerts.run_forever()) if alerts.INTERVAL_SECONDS > 0 else None
+    sweep_task = asyncio.create_task(stale.run_forever()) if stale.INTERVAL_SECONDS > 0 else None
+    # Does nothing at a site until its backup schedule is enabled (settings page or WMS_BACKUP_ENABLED)
+    backup_task = asyncio.create_task(backup_job.run_forever()) if backup_job.INTERVAL_SECONDS > 0 else None
+    yield
+    for task in (alert_task, sweep_task, backup_task):
+        if task:
+            task.cancel()
+
+app = FastAPI(title="Smart WMS API", lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -26,9 +47,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency, SQL counts and slow request logging for /metrics
+app.middleware("http")(metrics.track_request)
+if querywatch.ENABLED:
+    # database._make_engine installs the statement listeners on each site's engine
+    app.middleware("http")(querywatch.watch_request)
+
 # Include routers
 app.include_router(scans.router)
 app.include_router(inventory.router)
+app.include_router(reports.router)
+app.include_router(analytics.router)
+app.include_router(forecast.router)
+app.include_router(replenishment.router)
+app.include_router(health.router)
+app.include_router(stats.router)
+app.include_router(items.router)
+app.include_router(products.router)
+app.include_router(zones.router)
+app.include_router(reservations.router)
+app.include_router(picking.router)
+app.include_router(cycle_counts.router)
+app.include_router(backups.router)
 
 @app.get("/")
 async def root():
@@ -37,3 +77,7 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
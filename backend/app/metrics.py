@@ -0,0 +1,200 @@
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers sub-millisecond lookups up to the multi-second report queries
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 500)
+SLOW_REQUEST_SECONDS = float(os.getenv("WMS_SLOW_REQUEST_MS", "500")) / 1000
+# Scans accepted but not yet committed make up the ingestion queue
+INGEST_PATH = "/api/scans/"
+# Statements shown per slow request log line
+SLOW_LOG_STATEMENTS = 5
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            i = len(self.buckets)
+        self.counts[i] += 1
+        self.sum += value
+
+class RequestStats:
+    # SQL work done while serving one request
+    def __init__(self):
+        self.statements = defaultdict(lambda: [0, 0.0])
+
+    @property
+    def query_count(self):
+        return sum(count for count, _ in self.statements.values())
+
+    @property
+    def db_seconds(self):
+        return sum(seconds for _, seconds in self.statements.values())
+
+_current = ContextVar("wms_request_stats", default=None)
+_lock = threading.Lock()
+_histograms = {}
+_counters = defaultdict(int)
+_in_flight = 0
+_ingest_in_flight = 0
+# Instrumented pools by site; None for the default database
+_pools = {}
+
+def ingest_queue_depth() -> int:
+    return _ingest_in_flight
+
+def _observe(name: str, labels: tuple, value: float, buckets=LATENCY_BUCKETS):
+    key = (name, labels)
+    histogram = _histograms.get(key)
+    if histogram is None:
+        histogram = _histograms.setdefault(key, Histogram(buckets))
+    histogram.observe(value)
+
+class TimedQueuePool(QueuePool):
+    # QueuePool that records how long each checkout waited for a free connection
+    def _do_get(self):
+        began = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - began
+            with _lock:
+                _observe("wms_db_pool_checkout_wait_seconds", (), waited)
+
+def instrument_engine(engine, site: str = None):
+    _pools[site] = engine.pool
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("wms_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["wms_query_start"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        with _lock:
+            _counters[("wms_db_statements_total", (("operation", operation),))] += 1
+            _observe("wms_db_statement_duration_seconds", (("operation", operation),), elapsed)
+        stats = _current.get()
+        if stats is not None:
+            entry = stats.statements[statement]
+            entry[0] += 1
+            entry[1] += elapsed
+
+def _slow_request_report(method: str, route: str, status: int, elapsed: float, stats: RequestStats):
+    lines = [
+        f"Slow request {method} {route} -> {status} took {elapsed * 1000:.1f} ms: "
+        f"{stats.query_count} queries, {stats.db_seconds * 1000:.1f} ms in the database"
+    ]
+    heaviest = sorted(stats.statements.items(), key=lambda item: item[1][1], reverse=True)
+    for statement, (count, seconds) in heaviest[:SLOW_LOG_STATEMENTS]:
+        sql = " ".join(statement.split())
+        lines.append(f"  {count}x {seconds * 1000:.1f} ms  {sql[:200]}")
+    return "\n".join(lines)
+
+async def track_request(request, call_next):
+    # HTTP middleware: latency, status, in-flight count and SQL work per route
+    global _in_flight, _ingest_in_flight
+    stats = RequestStats()
+    token = _current.set(stats)
+    ingest = request.method == "POST" and request.url.path == INGEST_PATH
+    with _lock:
+        _in_flight += 1
+        _ingest_in_flight += ingest
+    began = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - began
+        _current.reset(token)
+        route = request.scope.get("route")
+        # Route templates, not raw paths, keep label cardinality bounded
+        path = route.path if route is not None else "unmatched"
+        labels = (("method", request.method), ("route", path))
+        with _lock:
+            _in_flight -= 1
+            _ingest_in_flight -= ingest
+            _counters[("wms_http_requests_total", labels + (("status", str(status)),))] += 1
+            _observe("wms_http_request_duration_seconds", labels, elapsed)
+            _observe("wms_http_request_db_seconds", labels, stats.db_seconds)
+            _observe("wms_http_request_queries", labels, stats.query_count, QUERY_COUNT_BUCKETS)
+        if elapsed >= SLOW_REQUEST_SECONDS:
+            logger.warning(_slow_request_report(request.method, path, status, elapsed, stats))
+
+HELP = {
+    "wms_http_requests_total": ("counter", "HTTP requests by route and status"),
+    "wms_http_request_duration_seconds": ("histogram", "HTTP request latency"),
+    "wms_http_request_db_seconds": ("histogram", "Time spent in SQL per HTTP request"),
+    "wms_http_request_queries": ("histogram", "SQL statements executed per HTTP request"),
+    "wms_http_requests_in_progress": ("gauge", "HTTP requests currently being served"),
+    "wms_ingest_queue_depth": ("gauge", "Scans received and not yet committed"),
+    "wms_db_statements_total": ("counter", "SQL statements by operation"),
+    "wms_db_statement_duration_seconds": ("histogram", "SQL statement latency"),
+    "wms_db_pool_checkout_wait_seconds": ("histogram", "Time waiting for a pooled connection"),
+    "wms_db_pool_checked_out": ("gauge", "Connections currently checked out of the pool"),
+}
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+               for k, v in pairs)
+    return "{" + ",".join(escaped) + "}"
+
+def render() -> str:
+    # Prometheus text exposition format 0.0.4
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: (list(h.buckets), list(h.counts), h.sum) for key, h in _histograms.items()}
+        in_flight = _in_flight
+        ingest_in_flight = _ingest_in_flight
+    gauges = {
+        ("wms_http_requests_in_progress", ()): in_flight,
+        ("wms_ingest_queue_depth", ()): ingest_in_flight,
+    }
+    for site, pool in list(_pools.items()):
+        if hasattr(pool, "checkedout"):
+            gauges[("wms_db_pool_checked_out", (("site", site),) if site else ())] = pool.checkedout()
+
+    lines = []
+    for name, (kind, text) in HELP.items():
+        lines.append(f"# HELP {name} {text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == "counter":
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        elif kind == "gauge":
+            for (metric, labels), value in gauges.items():
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        else:
+            for (metric, labels), (buckets, counts, total) in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(list(buckets) + ["+Inf"], counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
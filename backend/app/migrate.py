@@ -0,0 +1,308 @@
+"""
+Versioned schema migrations.
+
+models.py is the single source of truth for the schema. Each step below
+brings an older database up to it and is recorded in schema_migrations.
+Steps are idempotent, so a step that crashed half-way can simply run again.
+
+    python -m app.migrate            # apply pending steps
+    python -m app.migrate status     # applied / pending steps and drift against models.py
+    python -m app.migrate schema     # CREATE statements for database_schema.sql
+
+With WMS_SITES set, upgrade and status cover every site's database in turn;
+--site picks one.
+"""
+import argparse
+import logging
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from sqlalchemy import CheckConstraint, inspect, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, CreateTable
+from .database import DEFAULT_SITE, SITES, Base, db_path, engine, site_engine
+from . import models, rollups, stats, zones
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process dev server, nothing to serialize
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Rows per backfill transaction: each batch holds the SQLite write lock only briefly
+BACKFILL_BATCH_SIZE = int(os.getenv("WMS_MIGRATE_BATCH_SIZE", "5000"))
+# Pause between batches so scan commits queued behind the lock get their turn
+BACKFILL_PAUSE_SECONDS = float(os.getenv("WMS_MIGRATE_PAUSE_MS", "20")) / 1000
+# Refuse to start when the live schema does not match models.py
+STRICT = os.getenv("WMS_SCHEMA_STRICT", "0") == "1"
+
+MIGRATIONS = []
+# Result of the last check() of the default site, reported by /health/ready
+status = {}
+# The same for every site checked
+site_status = {}
+
+def migration(version: int, name: str, transactional: bool = True):
+    # Transactional steps get a connection inside one transaction; the others get
+    # the engine and commit in batches of their own
+    def register(step):
+        MIGRATIONS.append((version, name, transactional, step))
+        return step
+    return register
+
+def add_column(conn, table: str, column: str):
+    # Adds a column as declared in models.py; new columns must be nullable so
+    # SQLite can add them without rebuilding the table
+    if column in {c["name"] for c in inspect(conn).get_columns(table)}:
+        return
+    declared = Base.metadata.tables[table].c[column]
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {declared.type.compile(conn.dialect)}"))
+
+def create_index(bind, name: str):
+    # Builds an index declared in models.py in its own transaction. SQLite has no
+    # online index build: writers wait on the lock for as long as the build takes
+    index = next(i for table in Base.metadata.tables.values() for i in table.indexes if i.name == name)
+    if name in {i["name"] for i in inspect(bind).get_indexes(index.table.name)}:
+        return
+    began = time.perf_counter()
+    with bind.begin() as conn:
+        index.create(conn)
+    logger.info(f"Built index {name} in {time.perf_counter() - began:.1f}s")
+
+def backfill(bind, table: str, update_sql: str, batch_size: int = BACKFILL_BATCH_SIZE):
+    # Runs update_sql over consecutive id ranges (:low, :high], one short transaction
+    # per range. MAX(id) is re-read each pass, so rows inserted meanwhile are covered
+    low = updated = 0
+    while True:
+        with bind.connect() as conn:
+            last_id = conn.execute(text(f"SELECT MAX(id) FROM {table}")).scalar() or 0
+        if low >= last_id:
+            return updated
+        with bind.begin() as conn:
+            updated += conn.execute(text(update_sql), {"low": low, "high": low + batch_size}).rowcount
+        low += batch_size
+        if low // batch_size % 100 == 0:
+            logger.info(f"Backfilling {table}: {min(low, last_id):,} of {last_id:,} rows")
+        time.sleep(BACKFILL_PAUSE_SECONDS)
+
+@migration(1, "baseline")
+def _baseline(conn):
+    # Creates whatever tables are missing. Databases made by init_db.py or
+    # database_schema.sql already have the four core tables
+    Base.metadata.create_all(conn)
+
+@migration(2, "transactions.product_id", transactional=False)
+def _transaction_product(bind):
+    # Product copied onto each transaction so the incremental jobs skip the join to inventory_items
+    with bind.begin() as conn:
+        add_column(conn, "transactions", "product_id")
+    backfill(bind, "transactions", """
+        UPDATE transactions SET product_id = (
+            SELECT i.product_id FROM inventory_items i WHERE i.rfid_tag = transactions.rfid_tag
+        )
+        WHERE id > :low AND id <= :high AND product_id IS NULL
+    """)
+
+@migration(3, "hot path indexes", transactional=False)
+def _hot_path_indexes(bind):
+    # Recent scans by time, stock counts per product and status, pending alerts
+    create_index(bind, "ix_transactions_created_at")
+    create_index(bind, "ix_inventory_items_product_status")
+    create_index(bind, "ix_reorder_alerts_status_product")
+
+@migration(4, "drop redundant id indexes")
+def _drop_id_indexes(conn):
+    # INTEGER PRIMARY KEY is the rowid already; these copies only slowed every insert
+    for table in ("products", "inventory_items", "transactions", "reorder_alerts", "reorder_proposals"):
+        conn.execute(text(f"DROP INDEX IF EXISTS ix_{table}_id"))
+
+@migration(5, "stat counters", transactional=False)
+def _stat_counters(bind):
+    models.StatCounter.__table__.create(bind, checkfirst=True)
+    with Session(bind=bind) as db:
+        stats.rebuild(db)
+
+@migration(6, "tag movement index", transactional=False)
+def _tag_movement_index(bind):
+    create_index(bind, "ix_transactions_tag_created")
+
+@migration(7, "zone index", transactional=False)
+def _zone_index(bind):
+    models.ZoneStock.__table__.create(bind, checkfirst=True)
+    create_index(bind, "ix_inventory_items_zone")
+    with Session(bind=bind) as db:
+        zones.rebuild(db)
+
+@migration(8, "missing item alerts", transactional=False)
+def _missing_item_alerts(bind):
+    models.MissingItemAlert.__table__.create(bind, checkfirst=True)
+    create_index(bind, "ix_inventory_items_status_seen")
+
+@migration(9, "zone flow rollups")
+def _zone_flow(conn):
+    # Empty until app.flow folds in the transaction log from id 0
+    for model in (models.FlowTagPosition, models.DwellHistogram, models.ZoneTransition):
+        model.__table__.create(conn, checkfirst=True)
+
+@migration(10, "reservations", transactional=False)
+def _reservations(bind):
+    with bind.begin() as conn:
+        models.Reservation.__table__.create(conn, checkfirst=True)
+        add_column(conn, "inventory_items", "reservation_id")
+    create_index(bind, "ix_inventory_items_reservation")
+
+@migration(11, "pick waves", transactional=False)
+def _pick_waves(bind):
+    with bind.begin() as conn:
+        models.PickWave.__table__.create(conn, checkfirst=True)
+        add_column(conn, "reservations", "wave_id")
+    create_index(bind, "ix_reservations_status_wave")
+
+@migration(12, "cycle counts")
+def _cycle_counts(conn):
+    for model in (models.CycleCount, models.CycleCountZone, models.CycleCountRead, models.CycleCountVariance):
+        model.__table__.create(conn, checkfirst=True)
+
+@migration(13, "movement rollups backfill", transactional=False)
+def _movement_rollups(bind):
+    # Baseline created the hourly and daily movement rollups empty; scans made before
+    # the upgrade only reach /api/reports/movement once they are folded in from the log
+    with Session(bind=bind) as db:
+        rollups.rebuild_rollups(db)
+
+@contextmanager
+def _migration_lock():
+    # Workers starting together take turns; the first one does the work
+    if fcntl is None:
+        yield
+        return
+    with open(db_path.parent / ".migrate.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def applied_versions(bind=engine):
+    if not inspect(bind).has_table(models.SchemaMigration.__tablename__):
+        return set()
+    with bind.connect() as conn:
+        return set(conn.execute(select(models.SchemaMigration.version)).scalars())
+
+def pending(bind=engine):
+    applied = applied_versions(bind)
+    return [(version, name) for version, name, _, _ in sorted(MIGRATIONS) if version not in applied]
+
+def upgrade(bind=engine):
+    # One-shot schema step; run before starting workers, never at import
+    models.SchemaMigration.__table__.create(bind, checkfirst=True)
+    steps = {version: (transactional, step) for version, _, transactional, step in MIGRATIONS}
+    for version, name in pending(bind):
+        transactional, step = steps[version]
+        logger.info(f"Applying migration {version:04d} {name}")
+        began = time.perf_counter()
+        if transactional:
+            with bind.begin() as conn:
+                step(conn)
+        else:
+            step(bind)
+        with bind.begin() as conn:
+            conn.execute(models.SchemaMigration.__table__.insert().values(
+                version=version, name=name, applied_at=datetime.utcnow(),
+                duration_ms=round((time.perf_counter() - began) * 1000)
+            ))
+    logger.info("Database schema is up to date")
+
+def upgrade_locked(bind=engine):
+    with _migration_lock():
+        upgrade(bind)
+
+def detect_drift(bind=engine):
+    # Differences between models.py and the live database, as readable lines
+    live = inspect(bind)
+    tables = set(live.get_table_names())
+    drift = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            drift.append(f"table {table.name} is missing")
+            continue
+        columns = {c["name"] for c in live.get_columns(table.name)}
+        drift += [f"column {table.name}.{c.name} is missing" for c in table.columns if c.name not in columns]
+        drift += [f"column {table.name}.{name} is not in models.py"
+                  for name in sorted(columns - set(table.columns.keys()))]
+        indexes = {i["name"] for i in live.get_indexes(table.name)}
+        drift += [f"index {i.name} is missing" for i in table.indexes if i.name not in indexes]
+        drift += [f"index {name} is not in models.py"
+                  for name in sorted(indexes - {i.name for i in table.indexes})]
+        # Legacy copies of the schema were created without the CHECK constraints
+        declared = [c for c in table.constraints if isinstance(c, CheckConstraint)]
+        if len(live.get_check_constraints(table.name)) < len(declared):
+            drift.append(f"table {table.name} lacks CHECK constraints declared in models.py")
+    return drift
+
+def check(bind=engine, site: str = DEFAULT_SITE):
+    # Startup check: logs pending steps and drift, and raises on drift with WMS_SCHEMA_STRICT=1
+    applied = applied_versions(bind)
+    result = site_status[site] = {
+        "version": max(applied, default=0),
+        "pending": [f"{version:04d} {name}" for version, name in pending(bind)],
+        "drift": detect_drift(bind),
+    }
+    if site == DEFAULT_SITE:
+        status.update(result)
+    where = f" at {site}" if len(SITES) > 1 else ""
+    if result["pending"]:
+        logger.warning(f"Pending schema migrations{where}: {', '.join(result['pending'])}; "
+                       "run python -m app.migrate")
+    for line in result["drift"]:
+        logger.warning(f"Schema drift{where}: {line}")
+    if STRICT and (result["pending"] or result["drift"]):
+        raise RuntimeError(f"Database schema{where} does not match models.py (WMS_SCHEMA_STRICT=1)")
+    return result
+
+def upgrade_sites(sites=SITES):
+    # Every site's database, one after the other under the migration lock
+    for site in sites:
+        upgrade_locked(site_engine(site))
+
+def check_sites(sites=SITES):
+    return {site: check(site_engine(site), site) for site in sites}
+
+def schema_sql(dialect=None):
+    dialect = dialect or engine.dialect
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip() + ";")
+        statements += [str(CreateIndex(index).compile(dialect=dialect)) + ";"
+                       for index in sorted(table.indexes, key=lambda i: i.name)]
+    return "\n\n".join(statements)
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply or inspect schema migrations")
+    parser.add_argument("command", nargs="?", default="upgrade", choices=["upgrade", "status", "schema"])
+    parser.add_argument("--site", choices=SITES, help="one site's database (default: every site)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    sites = [args.site] if args.site else SITES
+
+    if args.command == "upgrade":
+        upgrade_sites(sites)
+        check_sites(sites)
+    elif args.command == "status":
+        for site in sites:
+            bind = site_engine(site)
+            if len(SITES) > 1:
+                print(f"Site {site} ({bind.url.render_as_string(hide_password=True)})")
+            applied = applied_versions(bind)
+            for version, name, _, _ in sorted(MIGRATIONS):
+                print(f"{version:04d} {name:<30} {'applied' if version in applied else 'PENDING'}")
+            drift = detect_drift(bind)
+            print("\n".join(f"drift: {line}" for line in drift) or "No drift against models.py")
+    else:
+        print("-- Generated from backend/app/models.py by python -m app.migrate schema; do not edit\n")
+        print(schema_sql())
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-﻿from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Text, CheckConstraint
+﻿from sqlalchemy import Column, Integer, String, DateTime, Date, ForeignKey, Float, Text, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
@@ -6,7 +6,7 @@ from .database import Base
 class Product(Base):
     __tablename__ = "products"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     sku = Column(String(50), unique=True, nullable=False)
     name = Column(String(200), nullable=False)
     description = Column(Text)
@@ -20,13 +20,15 @@ class Product(Base):
 class InventoryItem(Base):
     __tablename__ = "inventory_items"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     rfid_tag = Column(String(50), unique=True, nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"))
     status = Column(String(20), default="in_stock")
     location_zone = Column(String(50), nullable=False)
     last_scanned_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Set while the item is claimed by a reservation (migration 0010)
+    reservation_id = Column(Integer, ForeignKey("reservations.id"))
     
     product = relationship("Product", back_populates="inventory_items")
     
@@ -35,22 +37,35 @@ class InventoryItem(Base):
             status.in_(['in_stock', 'reserved', 'shipped', 'damaged']),
             name='check_valid_status'
         ),
+        Index('ix_inventory_items_product_status', 'product_id', 'status'),
+        # Items currently in one zone (/api/zones/{zone}/contents)
+        Index('ix_inventory_items_zone', 'location_zone'),
+        # Items by time since last scan (app.stale)
+        Index('ix_inventory_items_status_seen', 'status', 'last_scanned_at'),
+        Index('ix_inventory_items_reservation', 'reservation_id'),
     )
 
 class Transaction(Base):
     __tablename__ = "transactions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     rfid_tag = Column(String(50), ForeignKey("inventory_items.rfid_tag"))
     action = Column(String(20), nullable=False)
     location = Column(String(50))
     scanned_by = Column(String(100))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Copied from the item at scan time so jobs need no join (migration 0002)
+    product_id = Column(Integer, ForeignKey("products.id"))
+    
+    __table_args__ = (
+        # Movement history of one tag, newest first (/api/items)
+        Index('ix_transactions_tag_created', 'rfid_tag', 'created_at'),
+    )
     
 class ReorderAlert(Base):
     __tablename__ = "reorder_alerts"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     product_id = Column(Integer, ForeignKey("products.id"))
     current_quantity = Column(Integer, nullable=False)
     reorder_point = Column(Integer, nullable=False)
@@ -64,4 +79,241 @@ class ReorderAlert(Base):
             status.in_(['pending', 'ordered', 'cancelled']),
             name='check_alert_status'
         ),
+        Index('ix_reorder_alerts_status_product', 'status', 'product_id'),
+    )
+
+# Pre-aggregated scan rollups, maintained on ingest by app.rollups
+class ZoneScanRollup(Base):
+    __tablename__ = "rollup_zone_hourly"
+    
+    bucket = Column(DateTime, primary_key=True)
+    zone = Column(String(50), primary_key=True)
+    scan_count = Column(Integer, nullable=False, default=0)
+
+class ProductMoveRollup(Base):
+    __tablename__ = "rollup_product_daily"
+    
+    day = Column(Date, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    scan_count = Column(Integer, nullable=False, default=0)
+    move_count = Column(Integer, nullable=False, default=0)
+
+class ScannerActivityRollup(Base):
+    __tablename__ = "rollup_scanner_hourly"
+    
+    bucket = Column(DateTime, primary_key=True)
+    scanner_id = Column(String(100), primary_key=True)
+    scan_count = Column(Integer, nullable=False, default=0)
+
+# Daily outbound units per product, derived incrementally from transactions
+class DemandDaily(Base):
+    __tablename__ = "demand_daily"
+    
+    day = Column(Date, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    quantity = Column(Integer, nullable=False, default=0)
+
+# Zone flow state and rollups, folded incrementally from transactions by app.flow
+class FlowTagPosition(Base):
+    __tablename__ = "flow_tag_positions"
+    
+    rfid_tag = Column(String(50), primary_key=True)
+    zone = Column(String(50), nullable=False)
+    arrived_at = Column(DateTime, nullable=False)
+
+class DwellHistogram(Base):
+    __tablename__ = "dwell_histogram"
+    
+    zone = Column(String(50), primary_key=True)
+    # Log-spaced dwell bucket, see app.flow.bucket_of
+    bucket = Column(Integer, primary_key=True)
+    visits = Column(Integer, nullable=False, default=0)
+    total_seconds = Column(Float, nullable=False, default=0)
+
+class ZoneTransition(Base):
+    __tablename__ = "zone_transitions"
+    
+    from_zone = Column(String(50), primary_key=True)
+    to_zone = Column(String(50), primary_key=True)
+    moves = Column(Integer, nullable=False, default=0)
+
+# Watermarks for incremental background jobs
+class JobState(Base):
+    __tablename__ = "job_state"
+    
+    name = Column(String(50), primary_key=True)
+    last_transaction_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+# Incrementally maintained totals for /api/stats, see app.stats
+class StatCounter(Base):
+    __tablename__ = "stat_counters"
+    
+    name = Column(String(120), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+# Units of one product claimed for an order by app.reservations
+class Reservation(Base):
+    __tablename__ = "reservations"
+    
+    id = Column(Integer, primary_key=True)
+    order_ref = Column(String(100), nullable=False, index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    requested = Column(Integer, nullable=False)
+    quantity = Column(Integer, nullable=False)
+    strategy = Column(String(20), nullable=False)
+    status = Column(String(20), default="active")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    # The pick wave the reservation was batched into (migration 0011)
+    wave_id = Column(Integer, ForeignKey("pick_waves.id"))
+    
+    __table_args__ = (
+        CheckConstraint(
+            status.in_(['active', 'released', 'shipped']),
+            name='check_reservation_status'
+        ),
+        # Active reservations not yet in a wave, and those of each open wave
+        Index('ix_reservations_status_wave', 'status', 'wave_id'),
+    )
+
+# A batch of reservations picked in one walk, see app.picking
+class PickWave(Base):
+    __tablename__ = "pick_waves"
+    
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+# A cycle count session: tag reads from a sweep of some zones, reconciled by app.cycle_counts
+class CycleCount(Base):
+    __tablename__ = "cycle_counts"
+    
+    id = Column(Integer, primary_key=True)
+    status = Column(String(20), default="open")
+    counted_by = Column(String(100))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    closed_at = Column(DateTime)
+    # Outcome counts, set when the session is closed
+    found = Column(Integer)
+    missing = Column(Integer)
+    unexpected = Column(Integer)
+    misplaced = Column(Integer)
+    
+    __table_args__ = (
+        CheckConstraint(
+            status.in_(['open', 'closed', 'cancelled']),
+            name='check_cycle_count_status'
+        ),
+    )
+
+class CycleCountZone(Base):
+    __tablename__ = "cycle_count_zones"
+    
+    count_id = Column(Integer, ForeignKey("cycle_counts.id"), primary_key=True)
+    zone = Column(String(50), primary_key=True)
+
+# One row per tag read in a session; a tag read again keeps its latest zone
+class CycleCountRead(Base):
+    __tablename__ = "cycle_count_reads"
+    
+    count_id = Column(Integer, ForeignKey("cycle_counts.id"), primary_key=True)
+    rfid_tag = Column(String(50), primary_key=True)
+    zone = Column(String(50), nullable=False)
+    read_at = Column(DateTime, nullable=False)
+
+# Tags whose count differed from the database, written when the session is closed
+class CycleCountVariance(Base):
+    __tablename__ = "cycle_count_variances"
+    
+    count_id = Column(Integer, ForeignKey("cycle_counts.id"), primary_key=True)
+    rfid_tag = Column(String(50), primary_key=True)
+    outcome = Column(String(20), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"))
+    # Where the database had the item, and where the sweep read it
+    expected_zone = Column(String(50))
+    counted_zone = Column(String(50))
+    
+    __table_args__ = (
+        CheckConstraint(
+            outcome.in_(['missing', 'unexpected', 'misplaced']),
+            name='check_cycle_count_outcome'
+        ),
+    )
+
+# Items per zone, product and status, maintained on every move by app.zones
+class ZoneStock(Base):
+    __tablename__ = "zone_stock"
+    
+    zone = Column(String(50), primary_key=True)
+    # 0 for items without a product, since NULL cannot take part in the upsert key
+    product_id = Column(Integer, primary_key=True)
+    status = Column(String(20), primary_key=True)
+    item_count = Column(Integer, nullable=False, default=0)
+
+# Applied steps of app.migrate
+class SchemaMigration(Base):
+    __tablename__ = "schema_migrations"
+    
+    version = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow)
+    duration_ms = Column(Integer)
+
+# Items not scanned within their zone's threshold, raised by app.stale
+class MissingItemAlert(Base):
+    __tablename__ = "missing_item_alerts"
+    
+    id = Column(Integer, primary_key=True)
+    rfid_tag = Column(String(50), ForeignKey("inventory_items.rfid_tag"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"))
+    zone = Column(String(50), nullable=False)
+    last_scanned_at = Column(DateTime, nullable=False)
+    threshold_days = Column(Float, nullable=False)
+    status = Column(String(20), default="open")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    resolved_at = Column(DateTime)
+    
+    __table_args__ = (
+        CheckConstraint(
+            status.in_(['open', 'found', 'cancelled']),
+            name='check_missing_alert_status'
+        ),
+        Index('ix_missing_item_alerts_tag_status', 'rfid_tag', 'status'),
+        Index('ix_missing_item_alerts_status', 'status', 'id'),
+    )
+
+# Time-limited ownership of singleton background work shared by all API workers
+class Lease(Base):
+    __tablename__ = "leases"
+    
+    name = Column(String(50), primary_key=True)
+    owner = Column(String(100), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+# Reorder policy suggestions from app.replenishment, applied to Product on approval
+class ReorderProposal(Base):
+    __tablename__ = "reorder_proposals"
+    
+    id = Column(Integer, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    mean_daily_demand = Column(Float, nullable=False)
+    demand_std = Column(Float, nullable=False)
+    lead_time_days = Column(Float, nullable=False)
+    service_level = Column(Float, nullable=False)
+    safety_stock = Column(Integer, nullable=False)
+    reorder_point = Column(Integer, nullable=False)
+    reorder_quantity = Column(Integer, nullable=False)
+    previous_reorder_point = Column(Integer)
+    previous_reorder_quantity = Column(Integer)
+    explanation = Column(Text)
+    status = Column(String(20), default="proposed")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    product = relationship("Product")
+    
+    __table_args__ = (
+        CheckConstraint(
+            status.in_(['proposed', 'applied', 'rejected', 'superseded']),
+            name='check_proposal_status'
+        ),
     )
@@ -0,0 +1,173 @@
+"""
+Pick waves: active reservations batched into waves, each with a short walk through
+the zones its items are in.
+
+Waves are filled first come, first served, whole orders at a time, up to a number of
+lines (items) and orders per wave. Reservations join a wave by compare-and-swap on
+wave_id, so two workers generating waves at once never batch the same order twice.
+
+A wave's route is built over its distinct zones, not its lines. A wave of thousands
+of lines therefore routes about as fast as the number of bays it touches allows:
+- An S-shape walk is the start: aisles in order, alternating direction.
+- 2-opt then reverses stretches of the walk while that shortens it, for at most
+  ROUTE_MAX_PASSES passes.
+Distances are zones.walk() between aisle coordinates. The walk starts and ends at
+DEPOT. Zones off the aisle grid are visited last, in name order.
+
+The route is recomputed from the wave's current items whenever it is read, so
+released reservations drop out of it.
+"""
+from collections import defaultdict
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.orm import Session
+from . import models, zones
+
+# Front end of aisle A, where pickers start and drop off at Packing
+DEPOT = (0, 0)
+MAX_LINES = 500
+MAX_ORDERS = 50
+ROUTE_MAX_PASSES = 25
+
+_waves = models.PickWave.__table__
+_reservations = models.Reservation.__table__
+_items = models.InventoryItem.__table__
+_products = models.Product.__table__
+
+# Oldest first, from ix_reservations_status_wave
+UNBATCHED = select(_reservations.c.id, _reservations.c.order_ref, _reservations.c.quantity).where(
+    _reservations.c.status == "active", _reservations.c.wave_id.is_(None)
+).order_by(_reservations.c.created_at, _reservations.c.id)
+
+ASSIGN = update(_reservations).where(
+    _reservations.c.id.in_(bindparam("ids", expanding=True)),
+    _reservations.c.status == "active", _reservations.c.wave_id.is_(None)
+).values(wave_id=bindparam("wave_id"))
+
+WAVE = select(_waves.c.id, _waves.c.created_at).where(_waves.c.id == bindparam("wave_id"))
+
+# Every item of an active reservation is reserved, so no status filter on inventory_items:
+# with one SQLite would start from all reserved items instead of the wave's reservations
+WAVE_LINES = select(
+    _items.c.rfid_tag, _items.c.location_zone, _products.c.sku,
+    _reservations.c.order_ref, _reservations.c.id.label("reservation_id")
+).select_from(
+    _reservations.join(_items, _items.c.reservation_id == _reservations.c.id)
+    .join(_products, _products.c.id == _reservations.c.product_id)
+).where(_reservations.c.status == "active", _reservations.c.wave_id == bindparam("wave_id"))
+
+OPEN_WAVES = select(
+    _waves.c.id, _waves.c.created_at,
+    func.count(func.distinct(_reservations.c.order_ref)), func.sum(_reservations.c.quantity)
+).select_from(
+    _reservations.join(_waves, _waves.c.id == _reservations.c.wave_id)
+).where(_reservations.c.status == "active", _reservations.c.wave_id.is_not(None)).group_by(
+    _reservations.c.wave_id
+).order_by(_reservations.c.wave_id)
+
+def s_shape(points: list) -> list:
+    # Aisles in order, up the first visited aisle, down the next, and so on
+    aisles = defaultdict(list)
+    for point in points:
+        aisles[point[0]].append(point)
+    walk = []
+    for turn, aisle in enumerate(sorted(aisles)):
+        walk += sorted(aisles[aisle], key=lambda point: point[1], reverse=turn % 2 == 1)
+    return walk
+
+def two_opt(points: list, max_passes: int = ROUTE_MAX_PASSES) -> list:
+    # Improves a walk that starts and ends at DEPOT by reversing segments while that shortens it
+    tour = [DEPOT] + points + [DEPOT]
+    index = {point: n for n, point in enumerate(set(tour))}
+    dist = zones.walk_matrix(list(index))
+    order = [index[point] for point in tour]
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, len(order) - 2):
+            a, b = order[i - 1], order[i]
+            row_a, row_b = dist[a], dist[b]
+            for j in range(i + 1, len(order) - 1):
+                c, d = order[j], order[j + 1]
+                if row_a[c] + row_b[d] < row_a[b] + dist[c][d] - 1e-9:
+                    order[i:j + 1] = order[j:i - 1:-1]
+                    b, row_b = order[i], dist[order[i]]
+                    improved = True
+        if not improved:
+            break
+    points_by_index = {n: point for point, n in index.items()}
+    return [points_by_index[n] for n in order[1:-1]]
+
+def route_length(points: list) -> float:
+    tour = [DEPOT] + points + [DEPOT]
+    return sum(zones.walk(a, b) for a, b in zip(tour, tour[1:]))
+
+def route(zone_names) -> tuple:
+    # (zones in walking order, walk length in bays) for a set of zones
+    by_point, off_grid = {}, []
+    for zone in set(zone_names):
+        point = zones.coordinates(zone)
+        if point is None:
+            off_grid.append(zone)
+        else:
+            by_point[point] = zone
+    points = two_opt(s_shape(list(by_point)))
+    return [by_point[point] for point in points] + sorted(off_grid), route_length(points)
+
+def _batches(reservations, max_lines: int, max_orders: int):
+    # Whole orders, first come first served; an order larger than max_lines gets a wave of its own
+    orders = {}
+    for reservation_id, order_ref, quantity in reservations:
+        entry = orders.setdefault(order_ref, [[], 0])
+        entry[0].append(reservation_id)
+        entry[1] += quantity
+    batch, lines, count = [], 0, 0
+    for ids, quantity in orders.values():
+        if batch and (lines + quantity > max_lines or count == max_orders):
+            yield batch
+            batch, lines, count = [], 0, 0
+        batch += ids
+        lines += quantity
+        count += 1
+    if batch:
+        yield batch
+
+def generate(db: Session, max_lines: int = MAX_LINES, max_orders: int = MAX_ORDERS) -> list:
+    # Batches every active reservation not yet in a wave; returns the new waves' pick lists
+    if max_lines < 1 or max_orders < 1:
+        raise ValueError("max_lines and max_orders must be positive")
+    # Read before the first write, like reservations.reserve
+    batches = list(_batches(db.execute(UNBATCHED).all(), max_lines, max_orders))
+    wave_ids = []
+    for batch in batches:
+        wave_id = db.execute(insert(_waves).returning(_waves.c.id)).scalar()
+        if db.execute(ASSIGN, {"ids": batch, "wave_id": wave_id}).rowcount:
+            wave_ids.append(wave_id)
+        else:
+            # Every order in it was batched by another worker in the meantime
+            db.execute(_waves.delete().where(_waves.c.id == wave_id))
+    db.commit()
+    return [get(db, wave_id) for wave_id in wave_ids]
+
+def get(db: Session, wave_id: int):
+    # The wave's pick list: stops in walking order with the items to pick at each
+    wave = db.execute(WAVE, {"wave_id": wave_id}).first()
+    if wave is None:
+        return None
+    lines = db.execute(WAVE_LINES, {"wave_id": wave_id}).all()
+    by_zone = defaultdict(list)
+    for tag, zone, sku, order_ref, reservation_id in lines:
+        by_zone[zone].append({"rfid_tag": tag, "sku": sku, "order_ref": order_ref, "reservation_id": reservation_id})
+    walk, length = route(by_zone)
+    return {
+        "id": wave.id,
+        "created_at": wave.created_at,
+        "orders": len({line.order_ref for line in lines}),
+        "lines": len(lines),
+        "distance": length,
+        "stops": [{"zone": zone, "items": sorted(by_zone[zone], key=lambda item: (item["order_ref"], item["rfid_tag"]))}
+                  for zone in walk],
+    }
+
+def open_waves(db: Session) -> list:
+    # Waves that still have active reservations, with their order and line counts
+    return [{"id": wave_id, "created_at": created_at, "orders": orders, "lines": lines}
+            for wave_id, created_at, orders, lines in db.execute(OPEN_WAVES)]
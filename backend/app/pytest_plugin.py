@@ -0,0 +1,36 @@
+"""
+Query budget assertions for endpoint tests.
+
+Enable with ``pytest -p app.pytest_plugin`` (or ``pytest_plugins`` in a
+conftest) and wrap the request under test:
+
+    def test_levels_is_one_query(client, query_budget):
+        with query_budget(1):
+            client.get("/api/inventory/levels")
+
+The block fails when it runs more statements than the budget, or repeats
+one statement shape ``max_repeats`` times or more (an N+1 loop).
+"""
+from contextlib import contextmanager
+import pytest
+from . import querywatch
+from .database import SITES, site_engine
+
+@pytest.fixture
+def query_budget():
+    # Every site's engine: a request with X-WMS-Site runs its queries on its own site's
+    for site in SITES:
+        querywatch.install(site_engine(site))
+
+    @contextmanager
+    def budget(max_queries: int, max_repeats: int = querywatch.REPEAT_THRESHOLD):
+        # TestClient serves requests on another thread, so collect process-wide
+        with querywatch.watch(all_threads=True) as log:
+            yield log
+        assert log.count <= max_queries, \
+            f"query budget {max_queries} exceeded\n{log.report()}"
+        repeated = log.repeated(max_repeats)
+        assert not repeated, \
+            f"statement repeated {repeated[0][1]}x (N+1)\n{log.report()}"
+
+    return budget
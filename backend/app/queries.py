@@ -0,0 +1,143 @@
+"""
+Named hot-path queries.
+
+Statements are Core constructs built once at import with bind parameters,
+so a call skips query construction and always hits SQLAlchemy's compiled
+statement cache. They run on the session's connection and return plain
+Row tuples, with no ORM entities, identity map or flush bookkeeping on the
+read paths. Every function takes a Session or a Connection.
+"""
+from sqlalchemy import Integer, and_, bindparam, func, insert, select, update
+from sqlalchemy.orm import Session
+from . import models
+
+_products = models.Product.__table__
+_items = models.InventoryItem.__table__
+_transactions = models.Transaction.__table__
+_alerts = models.ReorderAlert.__table__
+
+ITEM_BY_TAG = select(
+    _items.c.id, _items.c.rfid_tag, _items.c.product_id, _items.c.status,
+    _items.c.location_zone, _items.c.last_scanned_at
+).where(_items.c.rfid_tag == bindparam("rfid_tag"))
+
+# One grouped query instead of a COUNT per product
+STOCK_LEVELS = select(
+    _products.c.id, _products.c.sku, _products.c.name,
+    func.count(_items.c.id).label("current_quantity"),
+    _products.c.reorder_point, _products.c.reorder_quantity
+).select_from(
+    _products.outerjoin(_items, and_(_items.c.product_id == _products.c.id, _items.c.status == "in_stock"))
+).group_by(_products.c.id).order_by(_products.c.id)
+
+STOCK_COUNTS = select(
+    _items.c.product_id, func.count()
+).where(_items.c.status == "in_stock").group_by(_items.c.product_id)
+
+# Product name joined and created_at formatted by the database, not per row in Python
+PENDING_ALERTS = select(
+    _alerts.c.id, _alerts.c.product_id,
+    func.coalesce(_products.c.name, "Unknown").label("product_name"),
+    _alerts.c.current_quantity, _alerts.c.reorder_point, _alerts.c.status,
+    func.coalesce(func.strftime("%Y-%m-%d %H:%M:%S", _alerts.c.created_at), "").label("created_at")
+).select_from(
+    _alerts.outerjoin(_products, _products.c.id == _alerts.c.product_id)
+).where(_alerts.c.status == "pending").order_by(_alerts.c.id)
+
+# Served by ix_transactions_created_at
+RECENT_SCANS = select(
+    _transactions.c.rfid_tag, _transactions.c.action, _transactions.c.location, _transactions.c.created_at
+).order_by(_transactions.c.created_at.desc()).limit(bindparam("limit", type_=Integer))
+
+MOVE_ITEM = update(_items).where(_items.c.rfid_tag == bindparam("tag")).values(
+    location_zone=bindparam("zone"), last_scanned_at=bindparam("at")
+)
+
+INSERT_TRANSACTION = insert(_transactions)
+
+# Point lookups for /api/items and /api/products; the expanding IN takes one or many keys
+
+ITEMS_BY_TAGS = select(
+    _items.c.rfid_tag, _items.c.status, _items.c.location_zone, _items.c.last_scanned_at,
+    _items.c.product_id, _products.c.sku, _products.c.name
+).select_from(
+    _items.outerjoin(_products, _products.c.id == _items.c.product_id)
+).where(_items.c.rfid_tag.in_(bindparam("tags", expanding=True)))
+
+# The newest `limit` moves of every tag in one statement: each tag's range on
+# ix_transactions_tag_created, numbered newest first
+_tag_moves = select(
+    _transactions.c.rfid_tag, _transactions.c.action, _transactions.c.location,
+    _transactions.c.scanned_by, _transactions.c.created_at,
+    func.row_number().over(
+        partition_by=_transactions.c.rfid_tag,
+        order_by=(_transactions.c.created_at.desc(), _transactions.c.id.desc())
+    ).label("rn")
+).where(_transactions.c.rfid_tag.in_(bindparam("tags", expanding=True))).subquery()
+
+TAGS_MOVEMENTS = select(
+    _tag_moves.c.rfid_tag, _tag_moves.c.action, _tag_moves.c.location,
+    _tag_moves.c.scanned_by, _tag_moves.c.created_at
+).where(_tag_moves.c.rn <= bindparam("limit", type_=Integer)).order_by(
+    _tag_moves.c.rfid_tag, _tag_moves.c.rn
+)
+
+PRODUCTS_BY_SKUS = select(
+    _products.c.id, _products.c.sku, _products.c.name, _products.c.reorder_point, _products.c.reorder_quantity
+).where(_products.c.sku.in_(bindparam("skus", expanding=True)))
+
+# Filtered on ix_inventory_items_product_status
+PRODUCT_STOCK = select(
+    _items.c.product_id, _items.c.location_zone, _items.c.status, func.count()
+).where(_items.c.product_id.in_(bindparam("ids", expanding=True))).group_by(
+    _items.c.product_id, _items.c.location_zone, _items.c.status
+).order_by(_items.c.product_id, _items.c.location_zone, _items.c.status)
+
+def connection(db):
+    # The session's own connection: same transaction, none of the ORM execute path
+    return db.connection() if isinstance(db, Session) else db
+
+def item_by_tag(db, rfid_tag: str):
+    return connection(db).execute(ITEM_BY_TAG, {"rfid_tag": rfid_tag}).first()
+
+def stock_levels(db):
+    # (id, sku, name, current_quantity, reorder_point, reorder_quantity, needs_reorder)
+    rows = connection(db).execute(STOCK_LEVELS).all()
+    return [(*row, row[3] <= row[4]) for row in rows]
+
+def stock_counts(db) -> dict:
+    # In-stock items per product; products without stock are absent
+    return dict(connection(db).execute(STOCK_COUNTS).all())
+
+def pending_alerts(db):
+    return connection(db).execute(PENDING_ALERTS).all()
+
+def recent_scans(db, limit: int = 50):
+    return connection(db).execute(RECENT_SCANS, {"limit": limit}).all()
+
+def items_by_tags(db, tags):
+    return connection(db).execute(ITEMS_BY_TAGS, {"tags": list(tags)}).all()
+
+def tags_movements(db, tags, limit: int):
+    # (rfid_tag, action, location, scanned_by, created_at), each tag's newest first
+    return connection(db).execute(TAGS_MOVEMENTS, {"tags": list(tags), "limit": limit}).all()
+
+def products_by_skus(db, skus):
+    return connection(db).execute(PRODUCTS_BY_SKUS, {"skus": list(skus)}).all()
+
+def product_stock(db, product_ids):
+    # (product_id, zone, status, count) for every zone/status a product has items in
+    return connection(db).execute(PRODUCT_STOCK, {"ids": list(product_ids)}).all()
+
+def record_move(db, item, location: str, scanner_id, at, action: str = "SCANNED"):
+    # Scan write path: move the item and log the transaction inside the caller's transaction
+    conn = connection(db)
+    conn.execute(MOVE_ITEM, {"tag": item.rfid_tag, "zone": location, "at": at})
+    conn.execute(INSERT_TRANSACTION, {
+        "rfid_tag": item.rfid_tag,
+        "action": action,
+        "location": f"{item.location_zone} -> {location}",
+        "scanned_by": scanner_id,
+        "created_at": at,
+        "product_id": item.product_id,
+    })
@@ -0,0 +1,134 @@
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Dev/test only: WMS_QUERY_WATCH=1 checks every request for N+1 patterns and slow statements
+ENABLED = os.getenv("WMS_QUERY_WATCH", "0") == "1"
+# The same statement shape this many times in one request is reported as N+1
+REPEAT_THRESHOLD = int(os.getenv("WMS_QUERY_REPEAT_THRESHOLD", "5"))
+SLOW_QUERY_MS = float(os.getenv("WMS_SLOW_QUERY_MS", "100"))
+
+_LITERALS = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"%\(\w+\)s|:\w+|\$\d+"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(?...)"),
+    (re.compile(r"\s+"), " "),
+]
+
+def normalize(statement: str) -> str:
+    # Statement shape: literals and bind styles become ?, IN lists collapse
+    for pattern, replacement in _LITERALS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+class QueryLog:
+    def __init__(self, slow_ms: float = SLOW_QUERY_MS):
+        self.slow_ms = slow_ms
+        self.statements = []
+        self.slow = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def shapes(self) -> Counter:
+        return Counter(shape for shape, _ in self.statements)
+
+    def repeated(self, threshold: int = REPEAT_THRESHOLD):
+        return [(shape, n) for shape, n in self.shapes().most_common() if n >= threshold]
+
+    def report(self) -> str:
+        lines = [f"{self.count} statements, {sum(s for _, s in self.statements) * 1000:.1f} ms"]
+        lines += [f"  {n}x {shape[:200]}" for shape, n in self.shapes().most_common()]
+        for statement, seconds, plan in self.slow:
+            lines.append(f"  slow {seconds * 1000:.1f} ms: {' '.join(statement.split())[:200]}")
+            lines += [f"    {step}" for step in plan]
+        return "\n".join(lines)
+
+_current = ContextVar("wms_query_log", default=None)
+# Logs that collect from every thread, e.g. a test driving the app through TestClient
+_global_logs = []
+_global_lock = threading.Lock()
+_installed = set()
+
+def _explain(conn, statement, parameters):
+    # Plan fetched on the raw DBAPI connection so it does not re-enter these events
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    try:
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            return [" | ".join(str(col) for col in row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception as e:
+        return [f"plan unavailable: {e}"]
+
+def install(engine):
+    if id(engine) in _installed:
+        return
+    _installed.add(id(engine))
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("querywatch_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["querywatch_start"].pop()
+        logs = list(_global_logs)
+        current = _current.get()
+        if current is not None:
+            logs.append(current)
+        if not logs:
+            return
+        shape = normalize(statement)
+        plan = None
+        for log in logs:
+            log.statements.append((shape, elapsed))
+            if elapsed * 1000 >= log.slow_ms and not executemany:
+                if plan is None:
+                    plan = _explain(conn, statement, parameters)
+                log.slow.append((statement, elapsed, plan))
+
+@contextmanager
+def watch(all_threads: bool = False, slow_ms: float = SLOW_QUERY_MS):
+    # Collect statements run inside the block (or anywhere in the process with all_threads)
+    log = QueryLog(slow_ms)
+    if all_threads:
+        with _global_lock:
+            _global_logs.append(log)
+        try:
+            yield log
+        finally:
+            with _global_lock:
+                _global_logs.remove(log)
+    else:
+        token = _current.set(log)
+        try:
+            yield log
+        finally:
+            _current.reset(token)
+
+async def watch_request(request, call_next):
+    # HTTP middleware for WMS_QUERY_WATCH=1: warn about N+1 shapes and slow statements
+    with watch() as log:
+        response = await call_next(request)
+    repeated = log.repeated()
+    if repeated or log.slow:
+        route = request.scope.get("route")
+        path = route.path if route is not None else request.url.path
+        problems = [f"N+1: {n}x same statement" for _, n in repeated]
+        if log.slow:
+            problems.append(f"{len(log.slow)} statement(s) over {log.slow_ms:g} ms")
+        logger.warning(f"{request.method} {path}: {'; '.join(problems)}\n{log.report()}")
+    return response
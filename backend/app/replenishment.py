@@ -0,0 +1,132 @@
+﻿import os
+from datetime import datetime, timedelta
+from statistics import NormalDist
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from . import forecasting, jobs, models, stats
+
+JOB_NAME = "reorder_policy"
+
+DEFAULT_LEAD_TIME_DAYS = float(os.getenv("WMS_LEAD_TIME_DAYS", "7"))
+DEFAULT_SERVICE_LEVEL = float(os.getenv("WMS_SERVICE_LEVEL", "0.95"))
+# EOQ inputs: fixed cost per purchase order, yearly holding cost as a share of unit price
+ORDER_COST = float(os.getenv("WMS_ORDER_COST", "50"))
+HOLDING_RATE = float(os.getenv("WMS_HOLDING_RATE", "0.25"))
+HISTORY_DAYS = 90
+
+def _active_product_ids(db: Session, after: int, upto: int):
+    # Products touched by any transaction in (after, upto]
+    rows = db.execute(text("""
+        SELECT DISTINCT t.product_id
+        FROM transactions t
+        WHERE t.id > :after AND t.id <= :upto AND t.product_id IS NOT NULL
+    """), {"after": after, "upto": upto}).all()
+    return {row[0] for row in rows}
+
+def compute_policy(Y: np.ndarray, unit_price: np.ndarray, lead_time_days: float,
+                   service_level: float, safety_multiplier: float = 1.0):
+    # Vectorized over products: Y is products x days of outbound units
+    z = NormalDist().inv_cdf(service_level)
+
+    # Statistics start at each product's first demand so new SKUs are not diluted by empty days
+    nonzero = Y > 0
+    first = np.where(nonzero.any(axis=1), nonzero.argmax(axis=1), Y.shape[1])
+    active = np.arange(Y.shape[1])[None, :] >= first[:, None]
+    days = active.sum(axis=1)
+    mean = (Y * active).sum(axis=1) / np.maximum(days, 1)
+    std = np.sqrt((((Y - mean[:, None]) ** 2) * active).sum(axis=1) / np.maximum(days - 1, 1))
+
+    safety = np.ceil(safety_multiplier * z * std * np.sqrt(lead_time_days))
+    reorder_point = np.ceil(mean * lead_time_days + safety)
+
+    annual_demand = mean * 365
+    holding_cost = np.maximum(HOLDING_RATE * np.nan_to_num(unit_price, nan=1.0), 0.01)
+    eoq = np.maximum(np.ceil(np.sqrt(2 * annual_demand * ORDER_COST / holding_cost)), 1)
+    return mean, std, days, z, safety.astype(int), reorder_point.astype(int), eoq.astype(int), holding_cost
+
+def run(db: Session, full: bool = False, lead_time_days: float = DEFAULT_LEAD_TIME_DAYS,
+        service_level: float = DEFAULT_SERVICE_LEVEL, safety_multiplier: float = 1.0):
+    # Nightly job: propose new reorder settings for products with new activity (or all with full=True)
+    forecasting.update_demand(db)
+    after = jobs.get_watermark(db, JOB_NAME)
+    upto = jobs.latest_transaction_id(db)
+
+    query = db.query(
+        models.Product.id, models.Product.unit_price,
+        models.Product.reorder_point, models.Product.reorder_quantity
+    ).order_by(models.Product.id)
+    products = query.all()
+    if not full:
+        active = _active_product_ids(db, after, upto)
+        products = [p for p in products if p[0] in active]
+
+    proposals = []
+    if products:
+        product_ids = np.array([p[0] for p in products], dtype=np.int64)
+        unit_price = np.array([p[1] if p[1] is not None else np.nan for p in products], dtype=float)
+        start = datetime.utcnow().date() - timedelta(days=HISTORY_DAYS)
+        Y = forecasting.load_demand_matrix(db, product_ids, start, HISTORY_DAYS)
+        mean, std, days, z, safety, reorder_point, eoq, holding_cost = compute_policy(
+            Y, unit_price, lead_time_days, service_level, safety_multiplier
+        )
+
+        for i, (product_id, _, old_rop, old_roq) in enumerate(products):
+            if mean[i] <= 0:
+                continue
+            proposals.append({
+                "product_id": int(product_id),
+                "mean_daily_demand": round(float(mean[i]), 4),
+                "demand_std": round(float(std[i]), 4),
+                "lead_time_days": lead_time_days,
+                "service_level": service_level,
+                "safety_stock": int(safety[i]),
+                "reorder_point": int(reorder_point[i]),
+                "reorder_quantity": int(eoq[i]),
+                "previous_reorder_point": old_rop,
+                "previous_reorder_quantity": old_roq,
+                "explanation": (
+                    f"Demand {mean[i]:.2f}/day (sd {std[i]:.2f}) over {int(days[i])} days. "
+                    f"Lead time {lead_time_days:g} days at {service_level:.1%} service (z={z:.2f}"
+                    + (f", x{safety_multiplier:g}" if safety_multiplier != 1 else "")
+                    + f") needs safety stock {int(safety[i])}, so reorder at {int(reorder_point[i])} "
+                    f"(was {old_rop}). EOQ {int(eoq[i])} (was {old_roq}) from {mean[i] * 365:.0f} units/year, "
+                    f"order cost {ORDER_COST:g}, holding cost {holding_cost[i]:.2f}/unit/year."
+                ),
+                "status": "proposed",
+                "created_at": datetime.utcnow(),
+            })
+
+    # Claim the range before writing: a run that another run overtook (the API and the
+    # nightly script, say) starts again from the new watermark
+    if not jobs.advance_watermark(db, JOB_NAME, after, upto):
+        db.rollback()
+        return run(db, full, lead_time_days, service_level, safety_multiplier)
+
+    if proposals:
+        # Only the newest proposal per product stays open
+        db.query(models.ReorderProposal).filter(
+            models.ReorderProposal.status == "proposed",
+            models.ReorderProposal.product_id.in_([p["product_id"] for p in proposals])
+        ).update({"status": "superseded"}, synchronize_session=False)
+        db.bulk_insert_mappings(models.ReorderProposal, proposals)
+
+    db.commit()
+    return {"products_considered": len(products), "proposals": len(proposals), "full": full}
+
+def apply_proposals(db: Session, proposal_ids=None):
+    query = db.query(models.ReorderProposal).filter(models.ReorderProposal.status == "proposed")
+    if proposal_ids:
+        query = query.filter(models.ReorderProposal.id.in_(proposal_ids))
+    applied = 0
+    for proposal in query.all():
+        product = db.get(models.Product, proposal.product_id)
+        if product is None:
+            continue
+        stats.reorder_point_changed(db, product.id, product.reorder_point, proposal.reorder_point)
+        product.reorder_point = proposal.reorder_point
+        product.reorder_quantity = proposal.reorder_quantity
+        proposal.status = "applied"
+        applied += 1
+    db.commit()
+    return applied
@@ -0,0 +1,165 @@
+"""
+Order allocation: reserve N units of a SKU by claiming concrete RFID items.
+
+Claims are optimistic. Candidates are read before the transaction writes anything,
+so no lock is held while they are chosen. Each candidate is then claimed with a
+compare-and-swap (UPDATE ... WHERE status = 'in_stock' RETURNING). Items another
+request took in the meantime simply do not come back, and the shortfall is read
+again. By then the reservation insert holds SQLite's write lock, so the re-read
+cannot lose a second time. The stock counters, the zone index and the product's
+reorder alert change in the same transaction as the claim.
+"""
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import Integer, bindparam, insert, select, update
+from sqlalchemy.orm import Session
+from . import alerts, models, stale, stats, zones
+
+STRATEGIES = ("fifo", "nearest")
+# Extra candidates read up front, so a few lost races need no second read
+CANDIDATE_SLACK = 8
+
+class ReservationConflict(Exception):
+    # Not enough stock, or the reservation changed state under us
+    pass
+
+_products = models.Product.__table__
+_items = models.InventoryItem.__table__
+_reservations = models.Reservation.__table__
+_transactions = models.Transaction.__table__
+
+PRODUCT_BY_SKU = select(_products.c.id, _products.c.sku, _products.c.reorder_point).where(
+    _products.c.sku == bindparam("sku")
+)
+
+# Oldest stock first, from ix_inventory_items_product_status
+FIFO_CANDIDATES = select(_items.c.id, _items.c.location_zone).where(
+    _items.c.product_id == bindparam("product_id"), _items.c.status == "in_stock"
+).order_by(_items.c.created_at, _items.c.id).limit(bindparam("limit", type_=Integer))
+
+ALL_CANDIDATES = select(_items.c.id, _items.c.location_zone).where(
+    _items.c.product_id == bindparam("product_id"), _items.c.status == "in_stock"
+).order_by(_items.c.created_at, _items.c.id)
+
+CLAIM = update(_items).where(
+    _items.c.id.in_(bindparam("ids", expanding=True)), _items.c.status == "in_stock"
+).values(status="reserved", reservation_id=bindparam("reservation_id")).returning(
+    _items.c.rfid_tag, _items.c.location_zone
+)
+
+RESERVATION = select(
+    _reservations.c.id, _reservations.c.order_ref, _products.c.sku, _reservations.c.product_id,
+    _reservations.c.requested, _reservations.c.quantity, _reservations.c.strategy,
+    _reservations.c.status, _reservations.c.created_at, _reservations.c.updated_at
+).select_from(
+    _reservations.join(_products, _products.c.id == _reservations.c.product_id)
+).where(_reservations.c.id == bindparam("reservation_id"))
+
+# Served by ix_inventory_items_reservation
+RESERVED_ITEMS = select(_items.c.rfid_tag, _items.c.location_zone, _items.c.status).where(
+    _items.c.reservation_id == bindparam("reservation_id")
+).order_by(_items.c.rfid_tag)
+
+def _candidates(db: Session, product_id: int, strategy: str, zone, limit: int):
+    if strategy == "fifo":
+        return db.execute(FIFO_CANDIDATES, {"product_id": product_id, "limit": limit}).all()
+    # Nearest zone first, oldest first within a zone (sorted() is stable)
+    rows = db.execute(ALL_CANDIDATES, {"product_id": product_id}).all()
+    return sorted(rows, key=lambda row: zones.distance(zone, row.location_zone))[:limit]
+
+def _status_changed(db: Session, product_id: int, items, old_status: str, new_status: str):
+    # Counters and zone index updated once per zone, not once per item
+    for zone, count in Counter(zone for _, zone in items).items():
+        stats.item_status_changed(db, product_id, zone, old_status, new_status, count)
+        zones.item_status_changed(db, product_id, zone, old_status, new_status, count)
+
+def reserve(db: Session, order_ref: str, sku: str, quantity: int, strategy: str = "fifo",
+            zone: str = None, allow_partial: bool = False) -> dict:
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if strategy == "nearest" and not zone:
+        raise ValueError("nearest allocation needs a zone")
+    product = db.execute(PRODUCT_BY_SKU, {"sku": sku}).first()
+    if product is None:
+        raise LookupError(f"Unknown SKU: {sku}")
+
+    # Read before the first write, so no lock is held while choosing
+    candidates = _candidates(db, product.id, strategy, zone, quantity + CANDIDATE_SLACK)
+    now = datetime.utcnow()
+    reservation_id = db.execute(insert(_reservations).values(
+        order_ref=order_ref, product_id=product.id, requested=quantity, quantity=0,
+        strategy=strategy, status="active", created_at=now, updated_at=now
+    ).returning(_reservations.c.id)).scalar()
+
+    claimed, conflicts = [], 0
+    while len(claimed) < quantity:
+        batch, candidates = candidates[:quantity - len(claimed)], candidates[quantity - len(claimed):]
+        if not batch:
+            # Inside the write transaction now: nothing read here can be taken before commit
+            batch = _candidates(db, product.id, strategy, zone, quantity - len(claimed))
+            if not batch:
+                break
+        won = db.execute(CLAIM, {"ids": [row.id for row in batch], "reservation_id": reservation_id}).all()
+        conflicts += len(batch) - len(won)
+        claimed += won
+
+    if len(claimed) < quantity and not (allow_partial and claimed):
+        db.rollback()
+        raise ReservationConflict(f"Only {len(claimed)} of {quantity} units of {sku} available")
+
+    _status_changed(db, product.id, claimed, "in_stock", "reserved")
+    db.execute(update(_reservations).where(_reservations.c.id == reservation_id).values(quantity=len(claimed)))
+    alerts.check_product(db, product.id, stats.in_stock(db, product.id), product.reorder_point)
+    db.commit()
+    return {**get(db, reservation_id), "conflicts": conflicts}
+
+def _close(db: Session, reservation_id: int, status: str):
+    # Compare-and-swap on the reservation itself, so two closes cannot both go through
+    now = datetime.utcnow()
+    row = db.execute(update(_reservations).where(
+        _reservations.c.id == reservation_id, _reservations.c.status == "active"
+    ).values(status=status, updated_at=now).returning(_reservations.c.product_id)).first()
+    if row is None:
+        db.rollback()
+        if get(db, reservation_id) is None:
+            raise LookupError(f"Unknown reservation: {reservation_id}")
+        raise ReservationConflict(f"Reservation {reservation_id} is no longer active")
+    return row.product_id, now
+
+def release(db: Session, reservation_id: int) -> dict:
+    # Claimed items go back to stock
+    product_id, now = _close(db, reservation_id, "released")
+    items = db.execute(update(_items).where(
+        _items.c.reservation_id == reservation_id, _items.c.status == "reserved"
+    ).values(status="in_stock", reservation_id=None).returning(_items.c.rfid_tag, _items.c.location_zone)).all()
+    _status_changed(db, product_id, items, "reserved", "in_stock")
+    stale.items_restocked(db, [tag for tag, _ in items], now)
+    reorder_point = db.execute(select(_products.c.reorder_point).where(_products.c.id == product_id)).scalar()
+    alerts.check_product(db, product_id, stats.in_stock(db, product_id), reorder_point)
+    db.commit()
+    return get(db, reservation_id)
+
+def ship(db: Session, reservation_id: int) -> dict:
+    # Claimed items leave the warehouse; SHIPPED transactions feed the demand history
+    product_id, now = _close(db, reservation_id, "shipped")
+    items = db.execute(update(_items).where(
+        _items.c.reservation_id == reservation_id, _items.c.status == "reserved"
+    ).values(status="shipped").returning(_items.c.rfid_tag, _items.c.location_zone)).all()
+    if items:
+        db.execute(insert(_transactions), [{
+            "rfid_tag": tag, "action": "SHIPPED", "location": zone,
+            "scanned_by": f"reservation:{reservation_id}", "created_at": now, "product_id": product_id,
+        } for tag, zone in items])
+    _status_changed(db, product_id, items, "reserved", "shipped")
+    db.commit()
+    return get(db, reservation_id)
+
+def get(db: Session, reservation_id: int):
+    row = db.execute(RESERVATION, {"reservation_id": reservation_id}).first()
+    if row is None:
+        return None
+    items = db.execute(RESERVED_ITEMS, {"reservation_id": reservation_id}).all()
+    return {
+        **row._asdict(),
+        "items": [{"rfid_tag": tag, "location_zone": zone, "status": status} for tag, zone, status in items],
+    }
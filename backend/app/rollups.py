@@ -0,0 +1,78 @@
+﻿from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from . import models
+
+# Scanner id recorded when a scan arrives without one
+UNKNOWN_SCANNER = "unknown"
+
+def hour_bucket(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+def _increment(db: Session, model, keys: dict, counts: dict):
+    # Upsert: insert the bucket row or add to its counters in place
+    table = model.__table__
+    stmt = sqlite_insert(table).values(**keys, **counts)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={name: table.c[name] + stmt.excluded[name] for name in counts}
+    )
+    db.execute(stmt)
+
+def record_scan(db: Session, product_id, from_zone: str, to_zone: str,
+                scanner_id, scanned_at: datetime):
+    # Called inside the scan's own transaction so rollups commit with it
+    bucket = hour_bucket(scanned_at)
+    moved = 1 if from_zone != to_zone else 0
+
+    _increment(db, models.ZoneScanRollup,
+               {"bucket": bucket, "zone": to_zone},
+               {"scan_count": 1})
+    _increment(db, models.ScannerActivityRollup,
+               {"bucket": bucket, "scanner_id": scanner_id or UNKNOWN_SCANNER},
+               {"scan_count": 1})
+    if product_id is not None:
+        _increment(db, models.ProductMoveRollup,
+                   {"day": scanned_at.date(), "product_id": product_id},
+                   {"scan_count": 1, "move_count": moved})
+
+# Transaction.location is stored as "<from> -> <to>"; usable on any "t" alias
+TO_ZONE_SQL = """CASE WHEN instr(t.location, ' -> ') > 0
+    THEN substr(t.location, instr(t.location, ' -> ') + 4)
+    ELSE t.location END"""
+FROM_ZONE_SQL = """CASE WHEN instr(t.location, ' -> ') > 0
+    THEN substr(t.location, 1, instr(t.location, ' -> ') - 1)
+    ELSE t.location END"""
+_HOUR = "strftime('%Y-%m-%d %H:00:00.000000', t.created_at)"
+
+def rebuild_rollups(db: Session):
+    # Recompute every rollup from the transaction log (after bulk loads or schema changes)
+    db.execute(text("DELETE FROM rollup_zone_hourly"))
+    db.execute(text("DELETE FROM rollup_product_daily"))
+    db.execute(text("DELETE FROM rollup_scanner_hourly"))
+
+    db.execute(text(f"""
+        INSERT INTO rollup_zone_hourly (bucket, zone, scan_count)
+        SELECT {_HOUR}, {TO_ZONE_SQL}, COUNT(*)
+        FROM transactions t
+        WHERE t.action = 'SCANNED' AND t.created_at IS NOT NULL
+        GROUP BY 1, 2
+    """))
+    db.execute(text(f"""
+        INSERT INTO rollup_scanner_hourly (bucket, scanner_id, scan_count)
+        SELECT {_HOUR}, COALESCE(t.scanned_by, '{UNKNOWN_SCANNER}'), COUNT(*)
+        FROM transactions t
+        WHERE t.action = 'SCANNED' AND t.created_at IS NOT NULL
+        GROUP BY 1, 2
+    """))
+    db.execute(text(f"""
+        INSERT INTO rollup_product_daily (day, product_id, scan_count, move_count)
+        SELECT date(t.created_at), t.product_id, COUNT(*),
+               SUM(CASE WHEN {FROM_ZONE_SQL} != {TO_ZONE_SQL} THEN 1 ELSE 0 END)
+        FROM transactions t
+        WHERE t.action = 'SCANNED' AND t.created_at IS NOT NULL
+              AND t.product_id IS NOT NULL
+        GROUP BY 1, 2
+    """))
+    db.commit()
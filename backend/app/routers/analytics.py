@@ -0,0 +1,59 @@
+﻿from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import List, Optional
+from pydantic import BaseModel
+from .. import analytics, flow, formats
+from ..database import get_db, request_site, site_path
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+
+class ZoneDwell(BaseModel):
+    zone: str
+    visits: int
+    mean_hours: float
+    p50_hours: float
+    p90_hours: float
+    p99_hours: float
+
+class ZoneTransition(BaseModel):
+    from_zone: str
+    to_zone: str
+    moves: int
+
+class ZoneFlow(BaseModel):
+    last_transaction_id: int
+    pending_transactions: int
+    dwell: List[ZoneDwell]
+    transitions: List[ZoneTransition]
+
+# Declared before /{report}: served from the incremental flow rollups, not DuckDB
+@router.get("/flow", response_model=ZoneFlow, response_class=formats.FastJSONResponse)
+def get_zone_flow(db: Session = Depends(get_db)):
+    flow.catch_up(db)
+    return formats.FastJSONResponse(flow.summary(db))
+
+@router.get("/{report}")
+async def get_report(
+    request: Request,
+    report: str,
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    format: str = Query("arrow", pattern="^(arrow|parquet)$")
+):
+    if report not in analytics.REPORTS:
+        raise HTTPException(status_code=404, detail=f"Unknown report: {report}")
+    
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=30)
+    
+    # DuckDB work is blocking; keep it off the event loop
+    site = request_site(request)
+    table = await run_in_threadpool(analytics.run_report, report, start, end,
+                                    database=site_path(site), archive_dir=analytics.archive_dir(site))
+    
+    if format == "parquet":
+        return Response(formats.to_parquet(table), media_type=formats.PARQUET)
+    return Response(formats.to_arrow_stream(table), media_type=formats.ARROW_STREAM)
@@ -0,0 +1,67 @@
+from fastapi import APIRouter, HTTPException, Request
+from datetime import datetime
+from .. import backups
+from ..database import request_site
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+# Backups are files next to the database, so these routes open no session.
+# Restoring is command-line only (python -m app.backups restore): it writes a new
+# database file, which replaces the live one while the API is stopped.
+router = APIRouter(prefix="/api/backups", tags=["backups"])
+
+class Schedule(BaseModel):
+    enabled: bool
+    frequency: str = Field(pattern="^(hourly|daily|weekly)$")
+
+class Snapshot(BaseModel):
+    file: str
+    created_at: datetime
+    last_transaction_id: int
+    schema_version: Optional[int]
+    bytes: int
+    sha256: str
+
+class LogSummary(BaseModel):
+    segments: int
+    bytes: int
+    last_transaction_id: Optional[int]
+    last_at: Optional[datetime]
+
+class BackupCatalog(BaseModel):
+    schedule: Schedule
+    snapshots: List[Snapshot]
+    log: LogSummary
+
+class VerifyResult(BaseModel):
+    checked: int
+    failed: List[str]
+
+def _call(action, *args, **kwargs):
+    # Service errors to HTTP: bad input 422, a backup already running 409
+    try:
+        return action(*args, **kwargs)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except backups.BackupBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@router.get("", response_model=BackupCatalog)
+def list_backups(request: Request):
+    return backups.catalog(request_site(request))
+
+@router.get("/schedule", response_model=Schedule)
+def get_schedule(request: Request):
+    return backups.get_schedule(request_site(request))
+
+@router.post("/schedule", response_model=Schedule)
+def set_schedule(schedule: Schedule, request: Request):
+    return _call(backups.set_schedule, request_site(request), schedule.enabled, schedule.frequency)
+
+@router.post("/snapshot", response_model=Snapshot, status_code=201)
+def take_snapshot(request: Request):
+    return _call(backups.snapshot, request_site(request))
+
+@router.post("/verify", response_model=VerifyResult)
+def verify_backups(request: Request):
+    return backups.verify(request_site(request))
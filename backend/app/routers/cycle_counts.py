@@ -0,0 +1,108 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from datetime import datetime
+from .. import cycle_counts, formats
+from ..database import get_db
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+router = APIRouter(prefix="/api/cycle-counts", tags=["cycle counts"])
+
+MAX_TAGS_PER_BATCH = 5000
+
+class CycleCountRequest(BaseModel):
+    zones: List[str] = Field(min_length=1, max_length=200)
+    counted_by: Optional[str] = None
+
+class ReadBatch(BaseModel):
+    zone: str
+    tags: List[str] = Field(max_length=MAX_TAGS_PER_BATCH)
+    # When the handheld read the batch; defaults to when it arrives
+    read_at: Optional[datetime] = None
+
+class ReadBatchResponse(BaseModel):
+    accepted: int
+    # Distinct tags read in the session so far
+    reads: int
+
+class CountedZone(BaseModel):
+    zone: str
+    # Items the zone index has there now (in stock or reserved)
+    expected: int
+
+class CycleCountResponse(BaseModel):
+    id: int
+    status: str
+    counted_by: Optional[str]
+    created_at: datetime
+    closed_at: Optional[datetime]
+    zones: List[CountedZone]
+    reads: int
+    found: Optional[int]
+    missing: Optional[int]
+    unexpected: Optional[int]
+    misplaced: Optional[int]
+
+class Variance(BaseModel):
+    rfid_tag: str
+    outcome: str
+    product_id: Optional[int]
+    expected_zone: Optional[str]
+    counted_zone: Optional[str]
+
+class VariancePage(BaseModel):
+    variances: List[Variance]
+    next: Optional[str]
+
+VARIANCE_FIELDS = ("rfid_tag", "outcome", "product_id", "expected_zone", "counted_zone")
+
+def _call(action, *args, **kwargs):
+    # Service errors to HTTP: unknown ids 404, bad input 422, sessions no longer open 409
+    try:
+        return action(*args, **kwargs)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except cycle_counts.CycleCountConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@router.post("", response_model=CycleCountResponse, status_code=201)
+def open_cycle_count(request: CycleCountRequest, db: Session = Depends(get_db)):
+    return _call(cycle_counts.open_count, db, request.zones, request.counted_by)
+
+@router.get("/{count_id}", response_model=CycleCountResponse)
+def get_cycle_count(count_id: int, db: Session = Depends(get_db)):
+    count = cycle_counts.get(db, count_id)
+    if count is None:
+        raise HTTPException(status_code=404, detail=f"Unknown cycle count: {count_id}")
+    return count
+
+@router.post("/{count_id}/reads", response_model=ReadBatchResponse)
+def add_reads(count_id: int, batch: ReadBatch, db: Session = Depends(get_db)):
+    return _call(cycle_counts.add_reads, db, count_id, batch.zone, batch.tags, batch.read_at)
+
+@router.post("/{count_id}/close", response_model=CycleCountResponse)
+def close_cycle_count(count_id: int, db: Session = Depends(get_db)):
+    return _call(cycle_counts.close, db, count_id)
+
+@router.post("/{count_id}/cancel", response_model=CycleCountResponse)
+def cancel_cycle_count(count_id: int, db: Session = Depends(get_db)):
+    return _call(cycle_counts.cancel, db, count_id)
+
+@router.get("/{count_id}/variances", response_model=VariancePage, response_class=formats.FastJSONResponse)
+def list_variances(
+    count_id: int,
+    outcome: Optional[str] = Query(None, pattern="^(missing|unexpected|misplaced)$"),
+    after: str = "",
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    # Tags that differed from the database, in tag order; after is the previous page's next
+    if cycle_counts.get(db, count_id) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown cycle count: {count_id}")
+    rows = cycle_counts.variances_page(db, count_id, outcome, after, limit)
+    return formats.FastJSONResponse({
+        "variances": [dict(zip(VARIANCE_FIELDS, row)) for row in rows],
+        "next": rows[-1].rfid_tag if len(rows) == limit else None,
+    })
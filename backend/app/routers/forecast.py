@@ -0,0 +1,42 @@
+﻿from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from datetime import datetime
+from .. import forecasting
+from ..database import get_db
+from typing import Optional, List
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/api/forecast", tags=["forecast"])
+
+class ProductForecast(BaseModel):
+    product_id: int
+    sku: str
+    name: str
+    model: str
+    current_quantity: int
+    daily_forecast: float
+    horizon_total: float
+    horizon_lower: float
+    horizon_upper: float
+    days_of_cover: Optional[float] = None
+
+class DailyForecast(BaseModel):
+    date: str
+    forecast: float
+    lower: float
+    upper: float
+
+class ForecastResponse(BaseModel):
+    generated_at: datetime
+    horizon: int
+    history_days: int
+    products: List[ProductForecast]
+    daily: List[DailyForecast]
+
+@router.get("", response_model=ForecastResponse)
+def get_forecast(
+    horizon: int = Query(30, ge=1, le=365),
+    history_days: int = Query(180, ge=14, le=1095),
+    db: Session = Depends(get_db)
+):
+    return forecasting.get_forecast(db, horizon, history_days)
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+from .. import health
+from ..database import request_site
+
+router = APIRouter(tags=["health"])
+
+# Plain def: a stale cache refresh touches the database, so it runs in the threadpool
+
+@router.get("/health/live")
+def liveness():
+    # Process is up and serving; deliberately no dependency checks
+    return {"status": "alive"}
+
+@router.get("/health/ready")
+@router.get("/api/health")
+def readiness():
+    result = health.readiness()
+    return JSONResponse(result, status_code=200 if result["ready"] else 503)
+
+@router.get("/api/status")
+def get_status(request: Request):
+    return health.status_summary(request_site(request))
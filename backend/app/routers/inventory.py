@@ -1,6 +1,6 @@
-﻿from fastapi import APIRouter, Depends
+﻿from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
-from .. import models
+from .. import models, formats, queries
 from ..database import get_db
 from typing import List
 from pydantic import BaseModel
@@ -31,55 +31,25 @@ class ReorderAlertResponse(BaseModel):
     class Config:
         from_attributes = True
 
-@router.get("/levels", response_model=List[InventoryLevel])
-async def get_inventory_levels(db: Session = Depends(get_db)):
-    products = db.query(models.Product).all()
-    result = []
-    
-    for product in products:
-        stock_count = db.query(models.InventoryItem).filter(
-            models.InventoryItem.product_id == product.id,
-            models.InventoryItem.status == 'in_stock'
-        ).count()
-        
-        result.append({
-            "id": product.id,
-            "sku": product.sku,
-            "name": product.name,
-            "current_quantity": stock_count,
-            "reorder_point": product.reorder_point,
-            "reorder_quantity": product.reorder_quantity,
-            "needs_reorder": stock_count <= product.reorder_point
-        })
-    
-    return result
+LEVEL_FIELDS = ("id", "sku", "name", "current_quantity", "reorder_point", "reorder_quantity", "needs_reorder")
+ALERT_FIELDS = ("id", "product_id", "product_name", "current_quantity", "reorder_point", "status", "created_at")
 
-@router.get("/alerts", response_model=List[ReorderAlertResponse])
-async def get_reorder_alerts(db: Session = Depends(get_db)):
-    alerts = db.query(models.ReorderAlert).filter(
-        models.ReorderAlert.status == "pending"
-    ).all()
+@router.get("/levels", response_model=List[InventoryLevel], response_class=formats.FastJSONResponse)
+def get_inventory_levels(request: Request, db: Session = Depends(get_db)):
+    rows = queries.stock_levels(db)
     
-    result = []
-    for alert in alerts:
-        product = db.query(models.Product).filter(
-            models.Product.id == alert.product_id
-        ).first()
-        
-        result.append({
-            "id": alert.id,
-            "product_id": alert.product_id,
-            "product_name": product.name if product else "Unknown",
-            "current_quantity": alert.current_quantity,
-            "reorder_point": alert.reorder_point,
-            "status": alert.status,
-            "created_at": alert.created_at.strftime("%Y-%m-%d %H:%M:%S") if alert.created_at else ""
-        })
-    
-    return result
+    # Arrow/msgpack clients get columns built straight from the rows
+    media_type = formats.negotiate(request)
+    if media_type:
+        return formats.columnar_response(formats.columns_from_rows(LEVEL_FIELDS, rows), media_type)
+    return formats.json_rows(LEVEL_FIELDS, rows, formats.VARY_ACCEPT)
+
+@router.get("/alerts", response_model=List[ReorderAlertResponse], response_class=formats.FastJSONResponse)
+def get_reorder_alerts(db: Session = Depends(get_db)):
+    return formats.json_rows(ALERT_FIELDS, queries.pending_alerts(db))
 
 @router.post("/alerts/{alert_id}/resolve")
-async def resolve_alert(alert_id: int, db: Session = Depends(get_db)):
+def resolve_alert(alert_id: int, db: Session = Depends(get_db)):
     alert = db.query(models.ReorderAlert).filter(
         models.ReorderAlert.id == alert_id
     ).first()
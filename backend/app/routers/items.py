@@ -0,0 +1,138 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from .. import formats, queries, stale
+from ..database import get_db
+from pydantic import BaseModel
+from typing import Optional, List
+
+router = APIRouter(prefix="/api/items", tags=["items"])
+
+MAX_TAGS = 200
+MAX_MOVEMENTS = 100
+MAX_PAGE = 500
+
+class Movement(BaseModel):
+    action: str
+    location: Optional[str]
+    scanned_by: Optional[str]
+    created_at: datetime
+
+class ItemProduct(BaseModel):
+    id: int
+    sku: Optional[str]
+    name: Optional[str]
+
+class ItemDetail(BaseModel):
+    rfid_tag: str
+    status: Optional[str]
+    location_zone: str
+    last_scanned_at: Optional[datetime]
+    product: Optional[ItemProduct]
+    movements: List[Movement]
+
+class ItemLookup(BaseModel):
+    items: List[ItemDetail]
+    missing: List[str]
+
+class StaleItem(BaseModel):
+    rfid_tag: str
+    product_id: Optional[int]
+    location_zone: str
+    last_scanned_at: datetime
+    days_unseen: float
+
+class StalePage(BaseModel):
+    cutoff: datetime
+    items: List[StaleItem]
+    next: Optional[str]
+
+class MissingAlert(BaseModel):
+    id: int
+    rfid_tag: str
+    product_id: Optional[int]
+    zone: str
+    last_scanned_at: datetime
+    threshold_days: float
+    created_at: datetime
+
+class MissingPage(BaseModel):
+    alerts: List[MissingAlert]
+    next: Optional[int]
+
+MISSING_FIELDS = ("id", "rfid_tag", "product_id", "zone", "last_scanned_at", "threshold_days", "created_at")
+
+MOVEMENT_FIELDS = ("action", "location", "scanned_by", "created_at")
+
+def _details(db: Session, tags: List[str], movements: int) -> dict:
+    found = {}
+    moves = {}
+    if movements:
+        for tag, *row in queries.tags_movements(db, tags, movements):
+            moves.setdefault(tag, []).append(dict(zip(MOVEMENT_FIELDS, row)))
+    for tag, status, zone, last_scanned_at, product_id, sku, name in queries.items_by_tags(db, tags):
+        found[tag] = {
+            "rfid_tag": tag,
+            "status": status,
+            "location_zone": zone,
+            "last_scanned_at": last_scanned_at,
+            "product": {"id": product_id, "sku": sku, "name": name} if product_id is not None else None,
+            "movements": moves.get(tag, []),
+        }
+    return found
+
+def _parse_cursor(cursor: str):
+    # "<last_scanned_at ISO>|<id>" of the previous page's last row
+    try:
+        seen, _, item_id = cursor.rpartition("|")
+        return datetime.fromisoformat(seen), int(item_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid cursor: {cursor}")
+
+@router.get("/stale", response_model=StalePage, response_class=formats.FastJSONResponse)
+def get_stale_items(zone: Optional[str] = None, days: Optional[float] = Query(None, gt=0),
+                    cursor: Optional[str] = None, limit: int = Query(100, ge=1, le=MAX_PAGE),
+                    db: Session = Depends(get_db)):
+    # In-stock items unseen for `days` (default: the zone's threshold), oldest first
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=days or stale.threshold_days(zone))
+    rows = stale.stale_page(db, cutoff, zone, _parse_cursor(cursor) if cursor else None, limit)
+    items = [{
+        "rfid_tag": tag, "product_id": product_id, "location_zone": location_zone,
+        "last_scanned_at": last_scanned_at,
+        "days_unseen": round((now - last_scanned_at).total_seconds() / 86400, 2),
+    } for _, tag, product_id, location_zone, last_scanned_at in rows]
+    last = rows[-1] if len(rows) == limit else None
+    return formats.FastJSONResponse({
+        "cutoff": cutoff, "items": items,
+        "next": f"{last.last_scanned_at.isoformat()}|{last.id}" if last else None,
+    })
+
+@router.get("/missing", response_model=MissingPage, response_class=formats.FastJSONResponse)
+def get_missing_alerts(after: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=MAX_PAGE),
+                       db: Session = Depends(get_db)):
+    # Open "possibly missing" alerts raised by the stale item sweeper or a cycle count, oldest first
+    rows = stale.open_alerts_page(db, after, limit)
+    return formats.FastJSONResponse({
+        "alerts": [dict(zip(MISSING_FIELDS, row)) for row in rows],
+        "next": rows[-1].id if len(rows) == limit else None,
+    })
+
+@router.get("/{rfid_tag}", response_model=ItemDetail)
+def get_item(rfid_tag: str, request: Request, movements: int = Query(20, ge=0, le=MAX_MOVEMENTS),
+             db: Session = Depends(get_db)):
+    item = _details(db, [rfid_tag], movements).get(rfid_tag)
+    if item is None:
+        raise HTTPException(status_code=404, detail=f"Unknown RFID tag: {rfid_tag}")
+    return formats.validated_json(request, item)
+
+@router.get("", response_model=ItemLookup)
+def get_items(request: Request, tag: List[str] = Query(..., max_length=MAX_TAGS),
+              movements: int = Query(0, ge=0, le=MAX_MOVEMENTS), db: Session = Depends(get_db)):
+    # Bulk variant: ?tag=A&tag=B..., answered in request order
+    tags = list(dict.fromkeys(tag))
+    found = _details(db, tags, movements)
+    return formats.validated_json(request, {
+        "items": [found[t] for t in tags if t in found],
+        "missing": [t for t in tags if t not in found],
+    })
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from datetime import datetime
+from .. import picking
+from ..database import get_db
+from pydantic import BaseModel, Field
+from typing import List
+
+router = APIRouter(prefix="/api/picking", tags=["picking"])
+
+class WaveRequest(BaseModel):
+    max_lines: int = Field(picking.MAX_LINES, gt=0, le=10000)
+    max_orders: int = Field(picking.MAX_ORDERS, gt=0, le=1000)
+
+class PickItem(BaseModel):
+    rfid_tag: str
+    sku: str
+    order_ref: str
+    reservation_id: int
+
+class PickStop(BaseModel):
+    zone: str
+    items: List[PickItem]
+
+class PickWave(BaseModel):
+    id: int
+    created_at: datetime
+    orders: int
+    lines: int
+    # Walk from the depot through every stop and back, in bays
+    distance: float
+    stops: List[PickStop]
+
+class WaveSummary(BaseModel):
+    id: int
+    created_at: datetime
+    orders: int
+    lines: int
+
+@router.post("/waves", response_model=List[PickWave], status_code=201)
+def create_waves(request: WaveRequest, db: Session = Depends(get_db)):
+    # Batches every active reservation not yet in a wave
+    return picking.generate(db, request.max_lines, request.max_orders)
+
+@router.get("/waves", response_model=List[WaveSummary])
+def list_waves(db: Session = Depends(get_db)):
+    return picking.open_waves(db)
+
+@router.get("/waves/{wave_id}", response_model=PickWave)
+def get_wave(wave_id: int, db: Session = Depends(get_db)):
+    wave = picking.get(db, wave_id)
+    if wave is None:
+        raise HTTPException(status_code=404, detail=f"Unknown pick wave: {wave_id}")
+    return wave
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+from .. import formats, queries, stats
+from ..database import get_db
+from pydantic import BaseModel
+from typing import Dict, List
+
+router = APIRouter(prefix="/api/products", tags=["products"])
+
+MAX_SKUS = 200
+
+class ZoneStock(BaseModel):
+    zone: str
+    status: str
+    count: int
+
+class ProductDetail(BaseModel):
+    id: int
+    sku: str
+    name: str
+    reorder_point: int
+    reorder_quantity: int
+    in_stock: int
+    needs_reorder: bool
+    by_status: Dict[str, int]
+    by_zone: List[ZoneStock]
+
+class ProductLookup(BaseModel):
+    products: List[ProductDetail]
+    missing: List[str]
+
+def _details(db: Session, skus: List[str]) -> dict:
+    products = queries.products_by_skus(db, skus)
+    if not products:
+        return {}
+    by_id = {}
+    for product_id, sku, name, reorder_point, reorder_quantity in products:
+        by_id[product_id] = {
+            "id": product_id, "sku": sku, "name": name,
+            "reorder_point": reorder_point, "reorder_quantity": reorder_quantity,
+            "by_status": {status: 0 for status in stats.ITEM_STATUSES},
+            "by_zone": [],
+        }
+    for product_id, zone, status, count in queries.product_stock(db, by_id):
+        product = by_id[product_id]
+        product["by_status"][status] = product["by_status"].get(status, 0) + count
+        product["by_zone"].append({"zone": zone, "status": status, "count": count})
+    for product in by_id.values():
+        product["in_stock"] = product["by_status"]["in_stock"]
+        product["needs_reorder"] = product["in_stock"] <= product["reorder_point"]
+    return {product["sku"]: product for product in by_id.values()}
+
+@router.get("/{sku}", response_model=ProductDetail)
+def get_product(sku: str, request: Request, db: Session = Depends(get_db)):
+    product = _details(db, [sku]).get(sku)
+    if product is None:
+        raise HTTPException(status_code=404, detail=f"Unknown SKU: {sku}")
+    return formats.validated_json(request, product)
+
+@router.get("", response_model=ProductLookup)
+def get_products(request: Request, sku: List[str] = Query(..., max_length=MAX_SKUS),
+                 db: Session = Depends(get_db)):
+    # Bulk variant: ?sku=A&sku=B..., answered in request order
+    skus = list(dict.fromkeys(sku))
+    found = _details(db, skus)
+    return formats.validated_json(request, {
+        "products": [found[s] for s in skus if s in found],
+        "missing": [s for s in skus if s not in found],
+    })
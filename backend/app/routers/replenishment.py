@@ -0,0 +1,74 @@
+﻿from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from datetime import datetime
+from .. import models, replenishment
+from ..database import get_db
+from typing import Optional, List
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/api/replenishment", tags=["replenishment"])
+
+class ProposalResponse(BaseModel):
+    id: int
+    product_id: int
+    sku: str
+    name: str
+    mean_daily_demand: float
+    demand_std: float
+    lead_time_days: float
+    service_level: float
+    safety_stock: int
+    reorder_point: int
+    reorder_quantity: int
+    previous_reorder_point: Optional[int] = None
+    previous_reorder_quantity: Optional[int] = None
+    explanation: Optional[str] = None
+    status: str
+    created_at: datetime
+
+class ApplyRequest(BaseModel):
+    ids: Optional[List[int]] = None
+
+@router.post("/run")
+def run_replenishment(
+    full: bool = False,
+    lead_time_days: float = Query(replenishment.DEFAULT_LEAD_TIME_DAYS, gt=0),
+    service_level: float = Query(replenishment.DEFAULT_SERVICE_LEVEL, gt=0.5, lt=1),
+    safety_multiplier: float = Query(1.0, gt=0),
+    db: Session = Depends(get_db)
+):
+    # Changing the policy inputs only reaches idle products with full=true
+    return replenishment.run(db, full, lead_time_days, service_level, safety_multiplier)
+
+@router.get("/proposals", response_model=List[ProposalResponse])
+def get_proposals(status: str = "proposed", db: Session = Depends(get_db)):
+    rows = db.query(models.ReorderProposal, models.Product.sku, models.Product.name).join(
+        models.Product, models.Product.id == models.ReorderProposal.product_id
+    ).filter(
+        models.ReorderProposal.status == status
+    ).order_by(models.ReorderProposal.product_id).all()
+    
+    return [
+        {**{c.name: getattr(proposal, c.name) for c in models.ReorderProposal.__table__.columns},
+         "sku": sku, "name": name}
+        for proposal, sku, name in rows
+    ]
+
+@router.post("/proposals/apply")
+def apply_proposals(request: ApplyRequest, db: Session = Depends(get_db)):
+    applied = replenishment.apply_proposals(db, request.ids)
+    return {"message": "Proposals applied", "applied": applied}
+
+@router.post("/proposals/{proposal_id}/reject")
+def reject_proposal(proposal_id: int, db: Session = Depends(get_db)):
+    proposal = db.query(models.ReorderProposal).filter(
+        models.ReorderProposal.id == proposal_id,
+        models.ReorderProposal.status == "proposed"
+    ).first()
+    
+    if not proposal:
+        raise HTTPException(status_code=404, detail="Open proposal not found")
+    
+    proposal.status = "rejected"
+    db.commit()
+    return {"message": "Proposal rejected", "status": "rejected"}
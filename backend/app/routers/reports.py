@@ -0,0 +1,108 @@
+﻿from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from datetime import datetime, time, timedelta
+from .. import models, rollups
+from ..database import get_db
+from typing import Optional, List
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/api/reports", tags=["reports"])
+
+class ZoneActivity(BaseModel):
+    bucket: str
+    zone: str
+    scans: int
+
+class ProductMoves(BaseModel):
+    day: str
+    product_id: int
+    sku: str
+    name: str
+    scans: int
+    moves: int
+
+class ScannerActivity(BaseModel):
+    bucket: str
+    scanner_id: str
+    scans: int
+
+class MovementReport(BaseModel):
+    start: datetime
+    end: datetime
+    granularity: str
+    zones: List[ZoneActivity]
+    products: List[ProductMoves]
+    scanners: List[ScannerActivity]
+
+def _bucket_column(column, granularity: str):
+    # Hourly rollups are re-grouped per day in SQL when asked for daily data
+    if granularity == "day":
+        return func.date(column)
+    return func.strftime("%Y-%m-%d %H:00:00", column)
+
+@router.get("/movement", response_model=MovementReport)
+def get_movement_report(
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    granularity: str = Query("hour", pattern="^(hour|day)$"),
+    db: Session = Depends(get_db)
+):
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=7)
+    # Half-open [from, to) at both granularities: a bucket is in when it starts before
+    # `to`, so a `to` at midnight leaves that day out of the hourly and daily rows alike
+    start_bucket = rollups.hour_bucket(start)
+    end_day = end.date() if end.time() == time.min else end.date() + timedelta(days=1)
+
+    zone_bucket = _bucket_column(models.ZoneScanRollup.bucket, granularity)
+    zones = db.query(
+        zone_bucket, models.ZoneScanRollup.zone, func.sum(models.ZoneScanRollup.scan_count)
+    ).filter(
+        models.ZoneScanRollup.bucket >= start_bucket,
+        models.ZoneScanRollup.bucket < end
+    ).group_by(zone_bucket, models.ZoneScanRollup.zone).order_by(zone_bucket).all()
+
+    scanner_bucket = _bucket_column(models.ScannerActivityRollup.bucket, granularity)
+    scanners = db.query(
+        scanner_bucket, models.ScannerActivityRollup.scanner_id,
+        func.sum(models.ScannerActivityRollup.scan_count)
+    ).filter(
+        models.ScannerActivityRollup.bucket >= start_bucket,
+        models.ScannerActivityRollup.bucket < end
+    ).group_by(scanner_bucket, models.ScannerActivityRollup.scanner_id).order_by(scanner_bucket).all()
+
+    # Product moves are only kept per day
+    products = db.query(
+        models.ProductMoveRollup.day, models.Product.id, models.Product.sku, models.Product.name,
+        models.ProductMoveRollup.scan_count, models.ProductMoveRollup.move_count
+    ).join(
+        models.Product, models.Product.id == models.ProductMoveRollup.product_id
+    ).filter(
+        models.ProductMoveRollup.day >= start.date(),
+        models.ProductMoveRollup.day < end_day
+    ).order_by(models.ProductMoveRollup.day).all()
+
+    return {
+        "start": start,
+        "end": end,
+        "granularity": granularity,
+        "zones": [
+            {"bucket": bucket, "zone": zone, "scans": scans}
+            for bucket, zone, scans in zones
+        ],
+        "products": [
+            {"day": day.isoformat(), "product_id": pid, "sku": sku, "name": name,
+             "scans": scans, "moves": moves}
+            for day, pid, sku, name, scans, moves in products
+        ],
+        "scanners": [
+            {"bucket": bucket, "scanner_id": scanner_id, "scans": scans}
+            for bucket, scanner_id, scans in scanners
+        ]
+    }
+
+@router.post("/rollups/rebuild")
+def rebuild_rollups(db: Session = Depends(get_db)):
+    rollups.rebuild_rollups(db)
+    return {"message": "Rollups rebuilt from transaction log"}
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from datetime import datetime
+from .. import reservations
+from ..database import get_db
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+router = APIRouter(prefix="/api/reservations", tags=["reservations"])
+
+MAX_UNITS = 1000
+
+class ReservationRequest(BaseModel):
+    order_ref: str
+    sku: str
+    quantity: int = Field(gt=0, le=MAX_UNITS)
+    strategy: str = Field("fifo", pattern="^(fifo|nearest)$")
+    # Pick location that "nearest" measures distance from
+    zone: Optional[str] = None
+    allow_partial: bool = False
+
+class ReservedItem(BaseModel):
+    rfid_tag: str
+    location_zone: str
+    status: str
+
+class ReservationResponse(BaseModel):
+    id: int
+    order_ref: str
+    sku: str
+    product_id: int
+    requested: int
+    quantity: int
+    strategy: str
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    items: List[ReservedItem]
+
+def _call(action, *args, **kwargs):
+    # Service errors to HTTP: unknown ids 404, bad input 422, lost races and short stock 409
+    try:
+        return action(*args, **kwargs)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except reservations.ReservationConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@router.post("", response_model=ReservationResponse, status_code=201)
+def create_reservation(request: ReservationRequest, db: Session = Depends(get_db)):
+    return _call(reservations.reserve, db, request.order_ref, request.sku, request.quantity,
+                 request.strategy, request.zone, request.allow_partial)
+
+@router.get("/{reservation_id}", response_model=ReservationResponse)
+def get_reservation(reservation_id: int, db: Session = Depends(get_db)):
+    reservation = reservations.get(db, reservation_id)
+    if reservation is None:
+        raise HTTPException(status_code=404, detail=f"Unknown reservation: {reservation_id}")
+    return reservation
+
+@router.post("/{reservation_id}/release", response_model=ReservationResponse)
+def release_reservation(reservation_id: int, db: Session = Depends(get_db)):
+    return _call(reservations.release, db, reservation_id)
+
+@router.post("/{reservation_id}/ship", response_model=ReservationResponse)
+def ship_reservation(reservation_id: int, db: Session = Depends(get_db)):
+    return _call(reservations.ship, db, reservation_id)
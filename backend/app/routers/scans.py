@@ -1,7 +1,7 @@
-﻿from fastapi import APIRouter, Depends, HTTPException
+﻿from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from datetime import datetime
-from .. import models
+from .. import queries, rollups, formats, stale, stats, zones
 from ..database import get_db
 from pydantic import BaseModel
 from typing import Optional, List
@@ -23,28 +23,23 @@ class ScanResponse(BaseModel):
         from_attributes = True
 
 @router.post("/")
-async def process_scan(scan: ScanEvent, db: Session = Depends(get_db)):
+def process_scan(scan: ScanEvent, db: Session = Depends(get_db)):
     # Find the inventory item
-    item = db.query(models.InventoryItem).filter(
-        models.InventoryItem.rfid_tag == scan.rfid_tag
-    ).first()
+    item = queries.item_by_tag(db, scan.rfid_tag)
     
     if not item:
         raise HTTPException(status_code=404, detail=f"Unknown RFID tag: {scan.rfid_tag}")
     
-    # Update item location and timestamp
-    old_location = item.location_zone
-    item.location_zone = scan.location
-    item.last_scanned_at = datetime.utcnow()
+    # Move the item and log the transaction
+    now = datetime.utcnow()
+    queries.record_move(db, item, scan.location, scan.scanner_id, now)
     
-    # Log transaction
-    transaction = models.Transaction(
-        rfid_tag=scan.rfid_tag,
-        action="SCANNED",
-        location=f"{old_location} -> {scan.location}",
-        scanned_by=scan.scanner_id
-    )
-    db.add(transaction)
+    # Update reporting rollups in the same transaction
+    rollups.record_scan(db, item.product_id, item.location_zone, scan.location,
+                        scan.scanner_id, now)
+    stats.record_scan(db, item, scan.location, now)
+    zones.record_move(db, item, scan.location)
+    stale.item_seen(db, scan.rfid_tag, now)
     db.commit()
     
     return {
@@ -53,9 +48,14 @@ async def process_scan(scan: ScanEvent, db: Session = Depends(get_db)):
         "new_location": scan.location
     }
 
-@router.get("/recent", response_model=List[ScanResponse])
-async def get_recent_scans(limit: int = 50, db: Session = Depends(get_db)):
-    scans = db.query(models.Transaction).order_by(
-        models.Transaction.created_at.desc()
-    ).limit(limit).all()
-    return scans
+SCAN_FIELDS = ("rfid_tag", "action", "location", "created_at")
+
+@router.get("/recent", response_model=List[ScanResponse], response_class=formats.FastJSONResponse)
+def get_recent_scans(request: Request, limit: int = 50, db: Session = Depends(get_db)):
+    # Plain column tuples, no ORM objects or per-row validation
+    rows = queries.recent_scans(db, limit)
+    
+    media_type = formats.negotiate(request)
+    if media_type:
+        return formats.columnar_response(formats.columns_from_rows(SCAN_FIELDS, rows), media_type)
+    return formats.json_rows(SCAN_FIELDS, rows, formats.VARY_ACCEPT)
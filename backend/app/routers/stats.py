@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from .. import stats
+from ..database import get_db
+from typing import Dict
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/api", tags=["stats"])
+
+class WarehouseStats(BaseModel):
+    total_items: int
+    in_stock_items: int
+    items_by_status: Dict[str, int]
+    low_stock_items: int
+    active_zones: int
+    scans_last_hour: int
+    as_of: str
+
+@router.get("/stats", response_model=WarehouseStats)
+def get_stats(db: Session = Depends(get_db)):
+    # Read from counters maintained on every write, not aggregated per request
+    return stats.summary(db)
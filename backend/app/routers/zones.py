@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from datetime import datetime
+from .. import formats, zones
+from ..database import get_db
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+router = APIRouter(prefix="/api/zones", tags=["zones"])
+
+MAX_ZONE_ITEMS = 1000
+
+class ZoneSummary(BaseModel):
+    zone: str
+    items: int
+    in_stock: int
+    in_stock_products: int
+    by_status: Dict[str, int]
+
+class ZoneProduct(BaseModel):
+    product_id: Optional[int]
+    sku: Optional[str]
+    name: Optional[str]
+    status: str
+    count: int
+
+class ZoneItem(BaseModel):
+    rfid_tag: str
+    product_id: Optional[int]
+    status: Optional[str]
+    last_scanned_at: Optional[datetime]
+
+class ZoneContents(BaseModel):
+    zone: str
+    items: int
+    products: List[ZoneProduct]
+    tags: List[ZoneItem]
+
+ZONE_ITEM_FIELDS = ("rfid_tag", "product_id", "status", "last_scanned_at")
+
+@router.get("", response_model=List[ZoneSummary], response_class=formats.FastJSONResponse)
+def get_zones(db: Session = Depends(get_db)):
+    return formats.FastJSONResponse(zones.zone_totals(db))
+
+# :path, so a zone name containing "/" (sent as %2F) still reaches the handler
+@router.get("/{zone:path}/contents", response_model=ZoneContents, response_class=formats.FastJSONResponse)
+def get_zone_contents(zone: str, items: int = Query(0, ge=0, le=MAX_ZONE_ITEMS), db: Session = Depends(get_db)):
+    # Counts per product and status from the zone index; ?items=N also lists up to N tags
+    rows = zones.zone_contents(db, zone)
+    if not rows:
+        raise HTTPException(status_code=404, detail=f"Zone is empty or unknown: {zone}")
+    return formats.FastJSONResponse({
+        "zone": zone,
+        "items": sum(row[4] for row in rows),
+        "products": [
+            {"product_id": product_id or None, "sku": sku, "name": name, "status": status, "count": count}
+            for product_id, sku, name, status, count in rows
+        ],
+        "tags": [dict(zip(ZONE_ITEM_FIELDS, row)) for row in zones.zone_items(db, zone, items)] if items else [],
+    })
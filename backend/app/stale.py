@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from sqlalchemy import Integer, bindparam, exists, insert, literal, select, tuple_, update
+from sqlalchemy.orm import Session
+from . import coordination, jobs, models
+from .database import SITES, site_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Stale-tag sweeper: in-stock items whose last scan is older than their zone's threshold
+# get a "possibly missing" alert. Each pass only looks at items that crossed a threshold
+# since the previous pass, an index range on ix_inventory_items_status_seen, so its cost
+# follows the number of newly stale items, not the size of inventory_items. Items that
+# were never scanned have no last_scanned_at and are not tracked.
+
+JOB_NAME = "stale_sweeper"
+LEASE_NAME = "stale_sweeper"
+# Seconds between passes; 0 turns the in-process sweeper off
+INTERVAL_SECONDS = float(os.getenv("WMS_STALE_SWEEP_INTERVAL_SECONDS", "300"))
+STALE_DAYS = float(os.getenv("WMS_STALE_DAYS", "7"))
+
+def _parse_zone_days(spec: str) -> dict:
+    # "Dock A=1,Aisle B-02=14": zones with their own threshold in days
+    zone_days = {}
+    for part in spec.split(","):
+        zone, sep, days = part.rpartition("=")
+        if sep and zone.strip():
+            zone_days[zone.strip()] = float(days)
+    return zone_days
+
+ZONE_DAYS = _parse_zone_days(os.getenv("WMS_STALE_ZONE_DAYS", ""))
+
+_items = models.InventoryItem.__table__
+_alerts = models.MissingItemAlert.__table__
+
+ALERT_COLUMNS = ["rfid_tag", "product_id", "zone", "last_scanned_at", "threshold_days", "status", "created_at"]
+
+_OPEN_ALERT = exists().where(_alerts.c.rfid_tag == _items.c.rfid_tag, _alerts.c.status == "open")
+
+MARK_FOUND = update(_alerts).where(
+    _alerts.c.rfid_tag == bindparam("tag"), _alerts.c.status == "open"
+).values(status="found", resolved_at=bindparam("at"))
+
+# Keyset pages in (last_scanned_at, id) order, read straight off ix_inventory_items_status_seen
+STALE_PAGE = select(
+    _items.c.id, _items.c.rfid_tag, _items.c.product_id, _items.c.location_zone, _items.c.last_scanned_at
+).where(
+    _items.c.status == "in_stock", _items.c.last_scanned_at < bindparam("cutoff")
+).order_by(_items.c.last_scanned_at, _items.c.id).limit(bindparam("limit", type_=Integer))
+
+OPEN_ALERTS_PAGE = select(
+    _alerts.c.id, _alerts.c.rfid_tag, _alerts.c.product_id, _alerts.c.zone,
+    _alerts.c.last_scanned_at, _alerts.c.threshold_days, _alerts.c.created_at
+).where(
+    _alerts.c.status == "open", _alerts.c.id > bindparam("after_id")
+).order_by(_alerts.c.id).limit(bindparam("limit", type_=Integer))
+
+def threshold_days(zone: str) -> float:
+    return ZONE_DAYS.get(zone, STALE_DAYS)
+
+def _threshold_groups():
+    # (days, zones it applies to or None for all, zones to leave out)
+    groups = [(STALE_DAYS, None, list(ZONE_DAYS))]
+    for days in sorted(set(ZONE_DAYS.values())):
+        groups.append((days, [zone for zone, d in ZONE_DAYS.items() if d == days], []))
+    return groups
+
+def _raise_alerts(db: Session, now: datetime, last_run: datetime = None, tags: list = None) -> int:
+    # Alerts for stale in-stock items without one: those that crossed their threshold
+    # since last_run, or the given tags, or (neither) all of them
+    created = 0
+    for days, zones, exclude in _threshold_groups():
+        seen = _items.c.last_scanned_at
+        conditions = [_items.c.status == "in_stock", seen < now - timedelta(days=days), ~_OPEN_ALERT]
+        if last_run:
+            conditions.append(seen >= last_run - timedelta(days=days))
+        if tags is not None:
+            conditions.append(_items.c.rfid_tag.in_(tags))
+        if zones is not None:
+            conditions.append(_items.c.location_zone.in_(zones))
+        if exclude:
+            conditions.append(_items.c.location_zone.not_in(exclude))
+        created += db.execute(insert(_alerts).from_select(ALERT_COLUMNS, select(
+            _items.c.rfid_tag, _items.c.product_id, _items.c.location_zone, seen,
+            literal(days), literal("open"), literal(now)
+        ).where(*conditions))).rowcount
+    return created
+
+def sweep(db: Session, now: datetime = None, full: bool = False) -> dict:
+    # full re-checks every stale item, e.g. after thresholds changed; otherwise only
+    # the window between the previous pass and this one is read per threshold
+    now = now or datetime.utcnow()
+    last_run = None if full else jobs.get_last_run(db, JOB_NAME)
+    created = _raise_alerts(db, now, last_run)
+    # Open alerts whose item was scanned since (a write that skipped item_seen) or left stock
+    item = _items.alias("i")
+    found = db.execute(update(_alerts).where(
+        _alerts.c.status == "open",
+        exists().where(item.c.rfid_tag == _alerts.c.rfid_tag, item.c.last_scanned_at > _alerts.c.last_scanned_at)
+    ).values(status="found", resolved_at=now)).rowcount
+    cancelled = db.execute(update(_alerts).where(
+        _alerts.c.status == "open",
+        exists().where(item.c.rfid_tag == _alerts.c.rfid_tag, item.c.status != "in_stock")
+    ).values(status="cancelled", resolved_at=now)).rowcount
+    jobs.set_last_run(db, JOB_NAME, now)
+    db.commit()
+    return {"created": created, "found": found, "cancelled": cancelled}
+
+def items_restocked(db: Session, tags: list, at: datetime = None) -> int:
+    # Called inside the caller's transaction when items go back to stock without a scan
+    # (a released reservation). They keep their old last_scanned_at, which the sweep's
+    # window may already have passed, and the sweep cancelled their alert while they
+    # were out of stock; so they are held against their threshold here
+    if not tags:
+        return 0
+    return _raise_alerts(db, at or datetime.utcnow(), tags=list(tags))
+
+def item_seen(db: Session, rfid_tag: str, at: datetime):
+    # Called inside the scan's transaction: a scan closes the tag's open alert
+    db.execute(MARK_FOUND, {"tag": rfid_tag, "at": at})
+
+def stale_page(db: Session, cutoff: datetime, zone: str = None, after=None, limit: int = 100):
+    # after is the (last_scanned_at, id) of the previous page's last row
+    stmt = STALE_PAGE
+    if zone is not None:
+        stmt = stmt.where(_items.c.location_zone == zone)
+    if after is not None:
+        stmt = stmt.where(tuple_(_items.c.last_scanned_at, _items.c.id) > tuple_(*after))
+    return db.execute(stmt, {"cutoff": cutoff, "limit": limit}).all()
+
+def open_alerts_page(db: Session, after_id: int = 0, limit: int = 100):
+    return db.execute(OPEN_ALERTS_PAGE, {"after_id": after_id, "limit": limit}).all()
+
+async def run_forever(interval: float = INTERVAL_SECONDS):
+    # Started by every worker; the lease makes exactly one of them do the work
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        for site in SITES:
+            try:
+                summary = await loop.run_in_executor(None, _run_once, site, interval)
+                if summary and any(summary.values()):
+                    logger.info(f"Missing item alerts at {site}: {summary['created']} possibly missing, "
+                                f"{summary['found']} found, {summary['cancelled']} cancelled")
+            except Exception:
+                logger.exception(f"Stale item sweep failed at {site}")
+
+def _run_once(site: str, interval: float):
+    db = site_sessionmaker(site)()
+    try:
+        if not coordination.hold(db, LEASE_NAME, interval * 2):
+            return None
+        return sweep(db)
+    finally:
+        db.close()
@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from . import models, queries
+
+# Warehouse-wide counters behind /api/stats, kept in stat_counters and updated
+# inside the transaction of each write, like the reporting rollups. Reading
+# them is a fixed number of primary key lookups however large the warehouse is.
+#
+#   items:<status>          items per status
+#   product:<id>            in-stock items of one product
+#   zone:<name>             in-stock items in one zone
+#   skus_below_reorder      products with in-stock <= reorder_point
+#   zones_active            zones holding at least one in-stock item
+#   scans:<YYYY-MM-DD HH:MM> scans in that minute (UTC)
+
+ITEM_STATUSES = ("in_stock", "reserved", "shipped", "damaged")
+SCAN_WINDOW_MINUTES = 60
+# Minute buckets are dropped once they are this old
+SCAN_RETENTION_MINUTES = 120
+
+_counters = models.StatCounter.__table__
+
+# Upsert returning the new value, so callers can tell when a counter crosses a threshold
+_ADD = sqlite_insert(_counters).values(name=bindparam("name"), value=bindparam("delta"))
+_ADD = _ADD.on_conflict_do_update(
+    index_elements=["name"], set_={"value": _counters.c.value + _ADD.excluded.value}
+).returning(_counters.c.value)
+
+_VALUE = select(_counters.c.value).where(_counters.c.name == bindparam("name"))
+
+_REORDER_POINT = select(models.Product.reorder_point).where(models.Product.id == bindparam("product_id"))
+
+def _minute(ts: datetime) -> str:
+    return f"scans:{ts:%Y-%m-%d %H:%M}"
+
+def _add(db: Session, name: str, delta: int) -> int:
+    return queries.connection(db).execute(_ADD, {"name": name, "delta": delta}).scalar()
+
+def _value(db: Session, name: str) -> int:
+    return queries.connection(db).execute(_VALUE, {"name": name}).scalar() or 0
+
+def _zone_delta(db: Session, zone: str, delta: int):
+    after = _add(db, f"zone:{zone}", delta)
+    change = (after > 0) - (after - delta > 0)
+    if change:
+        _add(db, "zones_active", change)
+
+def _product_delta(db: Session, product_id: int, delta: int):
+    after = _add(db, f"product:{product_id}", delta)
+    reorder_point = queries.connection(db).execute(_REORDER_POINT, {"product_id": product_id}).scalar()
+    if reorder_point is None:
+        return
+    change = (after <= reorder_point) - (after - delta <= reorder_point)
+    if change:
+        _add(db, "skus_below_reorder", change)
+
+def record_scan(db: Session, item, to_zone: str, scanned_at: datetime):
+    # Called inside the scan's own transaction; item is the row as it was before the move
+    if _add(db, _minute(scanned_at), 1) == 1:
+        # First scan of a new minute: drop buckets that left the retention window
+        cutoff = _minute(scanned_at - timedelta(minutes=SCAN_RETENTION_MINUTES))
+        db.execute(_counters.delete().where(_counters.c.name >= "scans:", _counters.c.name < cutoff))
+    if item.status == "in_stock" and item.location_zone != to_zone:
+        _zone_delta(db, item.location_zone, -1)
+        _zone_delta(db, to_zone, 1)
+
+def items_moved(db: Session, from_zone: str, to_zone: str, status: str, count: int):
+    # Bulk moves outside the scan path (cycle count corrections)
+    if status == "in_stock" and from_zone != to_zone and count:
+        _zone_delta(db, from_zone, -count)
+        _zone_delta(db, to_zone, count)
+
+def item_status_changed(db: Session, product_id, zone: str, old_status, new_status, count: int = 1):
+    # For any write that adds items (old_status None) or changes their status;
+    # count items of one product in one zone changed together
+    if old_status == new_status or not count:
+        return
+    if old_status:
+        _add(db, f"items:{old_status}", -count)
+    if new_status:
+        _add(db, f"items:{new_status}", count)
+    in_stock = ((new_status == "in_stock") - (old_status == "in_stock")) * count
+    if in_stock:
+        if product_id is not None:
+            _product_delta(db, product_id, in_stock)
+        _zone_delta(db, zone, in_stock)
+
+def in_stock(db: Session, product_id: int) -> int:
+    # In-stock units of one product as of this transaction
+    return _value(db, f"product:{product_id}")
+
+def reorder_point_changed(db: Session, product_id: int, old_point: int, new_point: int):
+    quantity = _value(db, f"product:{product_id}")
+    change = (quantity <= new_point) - (quantity <= old_point)
+    if change:
+        _add(db, "skus_below_reorder", change)
+
+def rebuild(db: Session, now: datetime = None):
+    # Recompute every counter from the base tables (after bulk loads or migrations)
+    now = now or datetime.utcnow()
+    db.execute(text("DELETE FROM stat_counters"))
+    db.execute(text("""
+        INSERT INTO stat_counters (name, value)
+        SELECT 'items:' || status, COUNT(*) FROM inventory_items
+        WHERE status IS NOT NULL GROUP BY status
+    """))
+    db.execute(text("""
+        INSERT INTO stat_counters (name, value)
+        SELECT 'product:' || product_id, COUNT(*) FROM inventory_items
+        WHERE status = 'in_stock' AND product_id IS NOT NULL GROUP BY product_id
+    """))
+    db.execute(text("""
+        INSERT INTO stat_counters (name, value)
+        SELECT 'zone:' || location_zone, COUNT(*) FROM inventory_items
+        WHERE status = 'in_stock' GROUP BY location_zone
+    """))
+    db.execute(text("""
+        INSERT INTO stat_counters (name, value)
+        SELECT 'zones_active', COUNT(*) FROM stat_counters WHERE name LIKE 'zone:%' AND value > 0
+    """))
+    db.execute(text("""
+        INSERT INTO stat_counters (name, value)
+        SELECT 'skus_below_reorder', COUNT(*)
+        FROM products p
+        LEFT JOIN stat_counters c ON c.name = 'product:' || p.id
+        WHERE COALESCE(c.value, 0) <= p.reorder_point
+    """))
+    db.execute(text("""
+        INSERT INTO stat_counters (name, value)
+        SELECT 'scans:' || strftime('%Y-%m-%d %H:%M', created_at), COUNT(*) FROM transactions
+        WHERE action = 'SCANNED' AND created_at >= :since GROUP BY 1
+    """), {"since": (now - timedelta(minutes=SCAN_RETENTION_MINUTES)).isoformat(" ")})
+    db.commit()
+
+def summary(db: Session, now: datetime = None) -> dict:
+    now = now or datetime.utcnow()
+    names = [f"items:{status}" for status in ITEM_STATUSES] + ["skus_below_reorder", "zones_active"]
+    values = dict(db.execute(select(_counters.c.name, _counters.c.value).where(_counters.c.name.in_(names))).all())
+    scans = db.execute(select(_counters.c.value).where(
+        _counters.c.name > _minute(now - timedelta(minutes=SCAN_WINDOW_MINUTES)),
+        _counters.c.name <= _minute(now)
+    )).scalars().all()
+    by_status = {status: values.get(f"items:{status}", 0) for status in ITEM_STATUSES}
+    return {
+        # Every tracked item, whatever its status; in_stock_items is what can be picked
+        "total_items": sum(by_status.values()),
+        "in_stock_items": by_status["in_stock"],
+        "items_by_status": by_status,
+        "low_stock_items": values.get("skus_below_reorder", 0),
+        "active_zones": values.get("zones_active", 0),
+        "scans_last_hour": sum(scans),
+        "as_of": now.isoformat(timespec="seconds"),
+    }
@@ -0,0 +1,194 @@
+import random
+from datetime import datetime, timedelta
+from itertools import accumulate
+from sqlalchemy import event, func, select
+from . import models
+
+# Fixed zones around the storage aisles; forecasting treats "Shipping" as outbound
+RECEIVING = "Receiving"
+QUALITY_CHECK = "Quality Check"
+PACKING = "Packing"
+SHIPPING = "Shipping"
+
+CATEGORIES = [
+    # (SKU prefix, name, price range)
+    ("LAP", "Laptop", (400, 2500)),
+    ("MON", "Monitor", (120, 900)),
+    ("KEY", "Keyboard", (20, 250)),
+    ("MOU", "Mouse", (10, 150)),
+    ("CAB", "Cable", (3, 40)),
+    ("HDP", "Headset", (25, 400)),
+    ("DOC", "Docking Station", (80, 350)),
+    ("STO", "SSD", (40, 600)),
+    ("PRN", "Printer", (90, 1200)),
+    ("ACC", "Accessory", (5, 80)),
+]
+
+# Mean hours an item stays in a zone before its next scan
+DWELL_HOURS = {RECEIVING: 4, QUALITY_CHECK: 12, PACKING: 2}
+STORAGE_DAYS = 30
+
+# Scans per item on the fixed path: receipt, putaway, packing, shipping, plus some QC
+BASE_SCANS_PER_ITEM = 4.15
+
+PRODUCT_COLUMNS = ("id", "sku", "name", "unit_price", "reorder_point", "reorder_quantity", "created_at")
+ITEM_COLUMNS = ("rfid_tag", "product_id", "status", "location_zone", "last_scanned_at", "created_at")
+TRANSACTION_COLUMNS = ("rfid_tag", "action", "location", "scanned_by", "created_at", "product_id")
+
+def storage_zones(count: int):
+    return [f"Aisle {chr(65 + i // 20)}-{i % 20 + 1:02d}" for i in range(count)]
+
+def zone_names(count: int):
+    return [RECEIVING, QUALITY_CHECK] + storage_zones(max(count - 4, 1)) + [PACKING, SHIPPING]
+
+def _products(rng: random.Random, skus: int, created_at):
+    for product_id in range(1, skus + 1):
+        prefix, name, (low, high) = CATEGORIES[product_id % len(CATEGORIES)]
+        yield (
+            product_id, f"{prefix}{product_id:06d}", f"{name} {product_id}",
+            round(rng.uniform(low, high), 2), rng.randint(3, 40),
+            rng.choice([10, 20, 25, 50, 100]), created_at,
+        )
+
+def _writer(conn, table, columns):
+    # SQLite gets a plain executemany of tuples; elsewhere Core handles the dialect
+    if conn.dialect.name == "sqlite":
+        sql = f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        return lambda rows: conn.exec_driver_sql(sql, rows)
+    return lambda rows: conn.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+
+def _lifecycle(rng: random.Random, arrival: datetime, end: datetime, storage, storage_loop: float):
+    # Markov walk Receiving -> [QC] -> storage (loops) -> Packing -> Shipping; yields (zone, time)
+    zone, at = RECEIVING, arrival
+    storage_hours = STORAGE_DAYS * 24 * (1 - storage_loop)
+    while True:
+        yield zone, at
+        if zone == RECEIVING:
+            following = QUALITY_CHECK if rng.random() < 0.15 else rng.choice(storage)
+        elif zone == QUALITY_CHECK:
+            if rng.random() < 0.02:
+                yield "damaged", at
+                return
+            following = rng.choice(storage)
+        elif zone == PACKING:
+            following = SHIPPING if rng.random() < 0.97 else rng.choice(storage)
+        elif zone == SHIPPING:
+            return
+        elif rng.random() < storage_loop:
+            # Cycle count in place or relocation to a neighbouring bay
+            if rng.random() < 0.7:
+                following = zone
+            else:
+                index = storage.index(zone) + rng.choice((-1, 1))
+                following = storage[index % len(storage)]
+        else:
+            following = PACKING
+        hours = storage_hours if zone not in DWELL_HOURS else DWELL_HOURS[zone]
+        at += timedelta(hours=rng.expovariate(1 / hours))
+        if at >= end:
+            return
+        zone = following
+
+def generate(engine, skus: int = 20_000, items: int = 1_000_000, transactions: int = 20_000_000,
+             zones: int = 200, scanners: int = 60, days: int = 365, seed: int = 42,
+             batch_size: int = 50_000, end: datetime = None, progress=None):
+    """Stream a synthetic warehouse into empty tables, batch by batch.
+
+    The same arguments produce the same rows; ``end`` defaults to now, so
+    pass it explicitly for byte-identical reruns. Only one batch of rows
+    is held in memory, so items and transactions can go far past RAM.
+    ``transactions`` is a target: storage re-scans are tuned to reach it,
+    but items that arrived recently have not finished their path yet, so
+    the actual count ends up somewhat lower. With ``transactions=0`` the
+    items are placed in storage without any history.
+    """
+    rng = random.Random(seed)
+    end = end or datetime.utcnow().replace(microsecond=0)
+    start = end - timedelta(days=days)
+    storage = storage_zones(max(zones - 4, 1))
+    scanner_ids = [f"SCN-{n:03d}" for n in range(1, scanners + 1)]
+    # Zipf popularity: a few SKUs account for most items and scans
+    cum_weights = list(accumulate(1 / rank for rank in range(1, skus + 1)))
+    product_order = list(range(1, skus + 1))
+    rng.shuffle(product_order)
+
+    extra_scans = max(transactions / max(items, 1) - BASE_SCANS_PER_ITEM, 0)
+    storage_loop = extra_scans / (1 + extra_scans)
+
+    # Rows skip SQLAlchemy type processing on SQLite, so timestamps are stored
+    # pre-formatted exactly as the DateTime type would write them
+    if engine.dialect.name == "sqlite":
+        stamp = lambda value: value and value.isoformat(" ", "microseconds")
+    else:
+        stamp = lambda value: value
+
+    counts = {"products": 0, "items": 0, "transactions": 0}
+    with engine.connect() as conn:
+        if conn.execute(select(func.count()).select_from(models.Product.__table__)).scalar():
+            raise ValueError("products table is not empty; generate into a fresh database")
+        writers = {
+            "products": _writer(conn, models.Product.__table__, PRODUCT_COLUMNS),
+            "items": _writer(conn, models.InventoryItem.__table__, ITEM_COLUMNS),
+            "transactions": _writer(conn, models.Transaction.__table__, TRANSACTION_COLUMNS),
+        }
+
+        def flush(rows, name):
+            if rows:
+                writers[name](rows)
+                conn.commit()
+                counts[name] += len(rows)
+                rows.clear()
+                if progress:
+                    progress(counts)
+
+        products = []
+        for row in _products(rng, skus, stamp(start)):
+            products.append(row)
+            if len(products) >= batch_size:
+                flush(products, "products")
+        flush(products, "products")
+
+        item_rows, transaction_rows = [], []
+        for n in range(items):
+            tag = f"RFID{n:09d}"
+            product_id = product_order[rng.choices(range(skus), cum_weights=cum_weights)[0]]
+            arrival = start + timedelta(seconds=rng.uniform(0, days * 86400))
+            status, zone, last_at = "in_stock", rng.choice(storage), None
+            if transactions:
+                previous = None
+                for zone_or_state, at in _lifecycle(rng, arrival, end, storage, storage_loop):
+                    if zone_or_state == "damaged":
+                        status = "damaged"
+                        break
+                    zone, last_at = zone_or_state, at
+                    transaction_rows.append((
+                        tag,
+                        "RECEIVED" if previous is None else "SCANNED",
+                        zone if previous is None else f"{previous} -> {zone}",
+                        rng.choice(scanner_ids),
+                        stamp(at),
+                        product_id,
+                    ))
+                    previous = zone
+                if zone == SHIPPING:
+                    status = "shipped"
+            item_rows.append((tag, product_id, status, zone, stamp(last_at), stamp(arrival)))
+            # Items go first so every flushed transaction has its tag in place
+            if len(item_rows) >= batch_size or len(transaction_rows) >= batch_size:
+                flush(item_rows, "items")
+                flush(transaction_rows, "transactions")
+        flush(item_rows, "items")
+        flush(transaction_rows, "transactions")
+    return counts
+
+def fast_sqlite_load(engine):
+    # Bulk loads only: skip fsync on every commit; a crash mid-load means regenerating
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA cache_size=-262144")
+        cursor.close()
@@ -0,0 +1,144 @@
+import os
+from functools import lru_cache
+from sqlalchemy import Integer, bindparam, func, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from . import models, queries
+
+# Zone index: zone_stock holds one row per (zone, product, status) with the number
+# of items there, updated in the transaction of each write that moves an item or
+# changes its status. Rows that drop to zero are deleted, so reading a zone costs
+# as much as the zone holds and never scans inventory_items.
+
+# Storage layout for walking distances: bays per aisle and the walk between neighbouring
+# aisles, in bays
+AISLE_BAYS = int(os.getenv("WMS_AISLE_BAYS", "20"))
+AISLE_PITCH = float(os.getenv("WMS_AISLE_PITCH", "2"))
+
+_zone_stock = models.ZoneStock.__table__
+_products = models.Product.__table__
+_items = models.InventoryItem.__table__
+
+ZONE_TOTALS = select(
+    _zone_stock.c.zone, _zone_stock.c.status,
+    func.sum(_zone_stock.c.item_count), func.count(_zone_stock.c.product_id)
+).group_by(_zone_stock.c.zone, _zone_stock.c.status).order_by(_zone_stock.c.zone)
+
+# A primary key range on zone_stock
+ZONE_CONTENTS = select(
+    _zone_stock.c.product_id, _products.c.sku, _products.c.name, _zone_stock.c.status, _zone_stock.c.item_count
+).select_from(
+    _zone_stock.outerjoin(_products, _products.c.id == _zone_stock.c.product_id)
+).where(_zone_stock.c.zone == bindparam("zone")).order_by(_zone_stock.c.product_id, _zone_stock.c.status)
+
+# Served by ix_inventory_items_zone
+ZONE_ITEMS = select(
+    _items.c.rfid_tag, _items.c.product_id, _items.c.status, _items.c.last_scanned_at
+).where(_items.c.location_zone == bindparam("zone")).order_by(_items.c.rfid_tag).limit(
+    bindparam("limit", type_=Integer)
+)
+
+_KEY = [_zone_stock.c[name] == bindparam(name) for name in ("zone", "product_id", "status")]
+
+_ADD = sqlite_insert(_zone_stock).values(
+    zone=bindparam("zone"), product_id=bindparam("product_id"), status=bindparam("status"),
+    item_count=bindparam("delta")
+)
+_ADD = _ADD.on_conflict_do_update(
+    index_elements=["zone", "product_id", "status"],
+    set_={"item_count": _zone_stock.c.item_count + _ADD.excluded.item_count}
+).returning(_zone_stock.c.item_count)
+
+_DROP_EMPTY = _zone_stock.delete().where(*_KEY)
+
+def _add(db: Session, zone: str, product_id, status: str, delta: int):
+    conn = queries.connection(db)
+    key = {"zone": zone, "product_id": product_id or 0, "status": status}
+    if conn.execute(_ADD, {**key, "delta": delta}).scalar() <= 0:
+        conn.execute(_DROP_EMPTY, key)
+
+def record_move(db: Session, item, to_zone: str):
+    # Called inside the scan's transaction; item is the row as it was before the move
+    if not item.status or item.location_zone == to_zone:
+        return
+    _add(db, item.location_zone, item.product_id, item.status, -1)
+    _add(db, to_zone, item.product_id, item.status, 1)
+
+def items_moved(db: Session, product_id, from_zone: str, to_zone: str, status: str, count: int):
+    # count items of one product and status moved together (cycle count corrections)
+    if not status or from_zone == to_zone or not count:
+        return
+    _add(db, from_zone, product_id, status, -count)
+    _add(db, to_zone, product_id, status, count)
+
+def item_status_changed(db: Session, product_id, zone: str, old_status, new_status, count: int = 1):
+    # For any write that adds items (old_status None) or changes their status
+    if old_status == new_status or not count:
+        return
+    if old_status:
+        _add(db, zone, product_id, old_status, -count)
+    if new_status:
+        _add(db, zone, product_id, new_status, count)
+
+def rebuild(db: Session):
+    # Recompute the index from inventory_items (after bulk loads or migrations)
+    db.execute(text("DELETE FROM zone_stock"))
+    db.execute(text("""
+        INSERT INTO zone_stock (zone, product_id, status, item_count)
+        SELECT location_zone, COALESCE(product_id, 0), status, COUNT(*) FROM inventory_items
+        WHERE status IS NOT NULL GROUP BY location_zone, COALESCE(product_id, 0), status
+    """))
+    db.commit()
+
+@lru_cache(maxsize=4096)
+def coordinates(zone: str):
+    # "Aisle B-07" -> (1, 7): aisle index from A and bay number along it, as app.synthetic
+    # lays storage out; None for zones off the aisle grid (Receiving, Packing, ...)
+    aisle, _, bay = zone.removeprefix("Aisle ").partition("-")
+    if len(aisle) != 1 or not aisle.isalpha() or not bay.isdigit():
+        return None
+    return ord(aisle.upper()) - 65, int(bay)
+
+def walk(a: tuple, b: tuple) -> float:
+    # Parallel aisles joined by a front (bay 0) and a back (bay AISLE_BAYS + 1) cross aisle;
+    # changing aisle means leaving by whichever end is shorter
+    if a[0] == b[0]:
+        return abs(a[1] - b[1])
+    return min(a[1] + b[1], 2 * (AISLE_BAYS + 1) - a[1] - b[1]) + AISLE_PITCH * abs(a[0] - b[0])
+
+def walk_matrix(points: list) -> list:
+    # walk() between every pair of points, inlined: route planning builds this per wave
+    back, pitch = 2 * (AISLE_BAYS + 1), AISLE_PITCH
+    return [[abs(bay - to_bay) if aisle == to_aisle
+             else min(bay + to_bay, back - bay - to_bay) + pitch * abs(aisle - to_aisle)
+             for to_aisle, to_bay in points] for aisle, bay in points]
+
+def distance(from_zone: str, to_zone: str) -> float:
+    # Walking distance in bays for pick planning; named zones without coordinates are farthest
+    if from_zone == to_zone:
+        return 0
+    a, b = coordinates(from_zone), coordinates(to_zone)
+    if a is None or b is None:
+        return float("inf")
+    return walk(a, b)
+
+def zone_totals(db: Session) -> list:
+    # Every occupied zone with its item count per status; reads zone_stock only
+    zones = {}
+    for zone, status, items, products in db.execute(ZONE_TOTALS):
+        entry = zones.setdefault(zone, {"zone": zone, "items": 0, "in_stock": 0, "by_status": {}})
+        entry["items"] += items
+        entry["by_status"][status] = items
+        if status == "in_stock":
+            entry["in_stock"] = items
+            entry["in_stock_products"] = products
+    for entry in zones.values():
+        entry.setdefault("in_stock_products", 0)
+    return list(zones.values())
+
+def zone_contents(db: Session, zone: str):
+    # (product_id, sku, name, status, item_count) for one zone
+    return db.execute(ZONE_CONTENTS, {"zone": zone}).all()
+
+def zone_items(db: Session, zone: str, limit: int):
+    return db.execute(ZONE_ITEMS, {"zone": zone, "limit": limit}).all()
@@ -0,0 +1,118 @@
+"""
+Analytics engine benchmark on a synthetic scan history.
+
+Run from the backend directory:
+    python -m benchmarks.analytics_benchmark --scans 50000000
+"""
+import argparse
+import json
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import duckdb
+import pyarrow as pa
+from sqlalchemy import create_engine
+
+from app import analytics, formats
+from app.database import Base
+from app import models  # noqa: F401  (registers tables on Base)
+
+ZONES = [f"Aisle {aisle}-{bay:02d}" for aisle in "ABCDEFGH" for bay in range(1, 13)]
+
+def build_dataset(workdir: Path, scans: int, products: int, tags: int, days: int):
+    database = workdir / "wms.db"
+    archive_dir = workdir / "archive"
+    archive_dir.mkdir()
+
+    # Live SQLite store: catalog and items only, history lives in the archive
+    Base.metadata.create_all(create_engine(f"sqlite:///{database}"))
+    conn = sqlite3.connect(database)
+    conn.executemany(
+        "INSERT INTO products (id, sku, name, reorder_point, reorder_quantity) VALUES (?, ?, ?, ?, ?)",
+        ((p, f"SKU{p:06d}", f"Product {p}", 5 + p % 20, 50) for p in range(1, products + 1))
+    )
+    conn.executemany(
+        "INSERT INTO inventory_items (rfid_tag, product_id, status, location_zone) VALUES (?, ?, ?, ?)",
+        ((f"RFID{t:08d}", 1 + t % products, "in_stock" if t % 10 else "shipped", ZONES[t % len(ZONES)])
+         for t in range(tags))
+    )
+    conn.commit()
+    conn.close()
+
+    # Archived transactions generated column-wise inside DuckDB
+    zone_list = "[" + ", ".join(f"'{z}'" for z in ZONES) + "]"
+    con = duckdb.connect()
+    con.execute(f"""
+        COPY (
+            SELECT i AS id,
+                   'RFID' || lpad(CAST(hash(i) % {tags} AS VARCHAR), 8, '0') AS rfid_tag,
+                   'SCANNED' AS action,
+                   list_extract({zone_list}, CAST(1 + hash(i * 31) % {len(ZONES)} AS INTEGER))
+                       || ' -> ' ||
+                   list_extract({zone_list}, CAST(1 + hash(i * 17) % {len(ZONES)} AS INTEGER)) AS location,
+                   'SCN-' || CAST(i % 40 AS VARCHAR) AS scanned_by,
+                   TIMESTAMP '2025-01-01' + to_seconds(CAST(i * {days * 86400} // {max(scans, 1)} AS BIGINT)) AS created_at
+            FROM range({scans}) t(i)
+        ) TO '{archive_dir / "scans.parquet"}' (FORMAT PARQUET)
+    """)
+    con.close()
+    return database, archive_dir
+
+def time_report(name, start, end, database, archive_dir, repeat):
+    timings = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        table = analytics.run_report(name, start, end, database=database, archive_dir=archive_dir)
+        query_s = time.perf_counter() - began
+
+        # Wire format and client-side decode, as the Streamlit pages do it
+        began = time.perf_counter()
+        payload = formats.to_arrow_stream(table)
+        pa.ipc.open_stream(payload).read_pandas()
+        transfer_s = time.perf_counter() - began
+        timings.append((query_s, transfer_s))
+    return {
+        "report": name,
+        "rows": table.num_rows,
+        "payload_bytes": len(payload),
+        "query_ms_median": round(statistics.median(t[0] for t in timings) * 1000, 1),
+        "encode_decode_ms_median": round(statistics.median(t[1] for t in timings) * 1000, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scans", type=int, default=50_000_000)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--tags", type=int, default=500_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        began = time.perf_counter()
+        database, archive_dir = build_dataset(Path(tmp), args.scans, args.products, args.tags, args.days)
+        print(f"Generated {args.scans:,} scans in {time.perf_counter() - began:.1f}s")
+
+        start = datetime(2025, 1, 1)
+        end = start + timedelta(days=args.days)
+        results = [
+            time_report(name, start, end, database, archive_dir, args.repeat)
+            for name in analytics.REPORTS
+        ]
+
+    print(f"{'report':<18}{'rows':>10}{'query ms':>12}{'arrow ms':>12}{'bytes':>14}")
+    for r in results:
+        print(f"{r['report']:<18}{r['rows']:>10}{r['query_ms_median']:>12}"
+              f"{r['encode_decode_ms_median']:>12}{r['payload_bytes']:>14}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"args": {k: v for k, v in vars(args).items() if k != "output"},
+                                           "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Scan commit latency while a snapshot is taken, and restore time to a point in time.
+
+Seeds a synthetic warehouse into a throwaway SQLite database. A writer
+process commits scans (an item move plus its transaction row, as the scan route does)
+as fast as it can for --duration seconds per mode, while the benchmark copies the
+database. Commit latency is measured while the copy runs and for a second after,
+when the writer checkpoints the WAL that piled up behind the copy's read snapshot:
+- none: no copy, the baseline;
+- stepped: app.backups.snapshot_file with the configured step size and pause;
+- one-step: the online backup API copying every page in one step;
+- vacuum-into: VACUUM INTO, the other online copy SQLite offers.
+
+Every copy must pass PRAGMA quick_check. Finally the log written during the run is
+shipped and the database restored to half-way through it. The restored items must
+equal the base snapshot's with every logged move up to that moment applied in order.
+
+Run from the backend directory:
+    python -m benchmarks.backup_snapshot --items 500000
+"""
+import argparse
+import json
+import multiprocessing
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from app import backups, migrate, synthetic
+
+def seed(database: Path, skus: int, items: int, transactions: int):
+    engine = create_engine(f"sqlite:///{database}")
+    synthetic.fast_sqlite_load(engine)
+    migrate.upgrade(engine)
+    synthetic.generate(engine, skus=skus, items=items, transactions=transactions, zones=50, seed=11)
+    engine.dispose()
+    conn = sqlite3.connect(database)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.close()
+
+# Commits after the copy that still count towards it
+AFTER_SECONDS = 1.0
+
+def write_scans(database: Path, tags: list, zones: list, duration: float, results):
+    # A separate process, so the copy and the writer do not share a GIL
+    rng = random.Random(1)
+    conn = sqlite3.connect(database, timeout=30)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    commits = []
+    stop = time.time() + duration
+    while time.time() < stop:
+        tag, zone, now = rng.choice(tags), rng.choice(zones), datetime.utcnow()
+        began = time.perf_counter()
+        conn.execute("UPDATE inventory_items SET location_zone = ?, last_scanned_at = ? WHERE rfid_tag = ?",
+                     (zone, now.isoformat(" "), tag))
+        conn.execute("INSERT INTO transactions (rfid_tag, action, location, created_at) VALUES (?, 'SCANNED', ?, ?)",
+                     (tag, f"? -> {zone}", now.isoformat(" ")))
+        conn.commit()
+        commits.append((time.time(), time.perf_counter() - began))
+    conn.close()
+    results.put(commits)
+
+def quantile(values: list, q: float) -> float:
+    return round(sorted(values)[min(len(values) - 1, int(len(values) * q))] * 1000, 2) if values else None
+
+def copy(mode: str, database: Path, target_dir: Path) -> Path:
+    if mode == "stepped":
+        return target_dir / backups.snapshot_file(database, target_dir)["file"]
+    target = target_dir / f"{mode}.db"
+    source = sqlite3.connect(database)
+    if mode == "one-step":
+        destination = sqlite3.connect(target)
+        source.backup(destination)
+        destination.close()
+    else:
+        source.execute("VACUUM INTO ?", (str(target),))
+    source.close()
+    return target
+
+def run_mode(mode: str, database: Path, target_dir: Path, tags: list, zones: list, duration: float) -> dict:
+    results = multiprocessing.Queue()
+    writer = multiprocessing.Process(target=write_scans, args=(database, tags, zones, duration, results))
+    writer.start()
+    time.sleep(duration / 4)
+    began = time.time()
+    copied = copy(mode, database, target_dir) if mode != "none" else None
+    # The baseline is measured over the same share of the run
+    ended = time.time() if copied else began + duration / 2
+    commits = results.get()
+    writer.join()
+    during = [latency for at, latency in commits if began <= at <= ended + AFTER_SECONDS]
+    check = None
+    if copied:
+        conn = sqlite3.connect(copied)
+        check = conn.execute("PRAGMA quick_check").fetchone()[0]
+        conn.close()
+    return {
+        "mode": mode,
+        "copy_s": round(ended - began, 2) if copied else None,
+        "commits_per_s": round(len(during) / (ended + AFTER_SECONDS - began)),
+        "p50_ms": quantile(during, 0.5),
+        "p99_ms": quantile(during, 0.99),
+        "max_ms": quantile(during, 1.0),
+        "quick_check": check,
+    }
+
+def items(database: Path) -> dict:
+    conn = sqlite3.connect(database)
+    result = {tag: (zone, seen) for tag, zone, seen in
+              conn.execute("SELECT rfid_tag, location_zone, last_scanned_at FROM inventory_items")}
+    conn.close()
+    return result
+
+def brute_force(base: Path, live: Path, after: int, at: datetime) -> dict:
+    # The base snapshot's items with every logged move up to `at` applied in order
+    expected = items(base)
+    conn = sqlite3.connect(live)
+    for tag, location, created_at in conn.execute(
+            "SELECT rfid_tag, location, created_at FROM transactions WHERE id > ? ORDER BY id", (after,)):
+        if datetime.fromisoformat(created_at) <= at:
+            expected[tag] = (location.split(" -> ")[-1], created_at)
+    conn.close()
+    return expected
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skus", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=500_000)
+    parser.add_argument("--transactions", type=int, default=2_000_000)
+    parser.add_argument("--duration", type=float, default=6.0, help="seconds of scanning per mode")
+    parser.add_argument("--modes", default="none,stepped,one-step,vacuum-into")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "live.db"
+        seed(database, args.skus, args.items, args.transactions)
+        conn = sqlite3.connect(database)
+        tags = [tag for (tag,) in conn.execute("SELECT rfid_tag FROM inventory_items WHERE status = 'in_stock'")]
+        zones = [zone for (zone,) in conn.execute("SELECT DISTINCT location_zone FROM inventory_items")]
+        conn.close()
+        size_mb = round(database.stat().st_size / 1024 / 1024)
+
+        backup_dir = Path(tmp) / "backups"
+        base = backups.snapshot_file(database, backup_dir)
+        results = []
+        for mode in args.modes.split(","):
+            target_dir = Path(tmp) / mode
+            target_dir.mkdir()
+            results.append(run_mode(mode, database, target_dir, tags, zones, args.duration))
+
+        # Restore half-way through the scans written since the base snapshot
+        segment = backups.ship_log_file(database, backup_dir)
+        conn = sqlite3.connect(database)
+        middle = (segment["after_transaction_id"] + segment["last_transaction_id"]) // 2
+        at = datetime.fromisoformat(conn.execute("SELECT created_at FROM transactions WHERE id = ?", (middle,)).fetchone()[0])
+        conn.close()
+        began = time.perf_counter()
+        restored = backups.restore_from(backup_dir, Path(tmp) / "restored.db", at)
+        restore_s = time.perf_counter() - began
+        matches = items(Path(tmp) / "restored.db") == brute_force(
+            backup_dir / base["file"], database, base["last_transaction_id"], at)
+
+    print(f"database {size_mb} MB, base snapshot {base['bytes'] / 1024 / 1024:.0f} MB")
+    print(f"{'mode':<12}{'copy s':>8}{'commits/s':>11}{'p50 ms':>8}{'p99 ms':>8}{'max ms':>8}  check")
+    for r in results:
+        print(f"{r['mode']:<12}{r['copy_s'] if r['copy_s'] is not None else '-':>8}{r['commits_per_s']:>11}"
+              f"{r['p50_ms']:>8}{r['p99_ms']:>8}{r['max_ms']:>8}  {r['quick_check'] or '-'}")
+    print(f"restore to {at.isoformat()}: {restored['replayed']:,} transactions replayed in {restore_s:.2f}s, "
+          f"items match: {matches}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"config": {k: str(v) if isinstance(v, Path) else v
+                                                      for k, v in vars(args).items()},
+                                           "results": results,
+                                           "restore": {**restored, "seconds": round(restore_s, 2),
+                                                       "items_match": matches}}, indent=2))
+
+if __name__ == "__main__":
+    main()
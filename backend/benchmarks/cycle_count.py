@@ -0,0 +1,116 @@
+"""
+Cycle count reconciliation time for a large zone, checked against a brute force count.
+
+Seeds a synthetic warehouse into a throwaway SQLite database with about --zone-items
+items per storage zone. It then simulates a handheld sweep of one zone:
+- Most of the zone's items are read; --miss of them are not.
+- --misplaced tags from other zones are read too, as are --unknown tags the
+  database has never seen.
+
+The reads stream in batches of --batch through app.cycle_counts, and the session
+is closed. Each outcome is compared with Python set arithmetic over the same data.
+The stat counters and the zone index must also equal a full rebuild.
+
+Run from the backend directory:
+    python -m benchmarks.cycle_count --zone-items 50000
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app import cycle_counts, migrate, stats, synthetic, zones
+
+def seed(database: Path, zone_items: int, zone_count: int):
+    engine = create_engine(f"sqlite:///{database}")
+    synthetic.fast_sqlite_load(engine)
+    migrate.upgrade(engine)
+    # generate() adds four fixed zones around the storage aisles
+    synthetic.generate(engine, skus=500, items=zone_items * zone_count, transactions=0,
+                       zones=zone_count + 4, seed=5)
+    with Session(engine) as db:
+        stats.rebuild(db)
+        zones.rebuild(db)
+    engine.dispose()
+
+def sweep(db: Session, zone: str, args, rng: random.Random):
+    # (reads, expected tags, other zones' tags that were read)
+    expected = set(db.execute(text(
+        "SELECT rfid_tag FROM inventory_items WHERE location_zone = :z AND status IN ('in_stock', 'reserved')"
+    ), {"z": zone}).scalars())
+    others = db.execute(text(
+        "SELECT rfid_tag FROM inventory_items WHERE location_zone != :z AND status IN ('in_stock', 'reserved') "
+        "ORDER BY random() LIMIT :n"
+    ), {"z": zone, "n": int(len(expected) * args.misplaced)}).scalars().all()
+    missed = set(rng.sample(sorted(expected), int(len(expected) * args.miss)))
+    unknown = [f"UNKNOWN{n:08d}" for n in range(int(len(expected) * args.unknown))]
+    reads = [tag for tag in expected if tag not in missed] + list(others) + unknown
+    rng.shuffle(reads)
+    return reads, expected, set(others)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--zone-items", type=int, default=50_000)
+    parser.add_argument("--zones", type=int, default=4, help="storage zones")
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--miss", type=float, default=0.02)
+    parser.add_argument("--misplaced", type=float, default=0.01)
+    parser.add_argument("--unknown", type=float, default=0.005)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "counts.db"
+        seed(database, args.zone_items, args.zones)
+        engine = create_engine(f"sqlite:///{database}")
+        with Session(engine) as db:
+            zone = synthetic.storage_zones(args.zones)[0]
+            reads, expected, others = sweep(db, zone, args, rng)
+
+            began = time.perf_counter()
+            count_id = cycle_counts.open_count(db, [zone], "benchmark")["id"]
+            for start in range(0, len(reads), args.batch):
+                cycle_counts.add_reads(db, count_id, zone, reads[start:start + args.batch])
+            streamed = time.perf_counter()
+            result = cycle_counts.close(db, count_id)
+            closed = time.perf_counter()
+
+            read_set = set(reads)
+            brute = {
+                "found": len(expected & read_set),
+                "missing": len(expected - read_set),
+                "misplaced": len(others),
+                "unexpected": len(read_set - expected - others),
+            }
+            counters = "SELECT name, value FROM stat_counters WHERE name NOT LIKE 'scans:%' AND value != 0 ORDER BY name"
+            index = "SELECT * FROM zone_stock ORDER BY zone, product_id, status"
+            before = (db.execute(text(counters)).all(), db.execute(text(index)).all())
+            stats.rebuild(db)
+            zones.rebuild(db)
+            counters_match = before == (db.execute(text(counters)).all(), db.execute(text(index)).all())
+        engine.dispose()
+
+    summary = {
+        "zone_items": len(expected),
+        "reads": len(reads),
+        "stream_s": round(streamed - began, 2),
+        "close_s": round(closed - streamed, 2),
+        **{outcome: result[outcome] for outcome in brute},
+        "matches_brute_force": all(result[outcome] == brute[outcome] for outcome in brute),
+        "counters_match": counters_match,
+    }
+    for name, value in summary.items():
+        print(f"{name:<22}{value}")
+    if args.output:
+        args.output.write_text(json.dumps({"config": {k: str(v) if isinstance(v, Path) else v
+                                                      for k, v in vars(args).items()},
+                                           "results": summary}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Pick wave generation time and route length.
+
+Seeds a synthetic warehouse into a throwaway SQLite database and reserves
+--orders orders of a few SKUs each, written in bulk rather than through
+reservations.reserve(). Then, for each --max-lines, it times
+app.picking.generate() over all of them from scratch.
+
+Each wave's walk is compared with two simpler routes over the same zones:
+- naive: zones in the order their lines were reserved, as a picker working
+  down the orders would walk;
+- s-shape: the S-shape walk without 2-opt.
+
+Run from the backend directory:
+    python -m benchmarks.pick_waves --orders 2000 --max-lines 500,2000,5000
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app import migrate, picking, synthetic, zones
+
+def seed(database: Path, skus: int, items: int, orders: int, seed_value: int = 7):
+    engine = create_engine(f"sqlite:///{database}")
+    synthetic.fast_sqlite_load(engine)
+    migrate.upgrade(engine)
+    synthetic.generate(engine, skus=skus, items=items, transactions=0, zones=200, seed=seed_value)
+    rng = random.Random(seed_value)
+    with engine.begin() as conn:
+        stock = {}
+        for item_id, product_id in conn.execute(text(
+                "SELECT id, product_id FROM inventory_items WHERE status = 'in_stock' ORDER BY id")):
+            stock.setdefault(product_id, []).append(item_id)
+        products = list(stock)
+        now = datetime.utcnow()
+        for n in range(orders):
+            for product_id in rng.sample(products, min(rng.randint(1, 5), len(products))):
+                claimed = [stock[product_id].pop() for _ in range(min(rng.randint(1, 4), len(stock[product_id])))]
+                if not claimed:
+                    continue
+                reservation_id = conn.execute(text("""
+                    INSERT INTO reservations (order_ref, product_id, requested, quantity, strategy, status,
+                                              created_at, updated_at)
+                    VALUES (:order_ref, :product_id, :quantity, :quantity, 'fifo', 'active', :now, :now)
+                    RETURNING id
+                """), {"order_ref": f"order-{n:05d}", "product_id": product_id,
+                       "quantity": len(claimed), "now": now}).scalar()
+                conn.execute(text("UPDATE inventory_items SET status = 'reserved', reservation_id = :r WHERE id = :id"),
+                             [{"r": reservation_id, "id": item_id} for item_id in claimed])
+    engine.dispose()
+
+def naive_length(db: Session, wave_id: int) -> float:
+    # Zones in reservation order, each visited once
+    walk = []
+    for (zone,) in db.execute(text("""
+        SELECT i.location_zone FROM reservations r JOIN inventory_items i ON i.reservation_id = r.id
+        WHERE r.wave_id = :w ORDER BY r.created_at, r.id, i.id
+    """), {"w": wave_id}):
+        point = zones.coordinates(zone)
+        if point is not None and point not in walk:
+            walk.append(point)
+    return picking.route_length(walk)
+
+def run(database: Path, max_lines: int, max_orders: int) -> dict:
+    engine = create_engine(f"sqlite:///{database}")
+    with Session(engine) as db:
+        db.execute(text("UPDATE reservations SET wave_id = NULL"))
+        db.execute(text("DELETE FROM pick_waves"))
+        db.commit()
+        began = time.perf_counter()
+        waves = picking.generate(db, max_lines, max_orders)
+        elapsed = time.perf_counter() - began
+        naive = s_shape = routed = 0.0
+        for wave in waves:
+            points = [zones.coordinates(stop["zone"]) for stop in wave["stops"]]
+            points = [point for point in points if point is not None]
+            naive += naive_length(db, wave["id"])
+            s_shape += picking.route_length(picking.s_shape(points))
+            routed += wave["distance"]
+    engine.dispose()
+    return {
+        "max_lines": max_lines,
+        "waves": len(waves),
+        "lines": sum(wave["lines"] for wave in waves),
+        "stops": sum(len(wave["stops"]) for wave in waves),
+        "generate_ms": round(elapsed * 1000, 1),
+        "naive_bays": round(naive),
+        "s_shape_bays": round(s_shape),
+        "routed_bays": round(routed),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skus", type=int, default=500)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--max-lines", default="500,2000,5000")
+    parser.add_argument("--max-orders", type=int, default=1000)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "waves.db"
+        seed(database, args.skus, args.items, args.orders)
+        results = [run(database, int(n), args.max_orders) for n in args.max_lines.split(",")]
+
+    print(f"{'max lines':>10}{'waves':>7}{'lines':>8}{'stops':>7}{'ms':>9}{'naive':>9}{'s-shape':>9}{'routed':>9}")
+    for r in results:
+        print(f"{r['max_lines']:>10}{r['waves']:>7}{r['lines']:>8}{r['stops']:>7}{r['generate_ms']:>9}"
+              f"{r['naive_bays']:>9}{r['s_shape_bays']:>9}{r['routed_bays']:>9}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"config": {k: str(v) if isinstance(v, Path) else v
+                                                      for k, v in vars(args).items()},
+                                           "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
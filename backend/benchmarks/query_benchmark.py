@@ -0,0 +1,148 @@
+"""
+Per-call cost of the hot-path queries, before and after app.queries.
+
+"before" is the previous handler shape: an ORM query built inline on every
+call, with the tag lookup loading an InventoryItem entity into the session
+and the scan write going through the unit of work. "after" calls the named
+Core statements in app.queries. Both sides read the same small synthetic
+warehouse, so SQLite does little work and the difference is what SQLAlchemy
+costs per call. Scan writes are rolled back, which keeps fsync out of it.
+
+Run from the backend directory:
+    python -m benchmarks.query_benchmark --calls 2000
+"""
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import and_, create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from app import migrate, models, queries, synthetic
+
+def seed(engine, skus: int, items: int, transactions: int):
+    synthetic.fast_sqlite_load(engine)
+    migrate.upgrade(engine)
+    synthetic.generate(engine, skus=skus, items=items, transactions=transactions, zones=40, seed=7)
+    with engine.begin() as conn:
+        conn.execute(models.ReorderAlert.__table__.insert(), [
+            {"product_id": i, "current_quantity": 1, "reorder_point": 5, "status": "pending",
+             "created_at": datetime.utcnow()}
+            for i in range(1, min(skus, 50) + 1)
+        ])
+
+# The inline ORM versions the routers used before app.queries
+
+def orm_item_by_tag(db, tag):
+    return db.query(models.InventoryItem).filter(models.InventoryItem.rfid_tag == tag).first()
+
+def orm_stock_levels(db):
+    rows = db.query(
+        models.Product.id, models.Product.sku, models.Product.name,
+        func.count(models.InventoryItem.id), models.Product.reorder_point, models.Product.reorder_quantity
+    ).outerjoin(
+        models.InventoryItem,
+        and_(models.InventoryItem.product_id == models.Product.id, models.InventoryItem.status == 'in_stock')
+    ).group_by(models.Product.id).order_by(models.Product.id).all()
+    return [(*row, row[3] <= row[4]) for row in rows]
+
+def orm_pending_alerts(db):
+    return db.query(
+        models.ReorderAlert.id, models.ReorderAlert.product_id,
+        func.coalesce(models.Product.name, "Unknown"), models.ReorderAlert.current_quantity,
+        models.ReorderAlert.reorder_point, models.ReorderAlert.status,
+        func.coalesce(func.strftime("%Y-%m-%d %H:%M:%S", models.ReorderAlert.created_at), "")
+    ).outerjoin(
+        models.Product, models.Product.id == models.ReorderAlert.product_id
+    ).filter(models.ReorderAlert.status == "pending").order_by(models.ReorderAlert.id).all()
+
+def orm_recent_scans(db, limit):
+    return db.query(
+        models.Transaction.rfid_tag, models.Transaction.action,
+        models.Transaction.location, models.Transaction.created_at
+    ).order_by(models.Transaction.created_at.desc()).limit(limit).all()
+
+def orm_scan(db, tag, zone):
+    item = orm_item_by_tag(db, tag)
+    now = datetime.utcnow()
+    old_location = item.location_zone
+    item.location_zone = zone
+    item.last_scanned_at = now
+    db.add(models.Transaction(rfid_tag=tag, action="SCANNED", location=f"{old_location} -> {zone}",
+                              scanned_by="bench", created_at=now, product_id=item.product_id))
+    db.flush()
+    db.rollback()
+
+def core_scan(db, tag, zone):
+    item = queries.item_by_tag(db, tag)
+    queries.record_move(db, item, zone, "bench", datetime.utcnow())
+    db.rollback()
+
+def measure(SessionLocal, call, calls: int, repeat: int):
+    # Median microseconds per call over `repeat` batches, one session per batch like one per request
+    samples = []
+    for _ in range(repeat):
+        with SessionLocal() as db:
+            call(db)  # warm the compiled cache and the connection
+            began = time.perf_counter()
+            for _ in range(calls):
+                call(db)
+            samples.append((time.perf_counter() - began) / calls * 1e6)
+    return round(statistics.median(samples), 1)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skus", type=int, default=100)
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--transactions", type=int, default=20_000)
+    parser.add_argument("--calls", type=int, default=2_000, help="calls per batch")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    tags = [f"RFID{rng.randrange(args.items):09d}" for _ in range(1024)]
+    zones = synthetic.zone_names(40)
+    pick = lambda: (tags[rng.randrange(len(tags))], zones[rng.randrange(len(zones))])
+
+    cases = {
+        "tag lookup": (lambda db: orm_item_by_tag(db, pick()[0]), lambda db: queries.item_by_tag(db, pick()[0])),
+        "stock levels": (orm_stock_levels, queries.stock_levels),
+        "pending alerts": (orm_pending_alerts, queries.pending_alerts),
+        "recent scans": (lambda db: orm_recent_scans(db, 50), lambda db: queries.recent_scans(db, 50)),
+        "scan write": (lambda db: orm_scan(db, *pick()), lambda db: core_scan(db, *pick())),
+    }
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        seed(engine, args.skus, args.items, args.transactions)
+        SessionLocal = sessionmaker(bind=engine)
+        with SessionLocal() as db:
+            assert orm_stock_levels(db) == queries.stock_levels(db)
+            assert orm_pending_alerts(db) == queries.pending_alerts(db)
+            assert orm_recent_scans(db, 50) == queries.recent_scans(db, 50)
+        for name, (before, after) in cases.items():
+            before_us = measure(SessionLocal, before, args.calls, args.repeat)
+            after_us = measure(SessionLocal, after, args.calls, args.repeat)
+            results.append({"query": name, "before_us": before_us, "after_us": after_us,
+                             "saved_us": round(before_us - after_us, 1),
+                             "speedup": round(before_us / after_us, 2)})
+        engine.dispose()
+
+    print(f"{'query':<16}{'before us':>12}{'after us':>12}{'saved us':>12}{'speedup':>10}")
+    for r in results:
+        print(f"{r['query']:<16}{r['before_us']:>12}{r['after_us']:>12}{r['saved_us']:>12}{r['speedup']:>9}x")
+
+    if args.output:
+        args.output.write_text(json.dumps({"config": {k: str(v) if isinstance(v, Path) else v
+                                                      for k, v in vars(args).items()},
+                                           "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
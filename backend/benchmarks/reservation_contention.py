@@ -0,0 +1,176 @@
+"""
+Reservation throughput and correctness with many processes claiming the same SKUs.
+
+Seeds a synthetic warehouse into a throwaway SQLite database and starts
+--processes worker processes, like gunicorn workers. Each one calls
+app.reservations.reserve() in a closed loop for a handful of hot SKUs and
+releases all but --keep of its reservations again, so stock lasts the run.
+
+Two modes are compared:
+
+- optimistic: reserve() as shipped. Candidates are read before taking the
+  write lock and claimed by compare-and-swap.
+- locked: the same call after a no-op write. The transaction then holds
+  SQLite's write lock while it reads candidates, which is the pessimistic
+  baseline.
+
+After each run the database is checked:
+- no item is claimed twice;
+- every active reservation owns exactly its quantity of items;
+- the stat counters and the zone index equal a full rebuild.
+
+Run from the backend directory:
+    python -m benchmarks.reservation_contention --processes 4 --duration 10
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app import migrate, stats, synthetic, zones
+
+MODES = ("optimistic", "locked")
+
+def seed(database: Path, skus: int, items: int):
+    engine = create_engine(f"sqlite:///{database}")
+    synthetic.fast_sqlite_load(engine)
+    migrate.upgrade(engine)
+    synthetic.generate(engine, skus=skus, items=items, transactions=0, zones=40, seed=11)
+    engine.dispose()
+
+def reset(database: Path):
+    # Every item back in stock and no reservations, so each mode starts from the same state
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE inventory_items SET status = 'in_stock', reservation_id = NULL"))
+        conn.execute(text("DELETE FROM reservations"))
+    with Session(engine) as db:
+        stats.rebuild(db)
+        zones.rebuild(db)
+    engine.dispose()
+
+def _worker(mode: str, skus: list, duration: float, keep: float, seed_value: int, results):
+    # Runs in a spawned process that inherited WMS_DATABASE_URL from run()
+    from app import reservations
+    from app.database import SessionLocal
+    rng = random.Random(seed_value)
+    latencies, conflicts, short, errors, reserved = [], 0, 0, 0, 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        began = time.perf_counter()
+        with SessionLocal() as db:
+            try:
+                if mode == "locked":
+                    db.execute(text("UPDATE leases SET owner = owner WHERE 0"))
+                reservation = reservations.reserve(db, f"bench-{seed_value}", rng.choice(skus), rng.randint(1, 4))
+                conflicts += reservation["conflicts"]
+                reserved += reservation["quantity"]
+                if rng.random() >= keep:
+                    reservations.release(db, reservation["id"])
+            except reservations.ReservationConflict:
+                short += 1
+            except Exception as e:
+                if not errors:
+                    print(f"worker {seed_value}: {e!r}")
+                errors += 1
+                db.rollback()
+        latencies.append((time.perf_counter() - began) * 1000)
+    results.put({"latencies": latencies, "conflicts": conflicts, "short": short,
+                 "errors": errors, "units": reserved})
+
+def check(database: Path) -> dict:
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.connect() as conn:
+        mismatched = conn.execute(text("""
+            SELECT COUNT(*) FROM reservations r
+            WHERE r.status = 'active'
+                  AND r.quantity != (SELECT COUNT(*) FROM inventory_items i
+                                     WHERE i.reservation_id = r.id AND i.status = 'reserved')
+        """)).scalar()
+        orphans = conn.execute(text("""
+            SELECT COUNT(*) FROM inventory_items i
+            WHERE i.status = 'reserved'
+                  AND NOT EXISTS (SELECT 1 FROM reservations r WHERE r.id = i.reservation_id AND r.status = 'active')
+        """)).scalar()
+    counters = "SELECT name, value FROM stat_counters WHERE name NOT LIKE 'scans:%' AND value != 0 ORDER BY name"
+    index = "SELECT * FROM zone_stock ORDER BY zone, product_id, status"
+    with Session(engine) as db:
+        before = (db.execute(text(counters)).all(), db.execute(text(index)).all())
+        stats.rebuild(db)
+        zones.rebuild(db)
+        after = (db.execute(text(counters)).all(), db.execute(text(index)).all())
+    engine.dispose()
+    return {"mismatched_reservations": mismatched, "orphaned_items": orphans, "counters_match": before == after}
+
+def run(database: Path, mode: str, args) -> dict:
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.connect() as conn:
+        skus = list(conn.execute(text("SELECT sku FROM products ORDER BY id LIMIT :n"), {"n": args.hot_skus}).scalars())
+    engine.dispose()
+    # Spawned workers import app.database afresh, which reads this at import
+    os.environ["WMS_DATABASE_URL"] = f"sqlite:///{database}"
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    workers = [context.Process(target=_worker, args=(mode, skus, args.duration, args.keep, n, results))
+               for n in range(args.processes)]
+    for worker in workers:
+        worker.start()
+    collected = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    latencies = sorted(l for r in collected for l in r["latencies"])
+    quantile = lambda q: round(latencies[min(int(q * len(latencies)), len(latencies) - 1)], 1)
+    return {
+        "mode": mode,
+        "calls_per_s": round(len(latencies) / args.duration, 1),
+        "units_per_s": round(sum(r["units"] for r in collected) / args.duration, 1),
+        "p50_ms": quantile(0.5), "p95_ms": quantile(0.95), "p99_ms": quantile(0.99),
+        "mean_ms": round(statistics.mean(latencies), 1),
+        "cas_conflicts": sum(r["conflicts"] for r in collected),
+        "short_stock": sum(r["short"] for r in collected),
+        "errors": sum(r["errors"] for r in collected),
+        **check(database),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--skus", type=int, default=200)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--hot-skus", type=int, default=3, help="SKUs every process competes for")
+    parser.add_argument("--keep", type=float, default=0.02, help="fraction of reservations left active")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "reservations.db"
+        seed(database, args.skus, args.items)
+        for mode in args.modes.split(","):
+            reset(database)
+            results.append(run(database, mode, args))
+
+    print(f"{'mode':<12}{'calls/s':>9}{'units/s':>9}{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}"
+          f"{'CAS lost':>10}{'short':>7}{'errors':>8}  invariants")
+    for r in results:
+        ok = r["mismatched_reservations"] == 0 and r["orphaned_items"] == 0 and r["counters_match"]
+        print(f"{r['mode']:<12}{r['calls_per_s']:>9}{r['units_per_s']:>9}{r['p50_ms']:>8}{r['p95_ms']:>8}"
+              f"{r['p99_ms']:>8}{r['cas_conflicts']:>10}{r['short_stock']:>7}{r['errors']:>8}  {'ok' if ok else 'FAILED'}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"config": {k: str(v) if isinstance(v, Path) else v
+                                                      for k, v in vars(args).items()},
+                                           "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Scan throughput and read latency under concurrent load.
+
+Seeds a synthetic warehouse (app.synthetic) into a throwaway SQLite database, starts the API
+against it with uvicorn and drives it with async httpx clients. Requests are
+sent open-loop at a fixed rate and latency is measured from the time each
+request was scheduled, so a server that falls behind shows up as queueing
+delay instead of a lower request rate. --rate 0 switches to closed-loop:
+every client sends its next request as soon as the last one returns.
+
+While each scenario runs, a probe thread repeatedly takes the SQLite write
+lock (BEGIN IMMEDIATE) and records how long it waited. That wait is what a
+scan insert pays for lock contention.
+
+Run from the backend directory:
+    python -m benchmarks.scan_load --tags 100000 --rate 200 --duration 20
+    python -m benchmarks.scan_load --url http://localhost:8000 --scenarios levels,alerts
+    python -m benchmarks.scan_load --compare benchmarks/results/scan_load-previous.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app import migrate, stats, synthetic
+from app import zones as zone_index
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+def seed(database: Path, skus: int, tags: int, zones: int, history: int, seed_value: int):
+    engine = create_engine(f"sqlite:///{database}")
+    synthetic.fast_sqlite_load(engine)
+    migrate.upgrade(engine)
+    counts = synthetic.generate(engine, skus=skus, items=tags, transactions=history,
+                                zones=zones, seed=seed_value)
+    with Session(engine) as db:
+        stats.rebuild(db)
+        zone_index.rebuild(db)
+    engine.dispose()
+    return counts
+
+def scenarios(tags: int, zones, seed_value: int):
+    rng = random.Random(seed_value + 1)
+
+    def scan(client):
+        return client.post("/api/scans/", json={
+            "rfid_tag": f"RFID{rng.randrange(tags):09d}",
+            "location": rng.choice(zones),
+            "scanner_id": f"bench-{rng.randrange(16):02d}",
+        })
+
+    def levels(client):
+        return client.get("/api/inventory/levels")
+
+    def alerts(client):
+        return client.get("/api/inventory/alerts")
+
+    def recent(client):
+        return client.get("/api/scans/recent", params={"limit": 50})
+
+    def mixed(client):
+        # Dock traffic: mostly scans with dashboards polling in between
+        roll = rng.random()
+        if roll < 0.8:
+            return scan(client)
+        if roll < 0.9:
+            return recent(client)
+        if roll < 0.95:
+            return levels(client)
+        return alerts(client)
+
+    return {"scan": scan, "levels": levels, "alerts": alerts, "recent": recent, "mixed": mixed}
+
+def percentiles(values):
+    if not values:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    ordered = sorted(values)
+    pick = lambda q: round(ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000, 2)
+    return {"p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99), "max_ms": round(ordered[-1] * 1000, 2)}
+
+class LockProbe(threading.Thread):
+    # Measures how long a writer waits for the SQLite write lock while the load runs
+    def __init__(self, database: Path, interval: float = 0.05):
+        super().__init__(daemon=True)
+        self.database = database
+        self.interval = interval
+        self.waits = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        connection = sqlite3.connect(self.database, timeout=30, isolation_level=None)
+        try:
+            while not self.stopped.is_set():
+                began = time.perf_counter()
+                connection.execute("BEGIN IMMEDIATE")
+                self.waits.append(time.perf_counter() - began)
+                connection.execute("ROLLBACK")
+                self.stopped.wait(self.interval)
+        finally:
+            connection.close()
+
+    def summary(self):
+        return {**percentiles(self.waits), "samples": len(self.waits),
+                "total_ms": round(sum(self.waits) * 1000, 2)}
+
+async def drive(base_url: str, request, rate: float, duration: float, concurrency: int, timeout: float):
+    latencies, statuses = [], {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def send(scheduled):
+            try:
+                response = await request(client)
+                status = response.status_code
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            statuses[status] = statuses.get(status, 0) + 1
+            if status == 200:
+                latencies.append(loop.time() - scheduled)
+
+        if rate > 0:
+            # Open loop: the schedule does not wait for the server
+            gate = asyncio.Semaphore(concurrency)
+
+            async def scheduled_send(scheduled):
+                async with gate:
+                    await send(scheduled)
+
+            tasks = []
+            for i in range(int(rate * duration)):
+                scheduled = started + i / rate
+                await asyncio.sleep(max(0.0, scheduled - loop.time()))
+                tasks.append(asyncio.create_task(scheduled_send(scheduled)))
+            # A stalled server must not stall the run: whatever is still queued is dropped
+            done, pending = await asyncio.wait(tasks, timeout=timeout) if tasks else ((), ())
+            for task in pending:
+                task.cancel()
+            if pending:
+                statuses["dropped"] = len(pending)
+        else:
+            async def worker():
+                while loop.time() - started < duration:
+                    await send(loop.time())
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = loop.time() - started
+
+    return {
+        "requests": sum(statuses.values()),
+        "ok": statuses.get(200, 0),
+        "errors": {str(k): v for k, v in statuses.items() if k != 200},
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(statuses.get(200, 0) / elapsed, 1) if elapsed else 0.0,
+        **percentiles(latencies),
+    }
+
+def stop_server(server):
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+def start_server(database: Path, port: int, workers: int):
+    env = {**os.environ, "WMS_DATABASE_URL": f"sqlite:///{database}"}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR, env=env
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{url}/health", timeout=1).status_code == 200:
+                return server, url
+        except httpx.HTTPError:
+            pass
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        time.sleep(0.2)
+    stop_server(server)
+    raise RuntimeError("uvicorn did not become healthy within 30s")
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, previous_path: Path):
+    previous = {r["scenario"]: r for r in json.loads(previous_path.read_text())["scenarios"]}
+    print(f"\nvs {previous_path.name}")
+    print(f"{'scenario':<10}{'rps':>10}{'was':>10}{'p95 ms':>10}{'was':>10}{'p99 ms':>10}{'was':>10}")
+    for r in results:
+        old = previous.get(r["scenario"])
+        if old:
+            print(f"{r['scenario']:<10}{r['throughput_rps']:>10}{old['throughput_rps']:>10}"
+                  f"{r['p95_ms']!s:>10}{old['p95_ms']!s:>10}{r['p99_ms']!s:>10}{old['p99_ms']!s:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skus", type=int, default=2_000)
+    parser.add_argument("--tags", type=int, default=50_000)
+    parser.add_argument("--zones", type=int, default=40)
+    parser.add_argument("--history", type=int, default=0, help="approximate transactions to pre-generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", default="scan,recent,levels,alerts,mixed",
+                        help="comma-separated: scan, recent, levels, alerts, mixed")
+    parser.add_argument("--rate", type=float, default=100, help="requests/s per scenario, 0 = closed loop")
+    parser.add_argument("--duration", type=float, default=15, help="seconds per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--timeout", type=float, default=10, help="per-request timeout in seconds")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="drive an already running API instead of starting one")
+    parser.add_argument("--database", type=Path,
+                        help="SQLite file behind --url, for the lock probe")
+    parser.add_argument("--output", type=Path, help="results file (default benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    # Clean up the server and temp database when killed by timeout(1) or CI
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(1))
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    zones = synthetic.zone_names(args.zones)
+    tmp = server = None
+    database = args.database
+    url = args.url
+    if not url:
+        tmp = tempfile.TemporaryDirectory()
+        database = Path(tmp.name) / "bench.db"
+        began = time.perf_counter()
+        counts = seed(database, args.skus, args.tags, args.zones, args.history, args.seed)
+        print(f"Seeded {args.skus:,} SKUs, {args.tags:,} tags, {len(zones)} zones, "
+              f"{counts['transactions']:,} transactions in {time.perf_counter() - began:.1f}s")
+        server, url = start_server(database, args.port, args.workers)
+
+    requests = scenarios(args.tags, zones, args.seed)
+    results = []
+    try:
+        for name in names:
+            probe = LockProbe(database) if database else None
+            if probe:
+                probe.start()
+            result = asyncio.run(drive(url, requests[name], args.rate, args.duration,
+                                         args.concurrency, args.timeout))
+            if probe:
+                probe.stopped.set()
+                probe.join()
+            results.append({"scenario": name, **result, "lock_wait": probe.summary() if probe else None})
+    finally:
+        if server:
+            stop_server(server)
+        if tmp:
+            tmp.cleanup()
+
+    print(f"{'scenario':<10}{'ok':>8}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'lock p95':>10}")
+    for r in results:
+        lock = r["lock_wait"]["p95_ms"] if r["lock_wait"] else "-"
+        print(f"{r['scenario']:<10}{r['ok']:>8}{sum(r['errors'].values()):>8}{r['throughput_rps']:>10}"
+              f"{r['p50_ms']!s:>10}{r['p95_ms']!s:>10}{r['p99_ms']!s:>10}{lock!s:>10}")
+
+    output = args.output or RESULTS_DIR / f"scan_load-{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "revision": git_revision(),
+        "run_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "config": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        "scenarios": results,
+    }, indent=2))
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
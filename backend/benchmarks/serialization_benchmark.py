@@ -0,0 +1,141 @@
+"""
+Response serialization cost for /levels and /alerts, before and after the
+fast JSON path.
+
+"before" is the previous handler shape: a list of dicts returned through
+response_model validation and the default JSONResponse, with created_at
+formatted per row in Python. "after" is what the routes do now. Both
+variants share the same database query, so the difference is serialization.
+
+Run from the backend directory:
+    python -m benchmarks.serialization_benchmark --rows 10000
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import formats, models
+from app.database import Base
+from app.queries import pending_alerts as alert_rows, stock_levels as level_rows
+from app.routers.inventory import ALERT_FIELDS, LEVEL_FIELDS, InventoryLevel, ReorderAlertResponse
+
+def seed(session: Session, rows: int):
+    now = datetime.utcnow()
+    session.bulk_insert_mappings(models.Product, [
+        {"id": i, "sku": f"SKU{i:06d}", "name": f"Product {i}", "reorder_point": i % 25, "reorder_quantity": 50}
+        for i in range(1, rows + 1)
+    ])
+    session.bulk_insert_mappings(models.InventoryItem, [
+        {"rfid_tag": f"RFID{i:08d}", "product_id": 1 + i % rows, "location_zone": "Aisle A-01"}
+        for i in range(rows * 3)
+    ])
+    session.bulk_insert_mappings(models.ReorderAlert, [
+        {"product_id": i, "current_quantity": 1, "reorder_point": 5, "status": "pending",
+         "created_at": now - timedelta(minutes=i)}
+        for i in range(1, rows + 1)
+    ])
+    session.commit()
+
+def build_app(SessionLocal):
+    app = FastAPI()
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/levels/before", response_model=List[InventoryLevel])
+    def levels_before(db: Session = Depends(get_db)):
+        return [dict(zip(LEVEL_FIELDS, row)) for row in level_rows(db)]
+
+    @app.get("/levels/after", response_model=List[InventoryLevel], response_class=formats.FastJSONResponse)
+    def levels_after(db: Session = Depends(get_db)):
+        return formats.json_rows(LEVEL_FIELDS, level_rows(db))
+
+    @app.get("/alerts/before", response_model=List[ReorderAlertResponse])
+    def alerts_before(db: Session = Depends(get_db)):
+        alerts = db.query(models.ReorderAlert, models.Product.name).outerjoin(
+            models.Product, models.Product.id == models.ReorderAlert.product_id
+        ).filter(models.ReorderAlert.status == "pending").all()
+        return [
+            {
+                "id": alert.id,
+                "product_id": alert.product_id,
+                "product_name": name or "Unknown",
+                "current_quantity": alert.current_quantity,
+                "reorder_point": alert.reorder_point,
+                "status": alert.status,
+                "created_at": alert.created_at.strftime("%Y-%m-%d %H:%M:%S") if alert.created_at else ""
+            }
+            for alert, name in alerts
+        ]
+
+    @app.get("/alerts/after", response_model=List[ReorderAlertResponse], response_class=formats.FastJSONResponse)
+    def alerts_after(db: Session = Depends(get_db)):
+        return formats.json_rows(ALERT_FIELDS, alert_rows(db))
+
+    return app
+
+def measure(client, path, repeat):
+    timings = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        response = client.get(path)
+        timings.append(time.perf_counter() - began)
+        assert response.status_code == 200, response.text
+    return round(statistics.median(timings) * 1000, 2), len(response.content), response.json()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+        with SessionLocal() as session:
+            seed(session, args.rows)
+
+        client = TestClient(build_app(SessionLocal))
+        for endpoint in ("levels", "alerts"):
+            before_ms, before_bytes, before_body = measure(client, f"/{endpoint}/before", args.repeat)
+            after_ms, after_bytes, after_body = measure(client, f"/{endpoint}/after", args.repeat)
+            assert before_body == after_body, f"{endpoint}: response bodies differ"
+            results.append({
+                "endpoint": endpoint,
+                "rows": args.rows,
+                "before_ms": before_ms,
+                "after_ms": after_ms,
+                "speedup": round(before_ms / after_ms, 2),
+                "before_bytes": before_bytes,
+                "after_bytes": after_bytes,
+            })
+        engine.dispose()
+
+    print(f"JSON encoder: {'orjson' if formats.orjson else 'stdlib'}")
+    print(f"{'endpoint':<10}{'rows':>8}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for r in results:
+        print(f"{r['endpoint']:<10}{r['rows']:>8}{r['before_ms']:>12}{r['after_ms']:>12}{r['speedup']:>9}x")
+
+    if args.output:
+        args.output.write_text(json.dumps({"encoder": "orjson" if formats.orjson else "stdlib",
+                                           "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,35 @@
-﻿import sqlite3
+﻿import argparse
+import sys
+from app import client
 
-conn = sqlite3.connect('wms.db')
-cursor = conn.cursor()
+# Looks tags up through the API (/api/items) instead of opening wms.db directly
+parser = argparse.ArgumentParser(description="Show RFID tags known to the WMS API")
+parser.add_argument("tags", nargs="*", help="tags to look up (default: tags in the most recent scans)")
+parser.add_argument("--movements", type=int, default=5, help="movements to show per tag")
+parser.add_argument("--site", default=client.SITE, help="site to look in (default: WMS_SITE, else the API's default)")
+args = parser.parse_args()
+client.SITE = args.site
 
-print('RFID tags in database:')
-try:
-    rows = cursor.execute('SELECT rfid_tag, product_id, location_zone FROM inventory_items').fetchall()
-    if rows:
-        for row in rows:
-            print(f'  {row[0]} (Product ID: {row[1]}, Location: {row[2]})')
-    else:
-        print('  No RFID tags found in database')
-except sqlite3.OperationalError as e:
-    print(f'Error: {e}')
-    print('The inventory_items table might not exist')
+tags = args.tags
+if not tags:
+    recent = client.api_get("/api/scans/recent", params={"limit": 50}, timeout=5)
+    tags = list(dict.fromkeys(scan["rfid_tag"] for scan in recent.json())) if recent.ok else []
 
-conn.close()
+if not tags:
+    print(f"No recent scans at {client.API_URL}; pass tags to look them up")
+    sys.exit(0)
+
+result = client.fetch_items(tags, movements=args.movements)
+if result is None:
+    print(f"Could not reach {client.API_URL}")
+    sys.exit(1)
+
+print("RFID tags in database:")
+for item in result["items"]:
+    product = item["product"] or {}
+    print(f"  {item['rfid_tag']} (Product: {product.get('sku')}, Location: {item['location_zone']}, "
+          f"Status: {item['status']})")
+    for move in item["movements"]:
+        print(f"      {move['created_at']}  {move['action']}  {move['location']}")
+for tag in result["missing"]:
+    print(f"  {tag} not found")
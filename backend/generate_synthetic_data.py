@@ -0,0 +1,66 @@
+import argparse
+import time
+from datetime import datetime
+from sqlalchemy import create_engine
+from app.database import DEFAULT_SITE, SITES, SessionLocal, Base, site_url
+from app import migrate, models, rollups, stats, synthetic, zones
+
+# Capacity-test data: python generate_synthetic_data.py --items 2000000 --transactions 100000000
+parser = argparse.ArgumentParser(description="Generate a deterministic synthetic warehouse at production scale")
+parser.add_argument("--database-url", help="target database (default: the site's)")
+parser.add_argument("--site", choices=SITES, default=DEFAULT_SITE, help="site whose database to fill (default: %(default)s)")
+parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+parser.add_argument("--skus", type=int, default=20_000)
+parser.add_argument("--items", type=int, default=1_000_000)
+parser.add_argument("--transactions", type=int, default=20_000_000, help="approximate history size, 0 for none")
+parser.add_argument("--zones", type=int, default=200)
+parser.add_argument("--scanners", type=int, default=60)
+parser.add_argument("--days", type=int, default=365)
+parser.add_argument("--end", type=datetime.fromisoformat, help="last moment of history (default: now)")
+parser.add_argument("--seed", type=int, default=42)
+parser.add_argument("--batch-size", type=int, default=50_000)
+parser.add_argument("--skip-rollups", action="store_true", help="do not rebuild reporting rollups afterwards")
+args = parser.parse_args()
+
+engine = create_engine(args.database_url or site_url(args.site))
+synthetic.fast_sqlite_load(engine)
+if args.reset:
+    Base.metadata.drop_all(bind=engine)
+migrate.upgrade(engine)
+
+began = time.perf_counter()
+last_report = [0.0]
+
+def progress(counts):
+    now = time.perf_counter()
+    if now - last_report[0] >= 5:
+        last_report[0] = now
+        rate = counts["transactions"] / (now - began)
+        print(f"  {counts['items']:,} items, {counts['transactions']:,} transactions ({rate:,.0f}/s)")
+
+print(f"Generating into {engine.url.render_as_string(hide_password=True)}")
+counts = synthetic.generate(
+    engine, skus=args.skus, items=args.items, transactions=args.transactions, zones=args.zones,
+    scanners=args.scanners, days=args.days, seed=args.seed, batch_size=args.batch_size,
+    end=args.end, progress=progress
+)
+print(f"Wrote {counts['products']:,} products, {counts['items']:,} items and "
+      f"{counts['transactions']:,} transactions in {time.perf_counter() - began:.1f}s")
+
+if counts["transactions"] and not args.skip_rollups and engine.dialect.name == "sqlite":
+    print("Rebuilding reporting rollups...")
+    db = SessionLocal(bind=engine)
+    try:
+        rollups.rebuild_rollups(db)
+    finally:
+        db.close()
+if engine.dialect.name == "sqlite":
+    # /api/stats counters and the zone index must match the new items whether or not rollups are rebuilt
+    print("Rebuilding stat counters and zone index...")
+    db = SessionLocal(bind=engine)
+    try:
+        stats.rebuild(db)
+        zones.rebuild(db)
+    finally:
+        db.close()
+print("✅ Done")
@@ -0,0 +1,12 @@
+import multiprocessing
+import os
+
+# gunicorn -c gunicorn.conf.py app.main:app  (see DEPLOYMENT.md)
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+# Schema is migrated once by start.sh before the workers start
+raw_env = ["WMS_AUTO_MIGRATE=0"]
@@ -1,97 +1,70 @@
-﻿import sqlite3
-import os
+﻿import argparse
+from app import backups, migrate, models, stats, zones
+from app.database import DEFAULT_SITE, SITES, site_engine, site_path, site_sessionmaker
 
-print("Initializing database...")
-
-db_path = 'wms.db'
-if os.path.exists(db_path):
-    os.remove(db_path)
-    print(f"Removed existing database: {db_path}")
-
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
-
-# Create tables
-print("Creating tables...")
-cursor.executescript('''
-CREATE TABLE products (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    sku TEXT UNIQUE NOT NULL,
-    name TEXT NOT NULL,
-    description TEXT,
-    reorder_point INTEGER NOT NULL DEFAULT 10,
-    reorder_quantity INTEGER NOT NULL DEFAULT 50,
-    unit_price REAL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+# Schema comes from app/models.py through app.migrate; this script only adds sample rows
+parser = argparse.ArgumentParser(description="Create the schema and load sample data")
+parser.add_argument("--site", choices=SITES, default=DEFAULT_SITE, help="site to initialize (default: %(default)s)")
+parser.add_argument("--reset", action="store_true", help="delete the site's database file first")
+args = parser.parse_args()
+engine = site_engine(args.site)
+db_path = site_path(args.site)
 
-CREATE TABLE inventory_items (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    rfid_tag TEXT UNIQUE NOT NULL,
-    product_id INTEGER,
-    status TEXT DEFAULT 'in_stock' CHECK (status IN ('in_stock', 'reserved', 'shipped', 'damaged')),
-    location_zone TEXT NOT NULL,
-    last_scanned_at TIMESTAMP,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (product_id) REFERENCES products (id)
-);
-
-CREATE TABLE transactions (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    rfid_tag TEXT,
-    action TEXT NOT NULL,
-    location TEXT,
-    scanned_by TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (rfid_tag) REFERENCES inventory_items (rfid_tag)
-);
+print("Initializing database...")
 
-CREATE TABLE reorder_alerts (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    product_id INTEGER,
-    current_quantity INTEGER NOT NULL,
-    reorder_point INTEGER NOT NULL,
-    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'ordered', 'cancelled')),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (product_id) REFERENCES products (id)
-);
-''')
+if args.reset:
+    if db_path.exists():
+        # Kept in case the reset was a mistake; python -m app.backups restore brings it back
+        kept = backups.snapshot(args.site)
+        print(f"Snapshot of the old database: {backups.site_dir(args.site) / kept['file']}")
+    engine.dispose()
+    for path in (db_path, db_path.with_name(db_path.name + "-wal"), db_path.with_name(db_path.name + "-shm")):
+        if path.exists():
+            path.unlink()
+            print(f"Removed existing database file: {path}")
 
-# Insert sample products
-print("Adding sample products...")
-cursor.executemany('''
-INSERT INTO products (sku, name, description, reorder_point, reorder_quantity, unit_price)
-VALUES (?, ?, ?, ?, ?, ?)
-''', [
-    ('LAP001', 'Dell XPS 13', '13-inch laptop, 16GB RAM', 3, 10, 999.99),
-    ('MOU001', 'Logitech MX Master 3', 'Wireless mouse', 5, 20, 79.99),
-    ('KEY001', 'Mechanical Keyboard', 'RGB mechanical keyboard', 4, 15, 129.99),
-    ('MON001', 'Samsung 27" Monitor', '4K UHD Monitor', 2, 5, 299.99)
-])
+print("Applying migrations...")
+migrate.upgrade_locked(engine)
 
-# Insert sample inventory items
-print("Adding sample inventory items...")
-cursor.executemany('''
-INSERT INTO inventory_items (rfid_tag, product_id, location_zone)
-VALUES (?, ?, ?)
-''', [
-    ('RFID001', 1, 'Aisle A-01'),
-    ('RFID002', 1, 'Aisle A-01'),
-    ('RFID003', 2, 'Aisle B-02'),
-    ('RFID004', 2, 'Aisle B-02'),
-    ('RFID005', 3, 'Aisle C-01'),
-    ('RFID006', 4, 'Aisle D-03')
-])
+db = site_sessionmaker(args.site)()
+if db.query(models.Product).count():
+    print("Products already present, skipping sample data")
+else:
+    # Insert sample products
+    print("Adding sample products...")
+    db.add_all([
+        models.Product(sku='LAP001', name='Dell XPS 13', description='13-inch laptop, 16GB RAM',
+                       reorder_point=3, reorder_quantity=10, unit_price=999.99),
+        models.Product(sku='MOU001', name='Logitech MX Master 3', description='Wireless mouse',
+                       reorder_point=5, reorder_quantity=20, unit_price=79.99),
+        models.Product(sku='KEY001', name='Mechanical Keyboard', description='RGB mechanical keyboard',
+                       reorder_point=4, reorder_quantity=15, unit_price=129.99),
+        models.Product(sku='MON001', name='Samsung 27" Monitor', description='4K UHD Monitor',
+                       reorder_point=2, reorder_quantity=5, unit_price=299.99),
+    ])
+    db.flush()
 
-conn.commit()
+    # Insert sample inventory items
+    print("Adding sample inventory items...")
+    db.add_all([
+        models.InventoryItem(rfid_tag=tag, product_id=product_id, location_zone=zone)
+        for tag, product_id, zone in [
+            ('RFID001', 1, 'Aisle A-01'),
+            ('RFID002', 1, 'Aisle A-01'),
+            ('RFID003', 2, 'Aisle B-02'),
+            ('RFID004', 2, 'Aisle B-02'),
+            ('RFID005', 3, 'Aisle C-01'),
+            ('RFID006', 4, 'Aisle D-03'),
+        ]
+    ])
+    db.commit()
+    stats.rebuild(db)
+    zones.rebuild(db)
 
 # Verify the data
-print("\\nVerifying data...")
-products = cursor.execute("SELECT COUNT(*) FROM products").fetchone()[0]
-items = cursor.execute("SELECT COUNT(*) FROM inventory_items").fetchone()[0]
-print(f"Products added: {products}")
-print(f"Inventory items added: {items}")
-
-conn.close()
-print("\\n✅ Database initialized successfully!")
+print("\nVerifying data...")
+print(f"Products: {db.query(models.Product).count()}")
+print(f"Inventory items: {db.query(models.InventoryItem).count()}")
+db.close()
+print("\n✅ Database initialized successfully!")
 print("Sample data ready to use!")
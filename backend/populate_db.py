@@ -1,13 +1,25 @@
-﻿import sqlite3
+﻿import argparse
+import sqlite3
 import os
+from app import backups
+from app.database import DEFAULT_SITE, SITES, site_path
 
-db_path = 'wms.db'
+parser = argparse.ArgumentParser(description="Recreate a site's database with sample data")
+parser.add_argument("--site", choices=SITES, default=DEFAULT_SITE, help="site to fill (default: %(default)s)")
+args = parser.parse_args()
+
+db_path = site_path(args.site)
 print(f"Database path: {os.path.abspath(db_path)}")
 
 # Remove existing database to start fresh (optional - comment out if you want to keep data)
 if os.path.exists(db_path):
+    # A checked copy first, so starting fresh never loses the old data for good
+    kept = backups.snapshot(args.site)
+    print(f"Snapshot of the old database: {backups.site_dir(args.site) / kept['file']}")
     print("Removing existing database...")
-    os.remove(db_path)
+    for path in (db_path, db_path.with_name(db_path.name + "-wal"), db_path.with_name(db_path.name + "-shm")):
+        if path.exists():
+            os.remove(path)
 
 print("Creating new database...")
 conn = sqlite3.connect(db_path)
@@ -0,0 +1,24 @@
+﻿import argparse
+from app.database import DEFAULT_SITE, SITES, site_engine, site_sessionmaker
+from app import migrate, replenishment
+
+# Nightly job: python recompute_reorder_points.py [--site SITE] [--full] [--apply], once per site
+parser = argparse.ArgumentParser(description="Recompute reorder point proposals from observed demand")
+parser.add_argument("--site", choices=SITES, default=DEFAULT_SITE, help="site to recompute (default: %(default)s)")
+parser.add_argument("--full", action="store_true", help="recompute every product, not just those with new activity")
+parser.add_argument("--lead-time-days", type=float, default=replenishment.DEFAULT_LEAD_TIME_DAYS)
+parser.add_argument("--service-level", type=float, default=replenishment.DEFAULT_SERVICE_LEVEL)
+parser.add_argument("--safety-multiplier", type=float, default=1.0)
+parser.add_argument("--apply", action="store_true", help="apply the new proposals to products immediately")
+args = parser.parse_args()
+
+migrate.upgrade_locked(site_engine(args.site))
+db = site_sessionmaker(args.site)()
+try:
+    summary = replenishment.run(db, args.full, args.lead_time_days, args.service_level, args.safety_multiplier)
+    print(f"Products considered: {summary['products_considered']}")
+    print(f"Proposals written: {summary['proposals']}")
+    if args.apply:
+        print(f"Proposals applied: {replenishment.apply_proposals(db)}")
+finally:
+    db.close()
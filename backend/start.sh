@@ -1,2 +1,5 @@
-﻿#!/bin/bash
-uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+#!/bin/bash
+set -e
+# One-shot schema migration, then N workers (WEB_CONCURRENCY, default: CPU count)
+python -m app.migrate
+exec gunicorn -c gunicorn.conf.py app.main:app
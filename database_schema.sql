@@ -1,63 +1,270 @@
-﻿-- SQLite Version of Database Schema
+﻿-- Generated from backend/app/models.py by python -m app.migrate schema; do not edit
+
+CREATE TABLE cycle_counts (
+	id INTEGER NOT NULL, 
+	status VARCHAR(20), 
+	counted_by VARCHAR(100), 
+	created_at DATETIME, 
+	closed_at DATETIME, 
+	found INTEGER, 
+	missing INTEGER, 
+	unexpected INTEGER, 
+	misplaced INTEGER, 
+	PRIMARY KEY (id), 
+	CONSTRAINT check_cycle_count_status CHECK (status IN ('open', 'closed', 'cancelled'))
+);
+
+CREATE TABLE dwell_histogram (
+	zone VARCHAR(50) NOT NULL, 
+	bucket INTEGER NOT NULL, 
+	visits INTEGER NOT NULL, 
+	total_seconds FLOAT NOT NULL, 
+	PRIMARY KEY (zone, bucket)
+);
+
+CREATE TABLE flow_tag_positions (
+	rfid_tag VARCHAR(50) NOT NULL, 
+	zone VARCHAR(50) NOT NULL, 
+	arrived_at DATETIME NOT NULL, 
+	PRIMARY KEY (rfid_tag)
+);
+
+CREATE TABLE job_state (
+	name VARCHAR(50) NOT NULL, 
+	last_transaction_id INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	PRIMARY KEY (name)
+);
+
+CREATE TABLE leases (
+	name VARCHAR(50) NOT NULL, 
+	owner VARCHAR(100) NOT NULL, 
+	expires_at DATETIME NOT NULL, 
+	PRIMARY KEY (name)
+);
+
+CREATE TABLE pick_waves (
+	id INTEGER NOT NULL, 
+	created_at DATETIME, 
+	PRIMARY KEY (id)
+);
 
--- Products catalog
 CREATE TABLE products (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    sku TEXT UNIQUE NOT NULL,
-    name TEXT NOT NULL,
-    description TEXT,
-    reorder_point INTEGER NOT NULL DEFAULT 10,
-    reorder_quantity INTEGER NOT NULL DEFAULT 50,
-    unit_price DECIMAL(10, 2),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+	id INTEGER NOT NULL, 
+	sku VARCHAR(50) NOT NULL, 
+	name VARCHAR(200) NOT NULL, 
+	description TEXT, 
+	reorder_point INTEGER NOT NULL, 
+	reorder_quantity INTEGER NOT NULL, 
+	unit_price FLOAT, 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	UNIQUE (sku)
+);
+
+CREATE TABLE rollup_scanner_hourly (
+	bucket DATETIME NOT NULL, 
+	scanner_id VARCHAR(100) NOT NULL, 
+	scan_count INTEGER NOT NULL, 
+	PRIMARY KEY (bucket, scanner_id)
+);
+
+CREATE TABLE rollup_zone_hourly (
+	bucket DATETIME NOT NULL, 
+	zone VARCHAR(50) NOT NULL, 
+	scan_count INTEGER NOT NULL, 
+	PRIMARY KEY (bucket, zone)
+);
+
+CREATE TABLE schema_migrations (
+	version INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	applied_at DATETIME, 
+	duration_ms INTEGER, 
+	PRIMARY KEY (version)
+);
+
+CREATE TABLE stat_counters (
+	name VARCHAR(120) NOT NULL, 
+	value INTEGER NOT NULL, 
+	PRIMARY KEY (name)
+);
+
+CREATE TABLE zone_stock (
+	zone VARCHAR(50) NOT NULL, 
+	product_id INTEGER NOT NULL, 
+	status VARCHAR(20) NOT NULL, 
+	item_count INTEGER NOT NULL, 
+	PRIMARY KEY (zone, product_id, status)
+);
+
+CREATE TABLE zone_transitions (
+	from_zone VARCHAR(50) NOT NULL, 
+	to_zone VARCHAR(50) NOT NULL, 
+	moves INTEGER NOT NULL, 
+	PRIMARY KEY (from_zone, to_zone)
+);
+
+CREATE TABLE cycle_count_reads (
+	count_id INTEGER NOT NULL, 
+	rfid_tag VARCHAR(50) NOT NULL, 
+	zone VARCHAR(50) NOT NULL, 
+	read_at DATETIME NOT NULL, 
+	PRIMARY KEY (count_id, rfid_tag), 
+	FOREIGN KEY(count_id) REFERENCES cycle_counts (id)
+);
+
+CREATE TABLE cycle_count_variances (
+	count_id INTEGER NOT NULL, 
+	rfid_tag VARCHAR(50) NOT NULL, 
+	outcome VARCHAR(20) NOT NULL, 
+	product_id INTEGER, 
+	expected_zone VARCHAR(50), 
+	counted_zone VARCHAR(50), 
+	PRIMARY KEY (count_id, rfid_tag), 
+	CONSTRAINT check_cycle_count_outcome CHECK (outcome IN ('missing', 'unexpected', 'misplaced')), 
+	FOREIGN KEY(count_id) REFERENCES cycle_counts (id), 
+	FOREIGN KEY(product_id) REFERENCES products (id)
+);
+
+CREATE TABLE cycle_count_zones (
+	count_id INTEGER NOT NULL, 
+	zone VARCHAR(50) NOT NULL, 
+	PRIMARY KEY (count_id, zone), 
+	FOREIGN KEY(count_id) REFERENCES cycle_counts (id)
+);
+
+CREATE TABLE demand_daily (
+	day DATE NOT NULL, 
+	product_id INTEGER NOT NULL, 
+	quantity INTEGER NOT NULL, 
+	PRIMARY KEY (day, product_id), 
+	FOREIGN KEY(product_id) REFERENCES products (id)
+);
+
+CREATE TABLE reorder_alerts (
+	id INTEGER NOT NULL, 
+	product_id INTEGER, 
+	current_quantity INTEGER NOT NULL, 
+	reorder_point INTEGER NOT NULL, 
+	status VARCHAR(20), 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	CONSTRAINT check_alert_status CHECK (status IN ('pending', 'ordered', 'cancelled')), 
+	FOREIGN KEY(product_id) REFERENCES products (id)
+);
+
+CREATE INDEX ix_reorder_alerts_status_product ON reorder_alerts (status, product_id);
+
+CREATE TABLE reorder_proposals (
+	id INTEGER NOT NULL, 
+	product_id INTEGER NOT NULL, 
+	mean_daily_demand FLOAT NOT NULL, 
+	demand_std FLOAT NOT NULL, 
+	lead_time_days FLOAT NOT NULL, 
+	service_level FLOAT NOT NULL, 
+	safety_stock INTEGER NOT NULL, 
+	reorder_point INTEGER NOT NULL, 
+	reorder_quantity INTEGER NOT NULL, 
+	previous_reorder_point INTEGER, 
+	previous_reorder_quantity INTEGER, 
+	explanation TEXT, 
+	status VARCHAR(20), 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	CONSTRAINT check_proposal_status CHECK (status IN ('proposed', 'applied', 'rejected', 'superseded')), 
+	FOREIGN KEY(product_id) REFERENCES products (id)
+);
+
+CREATE INDEX ix_reorder_proposals_product_id ON reorder_proposals (product_id);
+
+CREATE TABLE reservations (
+	id INTEGER NOT NULL, 
+	order_ref VARCHAR(100) NOT NULL, 
+	product_id INTEGER NOT NULL, 
+	requested INTEGER NOT NULL, 
+	quantity INTEGER NOT NULL, 
+	strategy VARCHAR(20) NOT NULL, 
+	status VARCHAR(20), 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	wave_id INTEGER, 
+	PRIMARY KEY (id), 
+	CONSTRAINT check_reservation_status CHECK (status IN ('active', 'released', 'shipped')), 
+	FOREIGN KEY(product_id) REFERENCES products (id), 
+	FOREIGN KEY(wave_id) REFERENCES pick_waves (id)
+);
+
+CREATE INDEX ix_reservations_order_ref ON reservations (order_ref);
+
+CREATE INDEX ix_reservations_status_wave ON reservations (status, wave_id);
+
+CREATE TABLE rollup_product_daily (
+	day DATE NOT NULL, 
+	product_id INTEGER NOT NULL, 
+	scan_count INTEGER NOT NULL, 
+	move_count INTEGER NOT NULL, 
+	PRIMARY KEY (day, product_id), 
+	FOREIGN KEY(product_id) REFERENCES products (id)
 );
 
--- Physical inventory items with RFID tags
 CREATE TABLE inventory_items (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    rfid_tag TEXT UNIQUE NOT NULL,
-    product_id INTEGER,
-    status TEXT DEFAULT 'in_stock' CHECK (status IN ('in_stock', 'reserved', 'shipped', 'damaged')),
-    location_zone TEXT NOT NULL,
-    last_scanned_at TIMESTAMP,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (product_id) REFERENCES products (id)
+	id INTEGER NOT NULL, 
+	rfid_tag VARCHAR(50) NOT NULL, 
+	product_id INTEGER, 
+	status VARCHAR(20), 
+	location_zone VARCHAR(50) NOT NULL, 
+	last_scanned_at DATETIME, 
+	created_at DATETIME, 
+	reservation_id INTEGER, 
+	PRIMARY KEY (id), 
+	CONSTRAINT check_valid_status CHECK (status IN ('in_stock', 'reserved', 'shipped', 'damaged')), 
+	UNIQUE (rfid_tag), 
+	FOREIGN KEY(product_id) REFERENCES products (id), 
+	FOREIGN KEY(reservation_id) REFERENCES reservations (id)
 );
 
--- Transaction audit log
+CREATE INDEX ix_inventory_items_product_status ON inventory_items (product_id, status);
+
+CREATE INDEX ix_inventory_items_reservation ON inventory_items (reservation_id);
+
+CREATE INDEX ix_inventory_items_status_seen ON inventory_items (status, last_scanned_at);
+
+CREATE INDEX ix_inventory_items_zone ON inventory_items (location_zone);
+
+CREATE TABLE missing_item_alerts (
+	id INTEGER NOT NULL, 
+	rfid_tag VARCHAR(50) NOT NULL, 
+	product_id INTEGER, 
+	zone VARCHAR(50) NOT NULL, 
+	last_scanned_at DATETIME NOT NULL, 
+	threshold_days FLOAT NOT NULL, 
+	status VARCHAR(20), 
+	created_at DATETIME, 
+	resolved_at DATETIME, 
+	PRIMARY KEY (id), 
+	CONSTRAINT check_missing_alert_status CHECK (status IN ('open', 'found', 'cancelled')), 
+	FOREIGN KEY(rfid_tag) REFERENCES inventory_items (rfid_tag), 
+	FOREIGN KEY(product_id) REFERENCES products (id)
+);
+
+CREATE INDEX ix_missing_item_alerts_status ON missing_item_alerts (status, id);
+
+CREATE INDEX ix_missing_item_alerts_tag_status ON missing_item_alerts (rfid_tag, status);
+
 CREATE TABLE transactions (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    rfid_tag TEXT,
-    action TEXT NOT NULL,
-    location TEXT,
-    scanned_by TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (rfid_tag) REFERENCES inventory_items (rfid_tag)
+	id INTEGER NOT NULL, 
+	rfid_tag VARCHAR(50), 
+	action VARCHAR(20) NOT NULL, 
+	location VARCHAR(50), 
+	scanned_by VARCHAR(100), 
+	created_at DATETIME, 
+	product_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(rfid_tag) REFERENCES inventory_items (rfid_tag), 
+	FOREIGN KEY(product_id) REFERENCES products (id)
 );
 
--- Reorder alerts
-CREATE TABLE reorder_alerts (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    product_id INTEGER,
-    current_quantity INTEGER NOT NULL,
-    reorder_point INTEGER NOT NULL,
-    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'ordered', 'cancelled')),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (product_id) REFERENCES products (id)
-);
-
--- Insert sample data
-INSERT INTO products (sku, name, description, reorder_point, reorder_quantity, unit_price) VALUES
-('LAP001', 'Dell XPS 13', '13-inch laptop, 16GB RAM', 3, 10, 999.99),
-('MOU001', 'Logitech MX Master 3', 'Wireless mouse', 5, 20, 79.99),
-('KEY001', 'Mechanical Keyboard', 'RGB mechanical keyboard', 4, 15, 129.99),
-('MON001', 'Samsung 27" Monitor', '4K UHD Monitor', 2, 5, 299.99);
-
--- Insert sample inventory items
-INSERT INTO inventory_items (rfid_tag, product_id, location_zone) VALUES
-('RFID001', 1, 'Aisle A-01'),
-('RFID002', 1, 'Aisle A-01'),
-('RFID003', 2, 'Aisle B-02'),
-('RFID004', 2, 'Aisle B-02'),
-('RFID005', 3, 'Aisle C-01'),
-('RFID006', 4, 'Aisle D-03');
+CREATE INDEX ix_transactions_created_at ON transactions (created_at);
+
+CREATE INDEX ix_transactions_tag_created ON transactions (rfid_tag, created_at);
@@ -15,6 +15,7 @@ import json
 import hashlib
 from streamlit_autorefresh import st_autorefresh
 import plotly.figure_factory as ff
+from wms_api import api_get
 
 # Page configuration
 st.set_page_config(
@@ -29,6 +30,14 @@ st.set_page_config(
     }
 )
 
+@st.cache_data(ttl=300)
+def fetch_forecast(horizon=30):
+    try:
+        response = api_get("/api/forecast", params={"horizon": horizon}, timeout=30)
+        return response.json() if response.status_code == 200 else None
+    except:
+        return None
+
 # Custom CSS for advanced styling
 st.markdown("""
     <style>
@@ -584,14 +593,19 @@ with tab5:
     col1, col2 = st.columns(2)
     
     with col1:
-        # Demand forecast
-        future_dates = pd.date_range(start=datetime.now(), periods=30, freq='D')
-        demand_forecast = pd.DataFrame({
-            'Date': future_dates,
-            'Predicted Demand': [random.uniform(80, 120) + i*0.5 for i in range(30)],
-            'Upper Bound': [random.uniform(90, 130) + i*0.5 for i in range(30)],
-            'Lower Bound': [random.uniform(70, 110) + i*0.5 for i in range(30)]
-        })
+        # Demand forecast from the backend forecasting engine
+        forecast_data = fetch_forecast(30)
+        if forecast_data:
+            daily = pd.DataFrame(forecast_data['daily'])
+            demand_forecast = pd.DataFrame({
+                'Date': pd.to_datetime(daily['date']),
+                'Predicted Demand': daily['forecast'],
+                'Upper Bound': daily['upper'],
+                'Lower Bound': daily['lower']
+            })
+        else:
+            st.info("Forecast unavailable - backend not reachable")
+            demand_forecast = pd.DataFrame(columns=['Date', 'Predicted Demand', 'Upper Bound', 'Lower Bound'])
         
         fig_forecast = go.Figure()
         fig_forecast.add_trace(go.Scatter(
@@ -621,10 +635,14 @@ with tab5:
         st.plotly_chart(fig_forecast, use_container_width=True)
     
     with col2:
-        # Inventory prediction
-        categories = ['Electronics', 'Clothing', 'Food', 'Furniture', 'Tools']
-        current_inv = [random.uniform(60, 100) for _ in categories]
-        predicted_inv = [x * random.uniform(0.8, 1.2) for x in current_inv]
+        # Inventory prediction: projected stock after 30 days for the fastest movers
+        if forecast_data and forecast_data['products']:
+            df_fc = pd.DataFrame(forecast_data['products']).nlargest(5, 'horizon_total')
+            categories = df_fc['name'].tolist()
+            current_inv = df_fc['current_quantity'].tolist()
+            predicted_inv = (df_fc['current_quantity'] - df_fc['horizon_total']).clip(lower=0).tolist()
+        else:
+            categories, current_inv, predicted_inv = [], [], []
         
         fig_inv_pred = go.Figure(data=[
             go.Bar(name='Current', x=categories, y=current_inv),
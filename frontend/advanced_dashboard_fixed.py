@@ -3,9 +3,9 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import requests
 from datetime import datetime, timedelta
 import time
+from wms_api import api_get, api_post
 
 # Page config - MUST BE FIRST STREAMLIT COMMAND
 st.set_page_config(
@@ -98,9 +98,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# API endpoint
-API_URL = "http://localhost:8000"
-
 # Initialize session state
 if 'last_update' not in st.session_state:
     st.session_state.last_update = datetime.now()
@@ -143,7 +140,7 @@ with st.sidebar:
 @st.cache_data(ttl=10)
 def fetch_inventory_data():
     try:
-        response = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
+        response = api_get("/api/inventory/levels", timeout=5)
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -154,7 +151,7 @@ def fetch_inventory_data():
 @st.cache_data(ttl=10)
 def fetch_alert_data():
     try:
-        response = requests.get(f"{API_URL}/api/inventory/alerts", timeout=5)
+        response = api_get("/api/inventory/alerts", timeout=5)
         if response.status_code == 200:
             return response.json()
     except:
@@ -164,7 +161,7 @@ def fetch_alert_data():
 @st.cache_data(ttl=10)
 def fetch_scan_data():
     try:
-        response = requests.get(f"{API_URL}/api/scans/recent?limit=50", timeout=5)
+        response = api_get("/api/scans/recent?limit=50", timeout=5)
         if response.status_code == 200:
             return response.json()
     except:
@@ -393,8 +390,8 @@ if not df_inventory.empty:
         with col1:
             if st.button("? Add Test Scan 1"):
                 try:
-                    response = requests.post(
-                        f"{API_URL}/api/scans/",
+                    response = api_post(
+                        "/api/scans/",
                         json={"rfid_tag": "RFID001", "location": "Loading Dock", "scanner_id": "test"}
                     )
                     if response.status_code == 200:
@@ -408,8 +405,8 @@ if not df_inventory.empty:
         with col2:
             if st.button("? Add Test Scan 2"):
                 try:
-                    response = requests.post(
-                        f"{API_URL}/api/scans/",
+                    response = api_post(
+                        "/api/scans/",
                         json={"rfid_tag": "RFID002", "location": "Shipping Bay", "scanner_id": "test"}
                     )
                     if response.status_code == 200:
@@ -1,24 +1,20 @@
 ﻿import streamlit as st
 import pandas as pd
 import plotly.express as px
-import requests
 from datetime import datetime
-import os
+from wms_api import api_get
 
 st.set_page_config(page_title="Smart WMS", page_icon="🏭", layout="wide")
 
-# Get API URL from environment variable
-API_URL = os.getenv("API_URL", "https://your-backend-url.onrender.com")
-
 st.title("🏭 Smart Warehouse Management System")
 
 try:
-    response = requests.get(f"{API_URL}/health", timeout=5)
+    response = api_get("/health", timeout=5)
     if response.status_code == 200:
         st.success("✅ Connected to backend")
         
         # Fetch inventory
-        inv = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
+        inv = api_get("/api/inventory/levels", timeout=5)
         if inv.status_code == 200:
             data = inv.json()
             df = pd.DataFrame(data)
@@ -1,7 +1,6 @@
 import streamlit as st
-import requests
 from datetime import datetime
-import os
+from wms_api import API_URL, api_get
 
 # Page config
 st.set_page_config(
@@ -41,27 +40,17 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Environment variables
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
-
 # Check backend status
 @st.cache_data(ttl=5)
 def check_backend():
     try:
-        response = requests.get(f"{BACKEND_URL}/health", timeout=3)
+        response = api_get("/api/status", timeout=3)
         if response.status_code == 200:
-            try:
-                inv_response = requests.get(f"{BACKEND_URL}/api/inventory/levels", timeout=3)
-                if inv_response.status_code == 200:
-                    products = inv_response.json()
-                    return {
-                        'status': 'online',
-                        'inventory_count': len(products),
-                        'last_check': datetime.now()
-                    }
-            except:
-                pass
-            return {'status': 'online', 'inventory_count': 0, 'last_check': datetime.now()}
+            return {
+                'status': 'online',
+                'inventory_count': response.json().get('products', 0),
+                'last_check': datetime.now()
+            }
     except:
         pass
     return {'status': 'offline', 'inventory_count': 0, 'last_check': datetime.now()}
@@ -114,7 +103,7 @@ st.divider()
 if backend['status'] == 'online':
     st.header("📦 Inventory Levels")
     try:
-        response = requests.get(f"{BACKEND_URL}/api/inventory/levels", timeout=3)
+        response = api_get("/api/inventory/levels", timeout=3)
         if response.status_code == 200:
             products = response.json()
             if products:
@@ -131,7 +120,7 @@ if backend['status'] == 'online':
     # Reorder Alerts Section
     st.header("⚠️ Reorder Alerts")
     try:
-        response = requests.get(f"{BACKEND_URL}/api/inventory/alerts", timeout=3)
+        response = api_get("/api/inventory/alerts", timeout=3)
         if response.status_code == 200:
             alerts = response.json()
             if alerts:
@@ -144,7 +133,7 @@ if backend['status'] == 'online':
         st.error(f"Error loading alerts: {str(e)}")
 else:
     st.warning("⚠️ Backend is offline. Please check the backend service.")
-    st.info(f"Backend URL: {BACKEND_URL}")
+    st.info(f"Backend URL: {API_URL}")
 
 st.divider()
 
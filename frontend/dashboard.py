@@ -1,9 +1,9 @@
 ﻿import streamlit as st
 import pandas as pd
 import plotly.express as px
-import requests
 from datetime import datetime
 import time
+from wms_api import API_URL, api_get
 
 # Page config - THIS IS KEY for full width
 st.set_page_config(
@@ -32,9 +32,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# API endpoint
-API_URL = "http://localhost:8000"
-
 # Title
 st.title("🏭 Smart Warehouse Management System")
 st.markdown("Real-time inventory tracking with RFID")
@@ -53,7 +50,7 @@ col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
 
 try:
     # Fetch inventory levels
-    response = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
+    response = api_get("/api/inventory/levels", timeout=5)
     if response.status_code == 200:
         inventory_data = response.json()
         df = pd.DataFrame(inventory_data)
@@ -90,7 +87,7 @@ with left_col:
     st.subheader("📊 Inventory Levels")
     
     try:
-        response = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
+        response = api_get("/api/inventory/levels", timeout=5)
         if response.status_code == 200:
             data = response.json()
             if data:
@@ -129,7 +126,7 @@ with right_col:
     st.subheader("⚠️ Low Stock Alerts")
     
     try:
-        response = requests.get(f"{API_URL}/api/inventory/alerts", timeout=5)
+        response = api_get("/api/inventory/alerts", timeout=5)
         if response.status_code == 200:
             alerts = response.json()
             
@@ -150,7 +147,7 @@ st.subheader("📋 Recent Scans")
 st.caption("Latest RFID scan activities")
 
 try:
-    response = requests.get(f"{API_URL}/api/scans/recent?limit=20", timeout=5)
+    response = api_get("/api/scans/recent?limit=20", timeout=5)
     if response.status_code == 200:
         scans = response.json()
         
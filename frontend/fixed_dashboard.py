@@ -2,9 +2,9 @@
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import requests
 from datetime import datetime
 import time
+from wms_api import api_get, api_post, fetch_inventory_levels, fetch_recent_scans
 
 # Page config
 st.set_page_config(
@@ -31,9 +31,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# API endpoint
-API_URL = "http://localhost:8000"
-
 # Title
 st.title("🏭 Smart Warehouse Management System")
 st.caption("Real-time inventory tracking with RFID")
@@ -49,27 +46,19 @@ with st.sidebar:
 # Function to fetch data
 @st.cache_data(ttl=5)
 def fetch_inventory():
-    try:
-        response = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
-        return response.json() if response.status_code == 200 else None
-    except:
-        return None
+    return fetch_inventory_levels()
 
 @st.cache_data(ttl=5)
 def fetch_alerts():
     try:
-        response = requests.get(f"{API_URL}/api/inventory/alerts", timeout=5)
+        response = api_get("/api/inventory/alerts", timeout=5)
         return response.json() if response.status_code == 200 else None
     except:
         return None
 
 @st.cache_data(ttl=5)
 def fetch_scans():
-    try:
-        response = requests.get(f"{API_URL}/api/scans/recent?limit=20", timeout=5)
-        return response.json() if response.status_code == 200 else None
-    except:
-        return None
+    return fetch_recent_scans(limit=20)
 
 # Fetch all data
 inventory_data = fetch_inventory()
@@ -82,7 +71,7 @@ if inventory_data is None:
     st.stop()
 
 # Convert to DataFrame
-df_inventory = pd.DataFrame(inventory_data) if inventory_data else pd.DataFrame()
+df_inventory = inventory_data
 
 # Metrics Row
 if not df_inventory.empty:
@@ -151,9 +140,8 @@ with col_right:
 # RECENT SCANS SECTION - FIXED VERSION
 st.subheader("📋 Recent Scans")
 
-if scan_data and len(scan_data) > 0:
-    # Convert to DataFrame
-    df_scans = pd.DataFrame(scan_data)
+if scan_data is not None and not scan_data.empty:
+    df_scans = scan_data
     
     # Debug info in expander (optional)
     with st.expander("Debug Info"):
@@ -211,8 +199,8 @@ else:
     with col1:
         if st.button("➕ Add Test Scan 1"):
             try:
-                response = requests.post(
-                    f"{API_URL}/api/scans/",
+                response = api_post(
+                    "/api/scans/",
                     json={"rfid_tag": "RFID001", "location": "Loading Dock", "scanner_id": "test"}
                 )
                 if response.status_code == 200:
@@ -226,8 +214,8 @@ else:
     with col2:
         if st.button("➕ Add Test Scan 2"):
             try:
-                response = requests.post(
-                    f"{API_URL}/api/scans/",
+                response = api_post(
+                    "/api/scans/",
                     json={"rfid_tag": "RFID002", "location": "Shipping Bay", "scanner_id": "test"}
                 )
                 if response.status_code == 200:
@@ -2,28 +2,21 @@
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import requests
 from datetime import datetime
+from wms_api import fetch_inventory_levels
 
 st.set_page_config(page_title="Inventory View", page_icon="📦", layout="wide")
 
 st.title("📦 Detailed Inventory View")
 
-API_URL = "http://localhost:8000"
-
 # Fetch inventory data
 @st.cache_data(ttl=5)
 def fetch_inventory():
-    try:
-        response = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
-        return response.json() if response.status_code == 200 else None
-    except:
-        return None
+    return fetch_inventory_levels()
 
-data = fetch_inventory()
+df = fetch_inventory()
 
-if data:
-    df = pd.DataFrame(data)
+if df is not None and not df.empty:
     
     # Filters
     col1, col2, col3 = st.columns(3)
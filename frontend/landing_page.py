@@ -1,8 +1,8 @@
 ﻿import streamlit as st
 import pandas as pd
-import requests
 from datetime import datetime
 import time
+from wms_api import api_get
 
 # Page config
 st.set_page_config(
@@ -104,24 +104,18 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# API endpoint
-API_URL = "http://localhost:8000"
-
 # Fetch system status
 @st.cache_data(ttl=10)
 def get_system_status():
     try:
-        response = requests.get(f"{API_URL}/health", timeout=5)
+        response = api_get("/api/status", timeout=5)
         if response.status_code == 200:
-            inventory = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
-            scans = requests.get(f"{API_URL}/api/scans/recent?limit=1", timeout=5)
-            alerts = requests.get(f"{API_URL}/api/inventory/alerts", timeout=5)
-            
+            status = response.json()
             return {
                 "status": "online",
-                "inventory_count": len(inventory.json()) if inventory.status_code == 200 else 0,
-                "scan_count": len(scans.json()) if scans.status_code == 200 else 0,
-                "alert_count": len(alerts.json()) if alerts.status_code == 200 else 0,
+                "inventory_count": status["products"],
+                "scan_count": 1 if status["last_scan_at"] else 0,
+                "alert_count": status["pending_alerts"],
                 "last_check": datetime.now()
             }
     except:
@@ -253,7 +247,8 @@ with col_status1:
     st.markdown("""
     <div style="background: white; padding: 1.5rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.05);">
         <h4>API Endpoints</h4>
-        <p>✅ /health - System Health</p>
+        <p>✅ /health/ready - System Health</p>
+        <p>✅ /api/status - Status Summary</p>
         <p>✅ /api/inventory/levels - Inventory Data</p>
         <p>✅ /api/scans/recent - Scan History</p>
         <p>✅ /api/inventory/alerts - Reorder Alerts</p>
@@ -1,10 +1,9 @@
 ﻿import streamlit as st
 import subprocess
 import sys
-import os
 import webbrowser
 from datetime import datetime
-import requests
+from wms_api import api_get
 
 # Page config
 st.set_page_config(
@@ -83,12 +82,12 @@ if 'apps' not in st.session_state:
 @st.cache_data(ttl=5)
 def check_backend():
     try:
-        response = requests.get("http://localhost:8000/health", timeout=2)
+        response = api_get("/api/status", timeout=2)
         if response.status_code == 200:
-            inv_response = requests.get("http://localhost:8000/api/inventory/levels", timeout=2)
+            status = response.json()
             return {
                 'status': 'online',
-                'inventory_count': len(inv_response.json()) if inv_response.status_code == 200 else 0,
+                'inventory_count': status['products'],
                 'last_check': datetime.now()
             }
     except:
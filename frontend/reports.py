@@ -2,45 +2,98 @@
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import requests
 from datetime import datetime, timedelta
+from urllib.parse import quote
 import numpy as np
+import pyarrow as pa
+from wms_api import api_get, fetch_inventory_levels
 
 st.set_page_config(page_title="Reports", page_icon="📈", layout="wide")
 
 st.title("📈 Analytics & Reports")
 
-API_URL = "http://localhost:8000"
-
 # Fetch data
 @st.cache_data(ttl=5)
 def fetch_inventory():
+    return fetch_inventory_levels()
+
+@st.cache_data(ttl=30)
+def fetch_movement(start, granularity):
     try:
-        response = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
+        response = api_get(
+            "/api/reports/movement",
+            params={"from": start.isoformat(), "granularity": granularity},
+            timeout=5
+        )
         return response.json() if response.status_code == 200 else None
     except:
         return None
 
-@st.cache_data(ttl=5)
-def fetch_scans():
+@st.cache_data(ttl=60)
+def fetch_analytics(report, start):
+    # Arrow IPC stream from the backend analytics engine, decoded column-wise
+    try:
+        response = api_get(
+            f"/api/analytics/{report}",
+            params={"from": start.isoformat()},
+            timeout=30
+        )
+        if response.status_code != 200:
+            return None
+        return pa.ipc.open_stream(response.content).read_pandas()
+    except:
+        return None
+
+@st.cache_data(ttl=10)
+def fetch_zones():
+    try:
+        response = api_get("/api/zones", timeout=5)
+        return response.json() if response.status_code == 200 else None
+    except:
+        return None
+
+@st.cache_data(ttl=10)
+def fetch_zone_contents(zone):
+    try:
+        response = api_get(f"/api/zones/{quote(zone, safe='')}/contents", params={"items": 200}, timeout=5)
+        return response.json() if response.status_code == 200 else None
+    except:
+        return None
+
+@st.cache_data(ttl=30)
+def fetch_flow():
+    try:
+        response = api_get("/api/analytics/flow", timeout=30)
+        return response.json() if response.status_code == 200 else None
+    except:
+        return None
+
+@st.cache_data(ttl=300)
+def fetch_forecast():
     try:
-        response = requests.get(f"{API_URL}/api/scans/recent?limit=100", timeout=5)
+        response = api_get("/api/forecast", timeout=30)
         return response.json() if response.status_code == 200 else None
     except:
         return None
 
-inventory_data = fetch_inventory()
-scan_data = fetch_scans()
+def period_start(date_range):
+    now = datetime.utcnow()
+    if date_range == "Year to Date":
+        return datetime(now.year, 1, 1)
+    days = {"Last 7 Days": 7, "Last 30 Days": 30, "Last 90 Days": 90}[date_range]
+    return (now - timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+
+df_inv = fetch_inventory()
 
-if inventory_data:
-    df_inv = pd.DataFrame(inventory_data)
+if df_inv is not None and not df_inv.empty:
     
     # Date range selector
     col1, col2 = st.columns(2)
     with col1:
         report_type = st.selectbox(
             "Report Type",
-            ["Inventory Summary", "Movement Analysis", "Stock Projection", "Performance Metrics"]
+            ["Inventory Summary", "Zone Occupancy", "Zone Flow", "Movement Analysis", "Movement Heatmap",
+             "Stock Projection", "Performance Metrics"]
         )
     with col2:
         date_range = st.selectbox(
@@ -80,17 +133,73 @@ if inventory_data:
             use_container_width=True
         )
     
-    elif report_type == "Movement Analysis" and scan_data:
+    elif report_type == "Zone Occupancy":
+        st.subheader("🗺️ Zone Occupancy")
+        
+        # Current contents from the backend zone index, independent of the time period
+        zones = fetch_zones()
+        if zones:
+            df_zones = pd.DataFrame(zones).sort_values('in_stock', ascending=False)
+            fig_zones = px.bar(
+                df_zones.head(20),
+                x='in_stock',
+                y='zone',
+                orientation='h',
+                title="In-Stock Items by Zone",
+                labels={'in_stock': 'Items', 'zone': 'Zone'}
+            )
+            st.plotly_chart(fig_zones, use_container_width=True)
+            
+            zone = st.selectbox("Zone", df_zones['zone'].tolist())
+            contents = fetch_zone_contents(zone)
+            if contents:
+                st.metric("Items in Zone", contents['items'])
+                st.dataframe(pd.DataFrame(contents['products']), use_container_width=True)
+                if contents['tags']:
+                    st.caption(f"First {len(contents['tags'])} tags")
+                    st.dataframe(pd.DataFrame(contents['tags']), use_container_width=True)
+        else:
+            st.info("No items are located in any zone")
+    
+    elif report_type == "Zone Flow":
+        st.subheader("🔀 Zone Flow")
+        
+        # All-time dwell distributions and transitions, maintained incrementally by the backend
+        flow = fetch_flow()
+        if flow and flow['dwell']:
+            if flow['pending_transactions']:
+                st.caption(f"{flow['pending_transactions']:,} newer transactions not folded in yet")
+            df_dwell = pd.DataFrame(flow['dwell']).sort_values('p50_hours', ascending=False)
+            fig_dwell = go.Figure()
+            for column, label in [('p50_hours', 'Median'), ('p90_hours', 'p90'), ('p99_hours', 'p99')]:
+                fig_dwell.add_trace(go.Bar(x=df_dwell['zone'], y=df_dwell[column], name=label))
+            fig_dwell.update_layout(title="Dwell Time by Zone (hours)", barmode='group')
+            st.plotly_chart(fig_dwell, use_container_width=True)
+            
+            if flow['transitions']:
+                df_moves = pd.DataFrame(flow['transitions'])
+                matrix = df_moves.pivot_table(index='from_zone', columns='to_zone', values='moves', fill_value=0)
+                fig_moves = px.imshow(
+                    matrix,
+                    title="Zone to Zone Moves",
+                    labels={'x': 'To Zone', 'y': 'From Zone', 'color': 'Moves'},
+                    color_continuous_scale='Blues'
+                )
+                st.plotly_chart(fig_moves, use_container_width=True)
+        else:
+            st.info("No zone moves recorded yet")
+    
+    elif report_type == "Movement Analysis":
         st.subheader("🔄 Movement Analysis")
         
-        df_scans = pd.DataFrame(scan_data)
-        if 'created_at' in df_scans.columns:
-            df_scans['created_at'] = pd.to_datetime(df_scans['created_at'])
-            df_scans['hour'] = df_scans['created_at'].dt.hour
-            df_scans['date'] = df_scans['created_at'].dt.date
+        # Served from backend rollups, so the whole period is covered, not just recent scans
+        movement = fetch_movement(period_start(date_range), "hour")
+        if movement and movement['zones']:
+            df_zones = pd.DataFrame(movement['zones'])
+            df_zones['hour'] = pd.to_datetime(df_zones['bucket']).dt.hour
             
             # Scan frequency by hour
-            hourly = df_scans['hour'].value_counts().sort_index()
+            hourly = df_zones.groupby('hour')['scans'].sum().sort_index()
             fig_hourly = px.bar(
                 x=hourly.index,
                 y=hourly.values,
@@ -100,7 +209,7 @@ if inventory_data:
             st.plotly_chart(fig_hourly, use_container_width=True)
             
             # Top locations
-            top_locations = df_scans['location'].value_counts().head(10)
+            top_locations = df_zones.groupby('zone')['scans'].sum().nlargest(10)
             fig_locations = px.bar(
                 x=top_locations.values,
                 y=top_locations.index,
@@ -109,13 +218,61 @@ if inventory_data:
                 labels={'x': 'Number of Scans', 'y': 'Location'}
             )
             st.plotly_chart(fig_locations, use_container_width=True)
+            
+            # Most moved products
+            if movement['products']:
+                df_products = pd.DataFrame(movement['products'])
+                top_products = df_products.groupby('name')['moves'].sum().nlargest(10)
+                fig_products = px.bar(
+                    x=top_products.values,
+                    y=top_products.index,
+                    orientation='h',
+                    title="Most Moved Products",
+                    labels={'x': 'Zone Moves', 'y': 'Product'}
+                )
+                st.plotly_chart(fig_products, use_container_width=True)
+        else:
+            st.info("No scan activity recorded for this period")
+    
+    elif report_type == "Movement Heatmap":
+        st.subheader("🗺️ Movement Heatmap")
+        
+        df_heat = fetch_analytics("movement-heatmap", period_start(date_range))
+        if df_heat is not None and not df_heat.empty:
+            pivot = df_heat.groupby(['zone', 'hour'])['scans'].sum().unstack(fill_value=0)
+            fig_heat = px.imshow(
+                pivot,
+                labels={'x': 'Hour of Day', 'y': 'Zone', 'color': 'Scans'},
+                title="Scans per Zone and Hour",
+                aspect="auto"
+            )
+            st.plotly_chart(fig_heat, use_container_width=True)
+        else:
+            st.info("No scan activity recorded for this period")
+        
+        df_dwell = fetch_analytics("dwell-time", period_start(date_range))
+        if df_dwell is not None and not df_dwell.empty:
+            st.subheader("⏱️ Dwell Time by Zone (hours)")
+            st.dataframe(
+                df_dwell[['zone', 'visits', 'mean_hours', 'p50_hours', 'p90_hours']].round(2),
+                use_container_width=True
+            )
     
     elif report_type == "Stock Projection":
         st.subheader("📈 Stock Projection")
         
-        # Simple projection based on current levels
+        # Days until stock falls to the reorder point at the forecast daily demand
+        forecast = fetch_forecast()
+        daily_demand = {}
+        if forecast:
+            daily_demand = {p['product_id']: p['daily_forecast'] for p in forecast['products']}
+        
         for _, row in df_inv.iterrows():
-            days_until_reorder = max(0, (row['current_quantity'] / max(row['reorder_point'], 1)) * 30)
+            demand = daily_demand.get(row['id'], 0)
+            if demand > 0:
+                days_until_reorder = max(0, (row['current_quantity'] - row['reorder_point']) / demand)
+            else:
+                days_until_reorder = 30 if row['current_quantity'] > row['reorder_point'] else 0
             
             st.markdown(f"""
             <div style="background: white; padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
@@ -135,7 +292,8 @@ if inventory_data:
         st.subheader("📊 Performance Metrics")
         
         # Calculate metrics
-        turnover_rate = len(scan_data) / max(len(df_inv), 1) if scan_data else 0
+        df_turnover = fetch_analytics("turnover", period_start(date_range))
+        turnover_rate = df_turnover['turnover'].mean() if df_turnover is not None and not df_turnover.empty else 0
         stock_accuracy = np.random.randint(95, 100)  # Simulated for demo
         fulfillment_rate = np.random.randint(90, 99)
         
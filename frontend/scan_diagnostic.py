@@ -1,17 +1,15 @@
 ﻿import streamlit as st
 import pandas as pd
-import requests
 from datetime import datetime
+from wms_api import api_get, api_post
 
 st.set_page_config(page_title="Scan Diagnostics", layout="wide")
 st.title("🔍 Scan Data Diagnostic Tool")
 
-API_URL = "http://localhost:8000"
-
 # Check backend connection
 st.subheader("1. Backend Connection Check")
 try:
-    health = requests.get(f"{API_URL}/health", timeout=5)
+    health = api_get("/health", timeout=5)
     if health.status_code == 200:
         st.success(f"✅ Backend Connected: {health.json()}")
     else:
@@ -24,7 +22,7 @@ except Exception as e:
 st.subheader("2. Raw Scan Data from API")
 
 try:
-    response = requests.get(f"{API_URL}/api/scans/recent?limit=50", timeout=5)
+    response = api_get("/api/scans/recent?limit=50", timeout=5)
     if response.status_code == 200:
         scan_data = response.json()
         st.write(f"**Found {len(scan_data)} scans**")
@@ -151,7 +149,7 @@ with col_b:
                 "location": location,
                 "scanner_id": scanner_id
             }
-            response = requests.post(f"{API_URL}/api/scans/", json=payload)
+            response = api_post("/api/scans/", json=payload)
             if response.status_code == 200:
                 st.success(f"✅ Scan added: {response.json()}")
                 st.cache_data.clear()
@@ -1,6 +1,8 @@
 ﻿import streamlit as st
 import json
+import pandas as pd
 from datetime import datetime
+from wms_api import api_get, api_post
 
 st.set_page_config(page_title="Settings", page_icon="⚙️", layout="wide")
 
@@ -13,10 +15,11 @@ if 'settings' not in st.session_state:
         'dark_mode': False,
         'notifications': True,
         'default_view': 'dashboard',
-        'alert_threshold': 1.5,
-        'backup_enabled': False
+        'alert_threshold': 1.5
     }
 
+BACKUP_FREQUENCIES = ["hourly", "daily", "weekly"]
+
 tab1, tab2, tab3 = st.tabs(["General", "Notifications", "Advanced"])
 
 with tab1:
@@ -71,13 +74,106 @@ with tab2:
 with tab3:
     st.subheader("Advanced Settings")
     
-    st.session_state.settings['backup_enabled'] = st.toggle(
-        "Auto Backup",
-        value=st.session_state.settings['backup_enabled']
-    )
+    # The backup schedule lives in the backend (app/backups.py), not in these settings
+    st.subheader("Backups")
+    try:
+        r = api_get("/api/backups", timeout=5)
+        backup_state = r.json() if r.status_code == 200 else None
+    except:
+        backup_state = None
+    
+    if backup_state is None:
+        st.warning("Backup schedule unavailable: cannot reach the backend")
+    else:
+        schedule = backup_state['schedule']
+        col1, col2 = st.columns(2)
+        with col1:
+            backup_enabled = st.toggle("Auto Backup", value=schedule['enabled'],
+                                       help="Snapshots on the schedule below, with the transaction log shipped between them")
+        with col2:
+            backup_frequency = st.selectbox(
+                "Snapshot Frequency", BACKUP_FREQUENCIES,
+                index=BACKUP_FREQUENCIES.index(schedule['frequency']) if schedule['frequency'] in BACKUP_FREQUENCIES else 1,
+                format_func=str.capitalize, disabled=not backup_enabled
+            )
+        if (backup_enabled, backup_frequency) != (schedule['enabled'], schedule['frequency']):
+            r = api_post("/api/backups/schedule", json={"enabled": backup_enabled, "frequency": backup_frequency},
+                         timeout=5)
+            if r.status_code == 200:
+                st.success("Backup schedule saved")
+            else:
+                st.error("Could not save the backup schedule")
+        
+        snapshots = backup_state['snapshots']
+        if snapshots:
+            latest = snapshots[0]
+            st.caption(f"Latest snapshot {latest['created_at'][:19]} UTC, {latest['bytes'] / 1024 / 1024:.1f} MB, "
+                       f"{len(snapshots)} kept. Log shipped up to "
+                       f"{(backup_state['log']['last_at'] or latest['created_at'])[:19]} UTC.")
+        else:
+            st.caption("No snapshots yet")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("💾 Back Up Now", use_container_width=True):
+                r = api_post("/api/backups/snapshot", timeout=600)
+                if r.status_code == 201:
+                    st.success(f"Snapshot {r.json()['file']} taken")
+                    st.rerun()
+                else:
+                    st.error(r.json().get('detail', "Snapshot failed"))
+        with col2:
+            if st.button("🔍 Verify Backups", use_container_width=True):
+                r = api_post("/api/backups/verify", timeout=600)
+                if r.status_code == 200 and not r.json()['failed']:
+                    st.success(f"{r.json()['checked']} files match their checksums")
+                elif r.status_code == 200:
+                    st.error(f"Checksum mismatch: {', '.join(r.json()['failed'])}")
+                else:
+                    st.error("Verification failed")
+    
+    st.divider()
+    st.subheader("Replenishment Policy")
+    st.caption("Reorder points and order quantities computed by the backend from observed demand")
     
-    if st.session_state.settings['backup_enabled']:
-        st.selectbox("Backup Frequency", ["Hourly", "Daily", "Weekly"])
+    col1, col2 = st.columns(2)
+    with col1:
+        service_level = st.slider("Service Level", 0.80, 0.995, 0.95, step=0.005, format="%.3f")
+    with col2:
+        lead_time_days = st.number_input("Supplier Lead Time (days)", min_value=1.0, max_value=120.0, value=7.0)
+    
+    if st.button("📐 Recompute Reorder Points", use_container_width=True):
+        try:
+            r = api_post("/api/replenishment/run", params={
+                "full": True,
+                "service_level": service_level,
+                "lead_time_days": lead_time_days
+            }, timeout=60)
+            if r.status_code == 200:
+                st.success(f"{r.json()['proposals']} proposals generated")
+            else:
+                st.error("Recompute failed")
+        except:
+            st.error("Cannot connect to backend")
+    
+    try:
+        r = api_get("/api/replenishment/proposals", timeout=5)
+        proposals = r.json() if r.status_code == 200 else []
+    except:
+        proposals = []
+    
+    if proposals:
+        df_proposals = pd.DataFrame(proposals)
+        st.dataframe(
+            df_proposals[['sku', 'name', 'previous_reorder_point', 'reorder_point',
+                          'previous_reorder_quantity', 'reorder_quantity', 'explanation']],
+            use_container_width=True
+        )
+        if st.button("✅ Apply All Proposals", use_container_width=True):
+            r = api_post("/api/replenishment/proposals/apply", json={}, timeout=10)
+            if r.status_code == 200:
+                st.success(f"{r.json()['applied']} products updated")
+                st.rerun()
     
     st.divider()
     
@@ -87,8 +183,7 @@ with tab3:
             'dark_mode': False,
             'notifications': True,
             'default_view': 'dashboard',
-            'alert_threshold': 1.5,
-            'backup_enabled': False
+            'alert_threshold': 1.5
         }
         st.success("Settings reset to defaults!")
         st.rerun()
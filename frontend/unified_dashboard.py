@@ -1,13 +1,12 @@
 ﻿import streamlit as st
 import pandas as pd
 import plotly.express as px
-import requests
 from datetime import datetime
 import time
 import webbrowser
 import subprocess
 import sys
-import os
+from wms_api import api_get
 
 # Page config
 st.set_page_config(
@@ -78,21 +77,17 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# API endpoint
-API_URL = "http://localhost:8000"
-
 # Check backend status
 @st.cache_data(ttl=5)
 def check_backend():
     try:
-        response = requests.get(f"{API_URL}/health", timeout=2)
+        response = api_get("/api/status", timeout=2)
         if response.status_code == 200:
-            inv = requests.get(f"{API_URL}/api/inventory/levels", timeout=2)
-            scans = requests.get(f"{API_URL}/api/scans/recent?limit=1", timeout=2)
+            status = response.json()
             return {
                 'status': 'online',
-                'inventory_count': len(inv.json()) if inv.status_code == 200 else 0,
-                'scan_count': len(scans.json()) if scans.status_code == 200 else 0,
+                'inventory_count': status['products'],
+                'scan_count': 1 if status['last_scan_at'] else 0,
                 'last_check': datetime.now()
             }
     except:
@@ -242,7 +237,7 @@ st.markdown("## 📊 Live Dashboard Preview")
 
 # Fetch and display basic inventory data
 try:
-    inv_response = requests.get(f"{API_URL}/api/inventory/levels", timeout=3)
+    inv_response = api_get("/api/inventory/levels", timeout=3)
     if inv_response.status_code == 200:
         data = inv_response.json()
         df = pd.DataFrame(data)
@@ -0,0 +1,12 @@
+﻿import sys
+from pathlib import Path
+
+# The data client lives in the core package (backend/app/client.py). The backend tree
+# goes first on the path so frontend/app.py can never shadow the "app" package
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+if BACKEND_DIR.is_dir() and str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.client import (API_URL, ARROW_STREAM, api_get, api_post, fetch_frame,  # noqa: E402
+                        fetch_inventory_levels, fetch_item, fetch_items, fetch_product,
+                        fetch_products, fetch_recent_scans, fetch_stats, get_validated, session)
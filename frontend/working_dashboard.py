@@ -3,9 +3,9 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import requests
 from datetime import datetime, timedelta
 import time
+from wms_api import api_get, api_post, fetch_inventory_levels
 
 # Page config
 st.set_page_config(
@@ -37,9 +37,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# API endpoint
-API_URL = "http://localhost:8000"
-
 # Initialize session state
 if 'last_update' not in st.session_state:
     st.session_state.last_update = datetime.now()
@@ -66,22 +63,19 @@ with st.sidebar:
 # Fetch data functions
 @st.cache_data(ttl=10)
 def fetch_inventory():
-    try:
-        r = requests.get(f"{API_URL}/api/inventory/levels", timeout=5)
-        return r.json() if r.status_code == 200 else None
-    except: return None
+    return fetch_inventory_levels()
 
 @st.cache_data(ttl=10)
 def fetch_alerts():
     try:
-        r = requests.get(f"{API_URL}/api/inventory/alerts", timeout=5)
+        r = api_get("/api/inventory/alerts", timeout=5)
         return r.json() if r.status_code == 200 else None
     except: return None
 
 @st.cache_data(ttl=10)
 def fetch_scans():
     try:
-        r = requests.get(f"{API_URL}/api/scans/recent?limit=50", timeout=5)
+        r = api_get("/api/scans/recent?limit=50", timeout=5)
         return r.json() if r.status_code == 200 else None
     except: return None
 
@@ -96,7 +90,7 @@ if inventory_data is None:
     st.stop()
 
 # Convert to DataFrame
-df_inventory = pd.DataFrame(inventory_data) if inventory_data else pd.DataFrame()
+df_inventory = inventory_data
 
 if not df_inventory.empty:
     # Metrics
@@ -202,7 +196,7 @@ if not df_inventory.empty:
         with col1:
             if st.button("➕ Add Scan 1 (RFID001)"):
                 try:
-                    r = requests.post(f"{API_URL}/api/scans/",
+                    r = api_post("/api/scans/",
                                      json={"rfid_tag": "RFID001", "location": "Loading Dock", "scanner_id": "test"})
                     if r.status_code == 200:
                         st.success("Scan added!")
@@ -214,7 +208,7 @@ if not df_inventory.empty:
         with col2:
             if st.button("➕ Add Scan 2 (RFID002)"):
                 try:
-                    r = requests.post(f"{API_URL}/api/scans/",
+                    r = api_post("/api/scans/",
                                      json={"rfid_tag": "RFID002", "location": "Shipping Bay", "scanner_id": "test"})
                     if r.status_code == 200:
                         st.success("Scan added!")
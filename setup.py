@@ -1,15 +1,32 @@
 ﻿from setuptools import setup, find_packages
 
+# One core package: backend/app (models, migrations, query services, data client).
+# The FastAPI routers and the Streamlit dashboards in frontend/ are thin layers over it.
 setup(
     name="smart-wms",
-    version="1.0.0",
-    packages=find_packages(exclude=["frontend", "tests"]),
+    version="1.1.0",
+    package_dir={"": "backend"},
+    packages=find_packages("backend", include=["app", "app.*"]),
     install_requires=[
-        # Backend only - Frontend has separate requirements
         "fastapi>=0.104.0",
-        "uvicorn>=0.24.0",
+        "uvicorn[standard]>=0.24.0",
         "sqlalchemy>=2.0.0",
         "pydantic>=2.5.0",
+        "python-multipart",
         "python-dotenv>=1.0.0",
+        "duckdb",
+        "pyarrow",
+        "msgpack",
+        "orjson",
+        "numpy",
     ],
+    extras_require={
+        # app.client, used by the Streamlit dashboards
+        "dashboard": ["pandas>=2.0.0", "requests>=2.28.0"],
+        "server": ["gunicorn"],
+        "bench": ["httpx"],
+    },
+    entry_points={
+        "console_scripts": ["wms-migrate=app.migrate:main"],
+    },
 )
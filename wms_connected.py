@@ -270,7 +270,18 @@ def fetch_stats():
 def fetch_item(item_id):
     """Fetch single inventory item"""
     try:
-        response = requests.get(f"{API_URL}/api/inventory/{item_id}", timeout=5)
+        response = requests.get(f"{API_URL}/api/items/{item_id}", timeout=5)
+        if response.status_code == 200:
+            return response.json()
+        return None
+    except:
+        return None
+
+@st.cache_data(ttl=300)
+def fetch_forecast(horizon=30):
+    """Fetch demand forecast from backend"""
+    try:
+        response = requests.get(f"{API_URL}/api/forecast", params={"horizon": horizon}, timeout=30)
         if response.status_code == 200:
             return response.json()
         return None
@@ -475,7 +486,7 @@ with tab1:
         
         with col_b:
             if backend_connected and stats_data:
-                total_items = stats_data.get('total_items', 1000)
+                total_items = stats_data.get('in_stock_items', 1000)
                 low_stock = stats_data.get('low_stock_items', 5)
                 fill_rate = ((total_items - low_stock) / total_items * 100) if total_items > 0 else 85
             else:
@@ -652,22 +663,21 @@ with tab4:
 with tab5:
     st.markdown("### 📈 AI-Powered Predictions")
     
+    forecast_data = fetch_forecast(30)
     col1, col2 = st.columns(2)
     
     with col1:
-        future_dates = pd.date_range(start=datetime.now(), periods=30, freq='D')
-        
-        if backend_connected and stats_data:
-            base_demand = stats_data.get('total_items', 1000) / 10
+        if forecast_data:
+            daily = pd.DataFrame(forecast_data['daily'])
+            demand_forecast = pd.DataFrame({
+                'Date': pd.to_datetime(daily['date']),
+                'Predicted Demand': daily['forecast'],
+                'Upper Bound': daily['upper'],
+                'Lower Bound': daily['lower']
+            })
         else:
-            base_demand = 100
-        
-        demand_forecast = pd.DataFrame({
-            'Date': future_dates,
-            'Predicted Demand': [base_demand + random.uniform(-10, 20) + i*0.3 for i in range(30)],
-            'Upper Bound': [base_demand + 20 + random.uniform(0, 10) + i*0.3 for i in range(30)],
-            'Lower Bound': [base_demand - 20 + random.uniform(-10, 0) + i*0.3 for i in range(30)]
-        })
+            st.info("Forecast unavailable - backend not reachable")
+            demand_forecast = pd.DataFrame(columns=['Date', 'Predicted Demand', 'Upper Bound', 'Lower Bound'])
         
         fig_forecast = go.Figure()
         fig_forecast.add_trace(go.Scatter(x=demand_forecast['Date'], y=demand_forecast['Predicted Demand'],
@@ -682,18 +692,14 @@ with tab5:
         st.plotly_chart(fig_forecast, use_container_width=True)
     
     with col2:
-        categories = ['Electronics', 'Clothing', 'Food', 'Furniture', 'Tools']
-        
-        if backend_connected and inventory_data:
-            df = pd.DataFrame(inventory_data)
-            if not df.empty and 'category' in df.columns and 'quantity' in df.columns:
-                current_inv = [df[df['category'] == cat]['quantity'].sum() for cat in categories]
-            else:
-                current_inv = [random.uniform(60, 100) for _ in categories]
+        # Projected stock after 30 days for the fastest-moving products
+        if forecast_data and forecast_data['products']:
+            df_fc = pd.DataFrame(forecast_data['products']).nlargest(5, 'horizon_total')
+            categories = df_fc['name'].tolist()
+            current_inv = df_fc['current_quantity'].tolist()
+            predicted_inv = (df_fc['current_quantity'] - df_fc['horizon_total']).clip(lower=0).tolist()
         else:
-            current_inv = [random.uniform(60, 100) for _ in categories]
-        
-        predicted_inv = [x * random.uniform(0.9, 1.1) for x in current_inv]
+            categories, current_inv, predicted_inv = [], [], []
         
         fig_inv_pred = go.Figure(data=[
             go.Bar(name='Current', x=categories, y=current_inv),